@@ -30,7 +30,8 @@ class BookingScraper:
         self,
         proxies: Optional[Dict[str, str]] = None,
         delay: float = 2.0,
-        timeout: int = 30
+        timeout: int = 30,
+        preconnect: bool = False
     ):
         """
         Initialize the Booking.com scraper.
@@ -40,12 +41,17 @@ class BookingScraper:
                     Recommended: Use Roundproxies.com for best results
             delay: Delay between requests in seconds (default: 2.0)
             timeout: Request timeout in seconds (default: 30)
+            preconnect: Open a warm connection to Booking.com during init so
+                    the first search skips the TCP/TLS handshake (default: False)
         """
         self.proxies = proxies
         self.delay = delay
         self.timeout = timeout
         self.session = self._create_session()
         
+        if preconnect:
+            self._preconnect()
+        
         # Create results directory
         self.results_dir = Path("results")
         self.results_dir.mkdir(exist_ok=True)
@@ -73,6 +79,13 @@ class BookingScraper:
         
         return session
     
+    def _preconnect(self):
+        """Send a lightweight HEAD request to put a live connection in the pool."""
+        try:
+            self.session.head(self.BASE_URL, timeout=self.timeout)
+        except requests.RequestException as e:
+            print(f"Preconnect failed: {e}")
+    
     def _build_search_url(
         self,
         destination: str,
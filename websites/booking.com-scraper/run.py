@@ -43,7 +43,8 @@ def main():
     scraper = BookingScraper(
         proxies=proxy_config,
         delay=2.0,  # Delay between requests
-        timeout=30   # Request timeout
+        timeout=30,  # Request timeout
+        preconnect=True  # Warm the connection while setting up the search
     )
     
     # Search parameters
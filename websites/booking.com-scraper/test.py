@@ -11,15 +11,41 @@ from unittest.mock import Mock, patch, MagicMock
 from booking import BookingScraper
 
 
+# Mock HTML for a hotel card
+MOCK_HOTEL_CARD_HTML = """
+<div data-testid="property-card">
+    <a data-testid="title-link" href="/hotel/test.html">
+        <div data-testid="title">Test Hotel</div>
+    </a>
+    <div data-testid="address">123 Test St, Paris</div>
+    <div data-testid="distance">2 km from center</div>
+    <div data-testid="price-and-discounted-price">$150</div>
+    <div data-testid="review-score">
+        <div>8.5</div>
+        <div>1,250 reviews</div>
+    </div>
+    <div data-testid="facility">WiFi</div>
+    <div data-testid="facility">Pool</div>
+</div>
+"""
+
+
 class TestBookingScraper(unittest.TestCase):
     """Test cases for BookingScraper class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.scraper = BookingScraper(delay=0.1)  # Reduced delay for testing
-        self.test_destination = "Paris"
-        self.test_checkin = (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d')
-        self.test_checkout = (datetime.now() + timedelta(days=35)).strftime('%Y-%m-%d')
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test fixtures once for the whole class."""
+        from bs4 import BeautifulSoup
+        
+        cls.scraper = BookingScraper(delay=0.1)  # Reduced delay for testing
+        cls.test_destination = "Paris"
+        cls.test_checkin = (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d')
+        cls.test_checkout = (datetime.now() + timedelta(days=35)).strftime('%Y-%m-%d')
+        
+        # Parse the mock hotel card once; tests only read from it
+        soup = BeautifulSoup(MOCK_HOTEL_CARD_HTML, 'html.parser')
+        cls.valid_card = soup.find('div', {'data-testid': 'property-card'})
     
     def test_initialization(self):
         """Test scraper initialization."""
@@ -39,6 +65,17 @@ class TestBookingScraper(unittest.TestCase):
         self.assertEqual(scraper.proxies, proxy_config)
         self.assertEqual(scraper.session.proxies, proxy_config)
     
+    @patch('booking.requests.Session.head')
+    def test_preconnect(self, mock_head):
+        """Test that preconnect warms the session and tolerates failures."""
+        BookingScraper(preconnect=True)
+        mock_head.assert_called_once_with(BookingScraper.BASE_URL, timeout=30)
+        
+        import requests
+        mock_head.side_effect = requests.ConnectionError("unreachable")
+        scraper = BookingScraper(preconnect=True)
+        self.assertIsNotNone(scraper.session)
+    
     def test_build_search_url(self):
         """Test URL building with parameters."""
         url = self.scraper._build_search_url(
@@ -79,30 +116,7 @@ class TestBookingScraper(unittest.TestCase):
     
     def test_parse_hotel_card_valid(self):
         """Test parsing a valid hotel card."""
-        from bs4 import BeautifulSoup
-        
-        # Mock HTML for a hotel card
-        mock_html = """
-        <div data-testid="property-card">
-            <a data-testid="title-link" href="/hotel/test.html">
-                <div data-testid="title">Test Hotel</div>
-            </a>
-            <div data-testid="address">123 Test St, Paris</div>
-            <div data-testid="distance">2 km from center</div>
-            <div data-testid="price-and-discounted-price">$150</div>
-            <div data-testid="review-score">
-                <div>8.5</div>
-                <div>1,250 reviews</div>
-            </div>
-            <div data-testid="facility">WiFi</div>
-            <div data-testid="facility">Pool</div>
-        </div>
-        """
-        
-        soup = BeautifulSoup(mock_html, 'html.parser')
-        card = soup.find('div', {'data-testid': 'property-card'})
-        
-        result = self.scraper._parse_hotel_card(card)
+        result = self.scraper._parse_hotel_card(self.valid_card)
         
         self.assertIsNotNone(result)
         self.assertEqual(result['name'], 'Test Hotel')
@@ -170,15 +184,19 @@ class TestBookingScraper(unittest.TestCase):
     
     def test_results_directory_creation(self):
         """Test that results directory is created."""
-        import shutil
-        
-        # Clean up first
-        if self.scraper.results_dir.exists():
-            shutil.rmtree(self.scraper.results_dir)
+        import os
+        import tempfile
         
-        # Create new scraper (should create directory)
-        new_scraper = BookingScraper()
-        self.assertTrue(new_scraper.results_dir.exists())
+        # Work in an empty directory so parallel tests keep their results/
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                # Create new scraper (should create directory)
+                new_scraper = BookingScraper()
+                self.assertTrue(new_scraper.results_dir.exists())
+            finally:
+                os.chdir(cwd)
     
     def test_save_results(self):
         """Test saving results to file."""
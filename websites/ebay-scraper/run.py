@@ -4,9 +4,47 @@ Run the scraper from command line with various options.
 """
 
 import argparse
+import functools
+import os
 import sys
 import json
-from ebay import EbayScraper
+from collections import Counter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ebay import EbayScraper, SUPPORTED_CONDITIONS
+
+
+@functools.lru_cache(maxsize=8)
+def _load_proxy_file(path: str, mtime: float) -> tuple:
+    """
+    Parse a proxy file once per (path, mtime).
+    
+    Returns the settings as a tuple of (scheme, url) pairs so the cached
+    value can't be mutated by callers.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    proxies = orjson.loads(data) if orjson else json.loads(data)
+    return tuple(proxies.items())
+
+
+def load_proxy_file(path: str) -> dict:
+    """
+    Load proxy settings from a JSON file.
+    
+    Repeated calls reuse the parsed result until the file changes on disk.
+    
+    Args:
+        path: Path to JSON file with proxy configuration
+        
+    Returns:
+        Proxy dictionary in the format expected by requests
+    """
+    return dict(_load_proxy_file(path, os.path.getmtime(path)))
 
 
 def main():
@@ -51,7 +89,7 @@ Get proxies at: https://roundproxies.com
     parser.add_argument(
         '-c', '--condition',
         type=str,
-        choices=['new', 'used', 'refurbished'],
+        choices=SUPPORTED_CONDITIONS,
         help='Filter by condition'
     )
     
@@ -81,6 +119,33 @@ Get proxies at: https://roundproxies.com
         help='Request timeout in seconds (default: 30)'
     )
     
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=4,
+        help='Maximum pages fetched at the same time (default: 4)'
+    )
+    
+    parser.add_argument(
+        '--parse-workers',
+        type=int,
+        default=0,
+        help='Worker processes for parsing pages in parallel (default: 0, parse inline)'
+    )
+    
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        help='Cache responses on disk in this directory (reused for one hour)'
+    )
+    
+    parser.add_argument(
+        '-o', '--results-dir',
+        type=str,
+        default='results',
+        help='Directory where results are saved (default: results)'
+    )
+    
     parser.add_argument(
         '--proxy-file',
         type=str,
@@ -117,8 +182,7 @@ Get proxies at: https://roundproxies.com
     proxies = None
     if args.proxy_file:
         try:
-            with open(args.proxy_file, 'r') as f:
-                proxies = json.load(f)
+            proxies = load_proxy_file(args.proxy_file)
             if args.verbose:
                 print(f"Loaded proxy configuration from {args.proxy_file}")
         except Exception as e:
@@ -147,6 +211,11 @@ Get proxies at: https://roundproxies.com
         print(f"Max Price: ${args.max_price}")
     print(f"Delay: {args.delay}s")
     print(f"Timeout: {args.timeout}s")
+    print(f"Concurrency: {args.concurrency}")
+    if args.parse_workers:
+        print(f"Parse workers: {args.parse_workers}")
+    if args.cache_dir:
+        print(f"Cache: {args.cache_dir}")
     if proxies:
         print("Proxy: Enabled ✓")
     else:
@@ -159,7 +228,11 @@ Get proxies at: https://roundproxies.com
         scraper = EbayScraper(
             proxies=proxies,
             delay=args.delay,
-            timeout=args.timeout
+            timeout=args.timeout,
+            parse_workers=args.parse_workers,
+            cache_dir=args.cache_dir,
+            max_concurrency=args.concurrency,
+            results_dir=args.results_dir
         )
         
         # Run scraper
@@ -171,6 +244,7 @@ Get proxies at: https://roundproxies.com
             min_price=args.min_price,
             max_price=args.max_price
         )
+        scraper.close()
         
         # Print summary
         print()
@@ -180,25 +254,34 @@ Get proxies at: https://roundproxies.com
         print(f"Total products scraped: {len(results)}")
         
         if results:
-            # Calculate statistics
-            prices = [p['price_numeric'] for p in results if p.get('price_numeric')]
-            if prices:
-                print(f"Price range: ${min(prices):.2f} - ${max(prices):.2f}")
-                print(f"Average price: ${sum(prices)/len(prices):.2f}")
-            
-            # Condition breakdown
-            conditions = {}
+            # Price statistics and condition breakdown in a single pass
+            count = 0
+            total = 0.0
+            low = float('inf')
+            high = float('-inf')
+            conditions = Counter()
             for p in results:
-                cond = p.get('condition', 'Unknown')
-                conditions[cond] = conditions.get(cond, 0) + 1
+                price = p.get('price_numeric')
+                if price:
+                    count += 1
+                    total += price
+                    if price < low:
+                        low = price
+                    if price > high:
+                        high = price
+                conditions[p.get('condition', 'Unknown')] += 1
+            
+            if count:
+                print(f"Price range: ${low:.2f} - ${high:.2f}")
+                print(f"Average price: ${total/count:.2f}")
             
             if conditions:
                 print("\nCondition breakdown:")
-                for cond, count in sorted(conditions.items(), key=lambda x: x[1], reverse=True):
+                for cond, count in conditions.most_common():
                     print(f"  {cond}: {count}")
         
         print("=" * 60)
-        print("\nResults saved to results/ directory")
+        print(f"\nResults saved to {args.results_dir}/ directory")
         print("\nNeed better scraping performance?")
         print("Get residential proxies at: https://roundproxies.com")
         
@@ -5,15 +5,206 @@ It can scrape:
 - Individual product details
 - Product search results
 - Historical archive data
+
+A single ProductHuntScraper keeps one browser open for all of these, so
+running several scrapes in a row doesn't pay for a chromium launch each time.
 """
 
 import asyncio
-from typing import Dict, List, Optional
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from itertools import islice
+from typing import AsyncIterator, Dict, Iterator, List, Optional
 from datetime import datetime
-from playwright.async_api import async_playwright, Page
+from playwright.async_api import (
+    async_playwright, Page, Route, TimeoutError as PlaywrightTimeoutError
+)
 from bs4 import BeautifulSoup
+import soupsieve
 import json
 
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+
+
+USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+
+# Realistic desktop viewport
+VIEWPORT = {"width": 1920, "height": 1080}
+
+# Hides playwright automation signals; injected before any page script runs
+_INIT_JS = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => false
+    });
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5]
+    });
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['en-US', 'en']
+    });
+"""
+
+# Requests that don't affect the scraped fields and are aborted to save bandwidth
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+BLOCKED_HOSTS = ('google-analytics', 'googletagmanager', 'segment.io', 'doubleclick')
+
+# CSS selectors shared by the scrape methods
+SEL_POST_ITEM = 'div[data-test^="post-item"]'
+SEL_POST_LINK = 'a[href^="/posts/"]'
+SEL_TAGLINE = '[color="subdued"]'
+SEL_UPVOTE = 'button[aria-label*="upvote"]'
+SEL_HOMEPAGE_SECTION = '[data-test="homepage-section-0"]'
+SEL_POST_NAME = '[data-test="post-name"]'
+SEL_POST_TAGLINE = '[data-test="post-tagline"]'
+SEL_POST_DESCRIPTION = '[data-test="post-description"]'
+SEL_POST_COMMENT_COUNT = '[data-test="post-comment-count"]'
+SEL_POST_MAKER = '[data-test="post-maker"]'
+SEL_POST_PRODUCT_LINK = 'a[data-test="post-product-link"]'
+SEL_POST_TOPIC = '[data-test="post-topic"]'
+
+# Parse with selectolax when it's installed; set to False to force BeautifulSoup
+USE_SELECTOLAX = HTMLParser is not None
+
+
+def _parse_html(content: str):
+    """
+    Parse page HTML with selectolax, or BeautifulSoup as a fallback.
+    """
+    if USE_SELECTOLAX:
+        return HTMLParser(content)
+    return BeautifulSoup(content, 'lxml')
+
+
+@lru_cache(maxsize=None)
+def _compile_selector(selector: str):
+    """
+    Compile a CSS selector for BeautifulSoup once and reuse it.
+    """
+    return soupsieve.compile(selector)
+
+
+def _select(node, selector: str) -> list:
+    """
+    Return all elements under `node` matching a CSS selector.
+    """
+    if USE_SELECTOLAX:
+        return node.css(selector)
+    return _compile_selector(selector).select(node)
+
+
+def _select_one(node, selector: str):
+    """
+    Return the first element under `node` matching a CSS selector, or None.
+    """
+    if USE_SELECTOLAX:
+        return node.css_first(selector)
+    return _compile_selector(selector).select_one(node)
+
+
+def _text(node) -> str:
+    """
+    Return the stripped text content of an element.
+    """
+    if USE_SELECTOLAX:
+        return node.text().strip()
+    return node.text.strip()
+
+
+def _attr(node, name: str) -> str:
+    """
+    Return an attribute value of an element, or '' when missing.
+    """
+    if USE_SELECTOLAX:
+        return node.attributes.get(name) or ''
+    return node.get(name, '')
+
+
+def _iter_product_cards(cards: list, extra: Optional[Dict] = None) -> Iterator[Dict]:
+    """
+    Lazily extract name, tagline, upvotes and URL from product list cards.
+    
+    Shared by the homepage, search and archive scrapers, which render
+    the same card markup. Each card is only parsed when the next product
+    is requested, so a consumer that stops early skips the rest.
+    
+    Args:
+        cards: Card elements matched by SEL_POST_ITEM
+        extra: Fields added to every product (e.g. the search query or date)
+    
+    Yields:
+        Product dictionaries
+    """
+    for card in cards:
+        try:
+            # Extract product name and URL
+            name_elem = _select_one(card, SEL_POST_LINK)
+            if not name_elem:
+                continue
+            
+            product_url = _attr(name_elem, 'href')
+            
+            # Extract tagline
+            tagline_elem = _select_one(card, SEL_TAGLINE)
+            
+            # Extract upvotes
+            upvote_elem = _select_one(card, SEL_UPVOTE)
+            
+            product = {
+                'name': _text(name_elem),
+                'tagline': _text(tagline_elem) if tagline_elem else '',
+                'upvotes': _text(upvote_elem) if upvote_elem else '0',
+                'url': (f"https://www.producthunt.com{product_url}"
+                        if product_url.startswith('/') else product_url)
+            }
+            if extra:
+                product.update(extra)
+        
+        except Exception as e:
+            print(f"Error parsing product card: {str(e)}")
+            continue
+        
+        yield product
+
+
+def _parse_product_cards(
+    cards: list,
+    extra: Optional[Dict] = None,
+    limit: Optional[int] = None
+) -> List[Dict]:
+    """
+    Extract products from product list cards, stopping once `limit` are found.
+    
+    Args:
+        cards: Card elements matched by SEL_POST_ITEM
+        extra: Fields added to every product (e.g. the search query or date)
+        limit: Maximum number of products to return (None for all)
+    
+    Returns:
+        List of product dictionaries
+    """
+    return list(islice(_iter_product_cards(cards, extra), limit or None))
+
+
+async def _block_heavy_requests(route: Route) -> None:
+    """
+    Abort images, media, fonts, stylesheets and analytics beacons.
+    
+    Args:
+        route: Playwright route for the intercepted request
+    """
+    request = route.request
+    blocked_host = any(host in request.url for host in BLOCKED_HOSTS)
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or blocked_host:
+        await route.abort()
+    else:
+        await route.continue_()
+
 
 async def setup_page(page: Page) -> None:
     """
@@ -23,161 +214,213 @@ async def setup_page(page: Page) -> None:
         page: Playwright page instance
     """
     # Set a realistic viewport
-    await page.set_viewport_size({"width": 1920, "height": 1080})
+    await page.set_viewport_size(VIEWPORT)
     
     # Hide playwright automation signals
-    await page.add_init_script("""
-        Object.defineProperty(navigator, 'webdriver', {
-            get: () => false
-        });
-        Object.defineProperty(navigator, 'plugins', {
-            get: () => [1, 2, 3, 4, 5]
-        });
-        Object.defineProperty(navigator, 'languages', {
-            get: () => ['en-US', 'en']
-        });
-    """)
+    await page.add_init_script(_INIT_JS)
+    
+    # Skip downloading assets the scraper never looks at
+    await page.route("**/*", _block_heavy_requests)
 
 
-async def scrape_daily_products(max_products: Optional[int] = None) -> List[Dict]:
+async def _wait_for_cards(page: Page) -> None:
     """
-    Scrape products from the Product Hunt homepage (today's launches).
+    Wait until product cards are rendered.
     
-    Args:
-        max_products: Maximum number of products to scrape (None for all)
+    A page with no results never renders a card, so a timeout is not an
+    error here; the caller just parses whatever is on the page.
     
-    Returns:
-        List of product dictionaries containing basic information
+    Args:
+        page: Playwright page instance
     """
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=True,
-            args=['--disable-blink-features=AutomationControlled']
-        )
-        
-        context = await browser.new_context(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        )
-        
-        page = await context.new_page()
-        await setup_page(page)
-        
-        print("Navigating to Product Hunt homepage...")
-        await page.goto('https://www.producthunt.com/', wait_until='networkidle', timeout=30000)
-        
-        # Wait for products to load
-        await page.wait_for_selector('[data-test="homepage-section-0"]', timeout=15000)
-        
-        # Small delay to ensure content is rendered
-        await asyncio.sleep(2)
-        
-        content = await page.content()
-        soup = BeautifulSoup(content, 'lxml')
-        
-        products = []
-        product_cards = soup.select('div[data-test^="post-item"]')
-        
-        if max_products:
-            product_cards = product_cards[:max_products]
-        
-        print(f"Found {len(product_cards)} products")
-        
-        for card in product_cards:
-            try:
-                # Extract product name and URL
-                name_elem = card.select_one('a[href^="/posts/"]')
-                if not name_elem:
-                    continue
-                    
-                name = name_elem.text.strip()
-                product_url = name_elem.get('href', '')
-                full_url = f"https://www.producthunt.com{product_url}" if product_url.startswith('/') else product_url
-                
-                # Extract tagline
-                tagline_elem = card.select_one('[color="subdued"]')
-                tagline = tagline_elem.text.strip() if tagline_elem else ''
-                
-                # Extract upvotes
-                upvote_elem = card.select_one('button[aria-label*="upvote"]')
-                upvotes = upvote_elem.text.strip() if upvote_elem else '0'
-                
-                products.append({
-                    'name': name,
-                    'tagline': tagline,
-                    'upvotes': upvotes,
-                    'url': full_url
-                })
-                
-            except Exception as e:
-                print(f"Error parsing product card: {str(e)}")
-                continue
-        
-        await browser.close()
-        
-        return products
+    try:
+        await page.wait_for_selector(SEL_POST_ITEM, timeout=15000)
+    except PlaywrightTimeoutError:
+        print("No product cards found on page")
 
 
-async def scrape_product(product_url: str) -> Dict:
+class ProductHuntScraper:
     """
-    Scrape detailed information from a single product page.
+    Product Hunt scraper that launches chromium once and reuses its pages.
     
-    Args:
-        product_url: Full URL to the product page
+    Use it as an async context manager:
+        
+        async with ProductHuntScraper() as scraper:
+            products = await scraper.scrape_daily_products(max_products=5)
+            details = await scraper.scrape_product(products[0]['url'])
     
-    Returns:
-        Dictionary containing detailed product information
+    Args:
+        concurrency: Number of pages kept open in the pool
+        headless: Run the browser without a visible window
     """
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=True,
+    
+    def __init__(self, concurrency: int = 1, headless: bool = True):
+        self.concurrency = max(1, concurrency)
+        self.headless = headless
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._pages: Optional[asyncio.Queue] = None
+        self._page_count = 0
+    
+    async def __aenter__(self) -> 'ProductHuntScraper':
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+    
+    async def start(self) -> None:
+        """
+        Launch the browser and fill the page pool.
+        """
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(
+            headless=self.headless,
             args=['--disable-blink-features=AutomationControlled']
         )
+        self._context = await self._browser.new_context(user_agent=USER_AGENT, viewport=VIEWPORT)
         
-        context = await browser.new_context(
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        )
+        # Registered once on the context, Playwright replays these on every
+        # page it opens, so pooled pages need no per-page setup
+        await self._context.add_init_script(_INIT_JS)
+        await self._context.route("**/*", _block_heavy_requests)
         
-        page = await context.new_page()
-        await setup_page(page)
+        self._pages = asyncio.Queue()
+        self._page_count = 0
+        await self._grow_pool(self.concurrency)
+    
+    async def _grow_pool(self, size: int) -> None:
+        """
+        Open new pages until the pool holds at least `size` of them.
+        
+        Args:
+            size: Minimum number of pages in the pool
+        """
+        while self._page_count < size:
+            page = await self._context.new_page()
+            self._page_count += 1
+            self._pages.put_nowait(page)
+    
+    async def close(self) -> None:
+        """
+        Close the browser and stop Playwright.
+        """
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+        self._context = None
+        self._pages = None
+        self._page_count = 0
+    
+    @asynccontextmanager
+    async def _page(self) -> AsyncIterator[Page]:
+        """
+        Borrow a page from the pool and hand it back when done.
+        """
+        page = await self._pages.get()
+        try:
+            yield page
+        finally:
+            self._pages.put_nowait(page)
+    
+    async def iter_daily_products(self) -> AsyncIterator[Dict]:
+        """
+        Yield products from the Product Hunt homepage (today's launches) one at a time.
+        
+        Cards are parsed as products are consumed, so breaking out of the
+        loop early skips parsing the rest of the page.
+        
+        Yields:
+            Product dictionaries containing basic information
+        """
+        async with self._page() as page:
+            print("Navigating to Product Hunt homepage...")
+            await page.goto(
+                'https://www.producthunt.com/', wait_until='domcontentloaded', timeout=30000
+            )
+            
+            # Wait for products to load
+            await page.wait_for_selector(SEL_HOMEPAGE_SECTION, timeout=15000)
+            
+            content = await page.content()
+        
+        tree = _parse_html(content)
+        
+        for product in _iter_product_cards(_select(tree, SEL_POST_ITEM)):
+            yield product
+    
+    async def scrape_daily_products(self, max_products: Optional[int] = None) -> List[Dict]:
+        """
+        Scrape products from the Product Hunt homepage (today's launches).
         
-        print(f"Scraping product: {product_url}")
-        await page.goto(product_url, wait_until='networkidle', timeout=30000)
+        Args:
+            max_products: Maximum number of products to scrape (None for all)
         
-        # Wait for product content to load
-        await page.wait_for_selector('[data-test="post-name"]', timeout=15000)
+        Returns:
+            List of product dictionaries containing basic information
+        """
+        products = []
         
-        # Human-like delay
-        await asyncio.sleep(2)
+        async for product in self.iter_daily_products():
+            products.append(product)
+            if max_products and len(products) >= max_products:
+                break
         
-        content = await page.content()
-        soup = BeautifulSoup(content, 'lxml')
+        print(f"Found {len(products)} products")
+        
+        return products
+    
+    async def scrape_product(self, product_url: str) -> Dict:
+        """
+        Scrape detailed information from a single product page.
+        
+        Args:
+            product_url: Full URL to the product page
+        
+        Returns:
+            Dictionary containing detailed product information
+        """
+        async with self._page() as page:
+            print(f"Scraping product: {product_url}")
+            await page.goto(product_url, wait_until='domcontentloaded', timeout=30000)
+            
+            # Wait for product content to load
+            await page.wait_for_selector(SEL_POST_NAME, timeout=15000)
+            
+            content = await page.content()
+        
+        tree = _parse_html(content)
         
         # Extract product name
-        name_elem = soup.select_one('[data-test="post-name"]')
-        name = name_elem.text.strip() if name_elem else 'N/A'
+        name_elem = _select_one(tree, SEL_POST_NAME)
+        name = _text(name_elem) if name_elem else 'N/A'
         
         # Extract tagline
-        tagline_elem = soup.select_one('[data-test="post-tagline"]')
-        tagline = tagline_elem.text.strip() if tagline_elem else ''
+        tagline_elem = _select_one(tree, SEL_POST_TAGLINE)
+        tagline = _text(tagline_elem) if tagline_elem else ''
         
         # Extract description
-        desc_elem = soup.select_one('[data-test="post-description"]')
-        description = desc_elem.text.strip() if desc_elem else ''
+        desc_elem = _select_one(tree, SEL_POST_DESCRIPTION)
+        description = _text(desc_elem) if desc_elem else ''
         
         # Extract upvotes
-        upvote_elem = soup.select_one('button[aria-label*="upvote"]')
-        upvotes = upvote_elem.text.strip() if upvote_elem else '0'
+        upvote_elem = _select_one(tree, SEL_UPVOTE)
+        upvotes = _text(upvote_elem) if upvote_elem else '0'
         
         # Extract comment count
-        comment_elem = soup.select_one('[data-test="post-comment-count"]')
-        comments = comment_elem.text.strip() if comment_elem else '0'
+        comment_elem = _select_one(tree, SEL_POST_COMMENT_COUNT)
+        comments = _text(comment_elem) if comment_elem else '0'
         
         # Extract maker information
         makers = []
-        maker_elements = soup.select('[data-test="post-maker"]')
+        maker_elements = _select(tree, SEL_POST_MAKER)
         for maker in maker_elements:
-            maker_name = maker.text.strip()
-            maker_link = maker.get('href', '')
+            maker_name = _text(maker)
+            maker_link = _attr(maker, 'href')
             if maker_link and maker_link.startswith('/'):
                 maker_link = f"https://www.producthunt.com{maker_link}"
             makers.append({
@@ -186,16 +429,14 @@ async def scrape_product(product_url: str) -> Dict:
             })
         
         # Extract website link
-        website_elem = soup.select_one('a[data-test="post-product-link"]')
-        website = website_elem.get('href', '') if website_elem else ''
+        website_elem = _select_one(tree, SEL_POST_PRODUCT_LINK)
+        website = _attr(website_elem, 'href') if website_elem else ''
         
         # Extract topics/categories
         topics = []
-        topic_elems = soup.select('[data-test="post-topic"]')
+        topic_elems = _select(tree, SEL_POST_TOPIC)
         for topic in topic_elems:
-            topics.append(topic.text.strip())
-        
-        await browser.close()
+            topics.append(_text(topic))
         
         product_data = {
             'name': name,
@@ -210,151 +451,238 @@ async def scrape_product(product_url: str) -> Dict:
         }
         
         return product_data
-
-
-async def scrape_search(query: str, max_results: Optional[int] = None) -> List[Dict]:
-    """
-    Search for products on Product Hunt and scrape results.
     
-    Args:
-        query: Search query string
-        max_results: Maximum number of results to return
+    async def _scrape_one(self, sem: asyncio.BoundedSemaphore, url: str) -> Optional[Dict]:
+        """
+        Scrape a single product page while holding a semaphore slot.
+        
+        Args:
+            sem: Semaphore limiting how many pages are loaded at once
+            url: Full URL to the product page
+        
+        Returns:
+            Product details, or None if the page failed to load
+        """
+        async with sem:
+            try:
+                return await self.scrape_product(url)
+            except Exception as e:
+                print(f"Error scraping product {url}: {str(e)}")
+                return None
     
-    Returns:
-        List of product dictionaries from search results
-    """
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=True,
-            args=['--disable-blink-features=AutomationControlled']
-        )
+    async def scrape_products_batch(self, urls: List[str], concurrency: int = 5) -> List[Dict]:
+        """
+        Scrape detailed information for many product pages concurrently.
         
-        context = await browser.new_context(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        )
+        Args:
+            urls: Full URLs to the product pages
+            concurrency: Maximum number of pages loaded at the same time
+        
+        Returns:
+            List of product detail dictionaries, in the same order as `urls`.
+            Pages that failed to load are left out.
+        """
+        concurrency = max(1, concurrency)
+        await self._grow_pool(min(concurrency, len(urls)))
         
-        page = await context.new_page()
-        await setup_page(page)
+        sem = asyncio.BoundedSemaphore(concurrency)
+        results = await asyncio.gather(*[self._scrape_one(sem, url) for url in urls])
         
+        return [product for product in results if product is not None]
+    
+    async def scrape_search(self, query: str, max_results: Optional[int] = None) -> List[Dict]:
+        """
+        Search for products on Product Hunt and scrape results.
+        
+        Args:
+            query: Search query string
+            max_results: Maximum number of results to return
+        
+        Returns:
+            List of product dictionaries from search results
+        """
         search_url = f"https://www.producthunt.com/search?q={query.replace(' ', '+')}"
         print(f"Searching for: {query}")
         
-        await page.goto(search_url, wait_until='networkidle', timeout=30000)
-        await asyncio.sleep(2)
+        async with self._page() as page:
+            await page.goto(search_url, wait_until='domcontentloaded', timeout=30000)
+            await _wait_for_cards(page)
+            
+            content = await page.content()
         
-        content = await page.content()
-        soup = BeautifulSoup(content, 'lxml')
+        tree = _parse_html(content)
         
-        products = []
-        product_cards = soup.select('div[data-test^="post-item"]')
+        product_cards = _select(tree, SEL_POST_ITEM)
         
-        if max_results:
-            product_cards = product_cards[:max_results]
+        return _parse_product_cards(product_cards, {'search_query': query}, max_results)
+    
+    async def scrape_archive(
+        self, date: datetime, max_products: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Scrape products from a specific date in the Product Hunt archive.
+        
+        Args:
+            date: Date to scrape (datetime object)
+            max_products: Maximum number of products to scrape
+        
+        Returns:
+            List of product dictionaries from the specified date
+        """
+        year = date.year
+        month = date.month
+        day = date.day
         
-        for card in product_cards:
-            try:
-                name_elem = card.select_one('a[href^="/posts/"]')
-                if not name_elem:
-                    continue
-                
-                name = name_elem.text.strip()
-                product_url = name_elem.get('href', '')
-                full_url = f"https://www.producthunt.com{product_url}" if product_url.startswith('/') else product_url
-                
-                tagline_elem = card.select_one('[color="subdued"]')
-                tagline = tagline_elem.text.strip() if tagline_elem else ''
-                
-                upvote_elem = card.select_one('button[aria-label*="upvote"]')
-                upvotes = upvote_elem.text.strip() if upvote_elem else '0'
-                
-                products.append({
-                    'name': name,
-                    'tagline': tagline,
-                    'upvotes': upvotes,
-                    'url': full_url,
-                    'search_query': query
-                })
-                
-            except Exception as e:
-                print(f"Error parsing search result: {str(e)}")
-                continue
+        archive_url = f"https://www.producthunt.com/leaderboard/daily/{year}/{month}/{day}"
+        print(f"Scraping archive: {date.strftime('%Y-%m-%d')}")
         
-        await browser.close()
+        async with self._page() as page:
+            await page.goto(archive_url, wait_until='domcontentloaded', timeout=30000)
+            await _wait_for_cards(page)
+            
+            content = await page.content()
         
-        return products
+        tree = _parse_html(content)
+        
+        product_cards = _select(tree, SEL_POST_ITEM)
+        
+        extra = {'date': date.strftime('%Y-%m-%d')}
+        return _parse_product_cards(product_cards, extra, max_products)
+
+
+@asynccontextmanager
+async def _use_scraper(
+    scraper: Optional[ProductHuntScraper] = None,
+    concurrency: int = 1
+) -> AsyncIterator[ProductHuntScraper]:
+    """
+    Yield the given scraper, or a temporary one that is closed afterwards.
+    
+    Args:
+        scraper: Running scraper to reuse, if any
+        concurrency: Page pool size for a temporary scraper
+    """
+    if scraper is not None:
+        yield scraper
+        return
+    async with ProductHuntScraper(concurrency=concurrency) as temporary:
+        yield temporary
 
 
-async def scrape_archive(date: datetime, max_products: Optional[int] = None) -> List[Dict]:
+async def scrape_daily_products(
+    max_products: Optional[int] = None,
+    scraper: Optional[ProductHuntScraper] = None
+) -> List[Dict]:
+    """
+    Scrape products from the Product Hunt homepage (today's launches).
+    
+    Args:
+        max_products: Maximum number of products to scrape (None for all)
+        scraper: Running ProductHuntScraper to reuse; a temporary one is
+            launched and closed when omitted
+    
+    Returns:
+        List of product dictionaries containing basic information
+    """
+    async with _use_scraper(scraper) as active:
+        return await active.scrape_daily_products(max_products)
+
+
+async def iter_daily_products(
+    scraper: Optional[ProductHuntScraper] = None
+) -> AsyncIterator[Dict]:
+    """
+    Yield products from the Product Hunt homepage (today's launches) one at a time.
+    
+    Args:
+        scraper: Running ProductHuntScraper to reuse; a temporary one is
+            launched and closed when omitted
+    
+    Yields:
+        Product dictionaries containing basic information
+    """
+    async with _use_scraper(scraper) as active:
+        async for product in active.iter_daily_products():
+            yield product
+
+
+async def scrape_product(
+    product_url: str,
+    scraper: Optional[ProductHuntScraper] = None
+) -> Dict:
+    """
+    Scrape detailed information from a single product page.
+    
+    Args:
+        product_url: Full URL to the product page
+        scraper: Running ProductHuntScraper to reuse; a temporary one is
+            launched and closed when omitted
+    
+    Returns:
+        Dictionary containing detailed product information
+    """
+    async with _use_scraper(scraper) as active:
+        return await active.scrape_product(product_url)
+
+
+async def scrape_products_batch(
+    urls: List[str],
+    concurrency: int = 5,
+    scraper: Optional[ProductHuntScraper] = None
+) -> List[Dict]:
+    """
+    Scrape detailed information for many product pages concurrently.
+    
+    Args:
+        urls: Full URLs to the product pages
+        concurrency: Maximum number of pages loaded at the same time
+        scraper: Running ProductHuntScraper to reuse; a temporary one is
+            launched and closed when omitted
+    
+    Returns:
+        List of product detail dictionaries, in the same order as `urls`
+    """
+    async with _use_scraper(scraper, concurrency) as active:
+        return await active.scrape_products_batch(urls, concurrency)
+
+
+async def scrape_search(
+    query: str,
+    max_results: Optional[int] = None,
+    scraper: Optional[ProductHuntScraper] = None
+) -> List[Dict]:
+    """
+    Search for products on Product Hunt and scrape results.
+    
+    Args:
+        query: Search query string
+        max_results: Maximum number of results to return
+        scraper: Running ProductHuntScraper to reuse; a temporary one is
+            launched and closed when omitted
+    
+    Returns:
+        List of product dictionaries from search results
+    """
+    async with _use_scraper(scraper) as active:
+        return await active.scrape_search(query, max_results)
+
+
+async def scrape_archive(
+    date: datetime,
+    max_products: Optional[int] = None,
+    scraper: Optional[ProductHuntScraper] = None
+) -> List[Dict]:
     """
     Scrape products from a specific date in the Product Hunt archive.
     
     Args:
         date: Date to scrape (datetime object)
         max_products: Maximum number of products to scrape
+        scraper: Running ProductHuntScraper to reuse; a temporary one is
+            launched and closed when omitted
     
     Returns:
         List of product dictionaries from the specified date
     """
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=True,
-            args=['--disable-blink-features=AutomationControlled']
-        )
-        
-        context = await browser.new_context(
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        )
-        
-        page = await context.new_page()
-        await setup_page(page)
-        
-        year = date.year
-        month = date.month
-        day = date.day
-        
-        archive_url = f"https://www.producthunt.com/leaderboard/daily/{year}/{month}/{day}"
-        print(f"Scraping archive: {date.strftime('%Y-%m-%d')}")
-        
-        await page.goto(archive_url, wait_until='networkidle', timeout=30000)
-        await asyncio.sleep(2)
-        
-        content = await page.content()
-        soup = BeautifulSoup(content, 'lxml')
-        
-        products = []
-        product_cards = soup.select('div[data-test^="post-item"]')
-        
-        if max_products:
-            product_cards = product_cards[:max_products]
-        
-        for card in product_cards:
-            try:
-                name_elem = card.select_one('a[href^="/posts/"]')
-                if not name_elem:
-                    continue
-                
-                name = name_elem.text.strip()
-                product_url = name_elem.get('href', '')
-                full_url = f"https://www.producthunt.com{product_url}" if product_url.startswith('/') else product_url
-                
-                tagline_elem = card.select_one('[color="subdued"]')
-                tagline = tagline_elem.text.strip() if tagline_elem else ''
-                
-                upvote_elem = card.select_one('button[aria-label*="upvote"]')
-                upvotes = upvote_elem.text.strip() if upvote_elem else '0'
-                
-                products.append({
-                    'name': name,
-                    'tagline': tagline,
-                    'upvotes': upvotes,
-                    'url': full_url,
-                    'date': date.strftime('%Y-%m-%d')
-                })
-                
-            except Exception as e:
-                print(f"Error parsing archive product: {str(e)}")
-                continue
-        
-        await browser.close()
-        
-        return products
+    async with _use_scraper(scraper) as active:
+        return await active.scrape_archive(date, max_products)
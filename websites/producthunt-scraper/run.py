@@ -4,40 +4,346 @@ Example scraper run script.
 This script demonstrates how to use the Product Hunt scraper functions.
 """
 
+import argparse
 import asyncio
 import json
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
-from producthunt import (
-    scrape_daily_products,
-    scrape_product,
-    scrape_search,
-    scrape_archive
-)
+from producthunt import ProductHuntScraper
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-async def main():
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+# Product pages loaded at the same time when scraping details
+DETAIL_CONCURRENCY = 5
+
+# Output files, written together at the end of the run
+RESULTS_DIR = Path("./results")
+DAILY_PATH = RESULTS_DIR / "daily_products.json"
+PRODUCT_DETAILS_PATH = RESULTS_DIR / "product_details.json"
+SEARCH_PATH = RESULTS_DIR / "search_results.json"
+ARCHIVE_PATH = RESULTS_DIR / "archive_products.json"
+DETAILS_PATH = RESULTS_DIR / "details.json"
+
+# Console section separators
+SEP = "=" * 60
+DASH = "-" * 60
+
+# Optional Redis response cache shared across runs
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+# Errors from a Redis server that goes away after connect_cache() succeeded
+CACHE_ERRORS = (aioredis.RedisError, OSError) if aioredis is not None else (OSError,)
+
+# Seconds each kind of result stays cached; past archive days don't change
+CACHE_TTL = {
+    'daily': 300,
+    'search': 900,
+    'archive': 86400,
+    'product': 3600
+}
+
+
+def _json_bytes(data) -> bytes:
+    """
+    Serialize data to indented UTF-8 JSON, with orjson when it's installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _uring_write_all(payloads: dict) -> None:
+    """
+    Write every file with a single io_uring submission.
+    
+    Args:
+        payloads: Mapping of output path to the bytes to write
+    """
+    items = list(payloads.items())
+    ring = liburing.Ring()
+    cqe = liburing.Cqe()
+    fds = []
+    liburing.io_uring_queue_init(max(len(items), 1), ring)
+    try:
+        for i, (path, payload) in enumerate(items):
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            fds.append(fd)
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_write(sqe, fd, payload, 0)
+            liburing.io_uring_sqe_set_data64(sqe, i)
+        liburing.io_uring_submit(ring)
+        
+        for _ in items:
+            liburing.trap_error(liburing.io_uring_wait_cqe(ring, cqe))
+            path, payload = items[liburing.io_uring_cqe_get_data64(cqe[0])]
+            written = liburing.trap_error(cqe[0].res)
+            liburing.io_uring_cqe_seen(ring, cqe[0])
+            
+            # Finish a short write the ordinary way
+            if written < len(payload):
+                with open(path, "r+b") as f:
+                    f.seek(written)
+                    f.write(payload[written:])
+    finally:
+        for fd in fds:
+            os.close(fd)
+        liburing.io_uring_queue_exit(ring)
+
+
+def _write_all(payloads: dict) -> None:
+    """
+    Write every file, through io_uring when liburing is available.
+    
+    Args:
+        payloads: Mapping of output path to the bytes to write
+    """
+    if liburing is not None:
+        try:
+            _uring_write_all(payloads)
+            return
+        except OSError:
+            # Old kernel or io_uring disabled; plain writes below
+            pass
+    
+    for path, payload in payloads.items():
+        path.write_bytes(payload)
+
+
+async def save_all(outputs: dict) -> None:
+    """
+    Save several JSON files in one batch, off the event loop.
+    
+    Args:
+        outputs: Mapping of output path to JSON-serializable data
+    """
+    payloads = {path: _json_bytes(data) for path, data in outputs.items()}
+    await asyncio.to_thread(_write_all, payloads)
+    for path in payloads:
+        print(f"Saved to: {path}")
+
+
+async def run_all(*coros) -> list:
+    """
+    Run coroutines concurrently, cancelling the rest if any of them fails.
+    
+    Uses asyncio.TaskGroup on Python 3.11+; on 3.10, gather plus explicit
+    cancellation gives the same no-leaked-tasks behaviour.
+    
+    Args:
+        *coros: Coroutines to run
+    
+    Returns:
+        Their results, in argument order
+    """
+    if hasattr(asyncio, "TaskGroup"):
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(coro) for coro in coros]
+        return [task.result() for task in tasks]
+    
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def connect_cache():
+    """
+    Connect to the Redis cache.
+    
+    Returns:
+        Redis client, or None when redis isn't installed or the server
+        can't be reached (the run then scrapes everything)
+    """
+    if aioredis is None:
+        return None
+    
+    client = aioredis.from_url(REDIS_URL)
+    try:
+        await client.ping()
+    except (aioredis.RedisError, OSError) as e:
+        print(f"Redis cache unavailable, scraping without it: {e}")
+        await client.aclose()
+        return None
+    
+    print(f"Using Redis cache at {REDIS_URL}")
+    return client
+
+
+async def cached(cache, key: str, ttl: int, scrape):
+    """
+    Return a cached result, or scrape it and store it for next time.
+    
+    A cache that fails mid-run is skipped rather than failing the scrape.
+    
+    Args:
+        cache: Redis client, or None to always scrape
+        key: Cache key
+        ttl: Seconds to keep the result
+        scrape: Zero-argument coroutine function producing the result
+    
+    Returns:
+        The cached or freshly scraped result
+    """
+    if cache is not None:
+        try:
+            hit = await cache.get(key)
+        except CACHE_ERRORS as e:
+            print(f"Redis cache read failed, scraping instead: {e}")
+            hit = None
+        if hit is not None:
+            return json.loads(hit)
+    
+    data = await scrape()
+    
+    if cache is not None:
+        try:
+            await cache.setex(key, ttl, json.dumps(data))
+        except CACHE_ERRORS as e:
+            print(f"Redis cache write failed: {e}")
+    return data
+
+
+async def cached_details(cache, scraper: ProductHuntScraper, urls: list) -> list:
+    """
+    Scrape product details, reusing cached pages and fetching only the rest.
+    
+    If the cache fails mid-run, every product is scraped and nothing more
+    is written to it.
+    
+    Args:
+        cache: Redis client, or None to always scrape
+        scraper: Running ProductHuntScraper
+        urls: Product page URLs
+    
+    Returns:
+        Product detail dictionaries in the order of `urls`
+    """
+    keys = [f"producthunt:product:{url}" for url in urls]
+    details = {}
+    
+    if cache is not None and keys:
+        try:
+            hits = await cache.mget(keys)
+        except CACHE_ERRORS as e:
+            print(f"Redis cache read failed, scraping instead: {e}")
+            hits = []
+            cache = None
+        for url, hit in zip(urls, hits):
+            if hit is not None:
+                details[url] = json.loads(hit)
+    
+    missing = [url for url in urls if url not in details]
+    if missing:
+        for product in await scraper.scrape_products_batch(missing, concurrency=DETAIL_CONCURRENCY):
+            details[product['url']] = product
+            if cache is not None:
+                try:
+                    await cache.setex(
+                        f"producthunt:product:{product['url']}",
+                        CACHE_TTL['product'],
+                        json.dumps(product)
+                    )
+                except CACHE_ERRORS as e:
+                    # Don't retry the rest against a dead server
+                    print(f"Redis cache write failed: {e}")
+                    cache = None
+    
+    return [details[url] for url in urls if url in details]
+
+
+def parse_arguments():
+    """
+    Parse command-line arguments.
+    """
+    parser = argparse.ArgumentParser(description="Product Hunt Scraper - Example Run")
+    parser.add_argument(
+        '--max-products',
+        type=int,
+        default=5,
+        help='Products to collect from each listing (default: 5)'
+    )
+    return parser.parse_args()
+
+
+async def main(max_products: int = 5):
     """
     Run example scraping tasks for Product Hunt.
+    
+    Args:
+        max_products: Products to collect from each listing; parsing stops
+            once this many are found
     """
     # Create results directory if it doesn't exist
-    results_dir = Path("./results")
-    results_dir.mkdir(exist_ok=True)
+    RESULTS_DIR.mkdir(exist_ok=True)
     
-    print("=" * 60)
+    print(SEP)
     print("Product Hunt Scraper - Example Run")
-    print("=" * 60)
+    print(SEP)
     
-    # 1. Scrape today's products (limited to 5 for demo)
-    print("\n1. Scraping today's products...")
-    print("-" * 60)
-    daily_products = await scrape_daily_products(max_products=5)
-    print(f"Scraped {len(daily_products)} products from today")
+    archive_date = datetime.now() - timedelta(days=7)
+    archive_day = archive_date.strftime('%Y-%m-%d')
+    cache = await connect_cache()
+    
+    # One browser is shared by every scrape below, with a page for each
+    # of the three listing scrapes so they can load at the same time
+    async with ProductHuntScraper(concurrency=3) as scraper:
+        print("\nScraping today's products, 'AI' search results and the archive from 7 days ago...")
+        print(DASH)
+        daily_products, search_results, archive_products = await run_all(
+            cached(cache, f"producthunt:daily:{max_products}", CACHE_TTL['daily'],
+                   lambda: scraper.scrape_daily_products(max_products=max_products)),
+            cached(cache, f"producthunt:search:AI:{max_products}", CACHE_TTL['search'],
+                   lambda: scraper.scrape_search("AI", max_results=max_products)),
+            cached(cache, f"producthunt:archive:{archive_day}:{max_products}", CACHE_TTL['archive'],
+                   lambda: scraper.scrape_archive(archive_date, max_products=max_products))
+        )
+        
+        # Fan out to every product page found above, a few at a time
+        urls = list(dict.fromkeys(
+            p['url'] for p in daily_products + search_results + archive_products
+        ))
+        print(f"\nScraping details for {len(urls)} products ({DETAIL_CONCURRENCY} at a time)...")
+        all_details = await cached_details(cache, scraper, urls)
     
-    # Save daily products
-    with open(results_dir / "daily_products.json", "w", encoding="utf-8") as f:
-        json.dump(daily_products, f, indent=2, ensure_ascii=False)
-    print(f"Saved to: {results_dir / 'daily_products.json'}")
+    if cache is not None:
+        try:
+            await cache.aclose()
+        except CACHE_ERRORS:
+            pass
+    
+    # Files are written together at the end in one batch
+    outputs = {}
+    details_by_url = {d['url']: d for d in all_details}
+    product_details = details_by_url.get(daily_products[0]['url']) if daily_products else None
+    
+    # 1. Today's products (limited to --max-products for demo)
+    print("\n1. Today's products")
+    print(DASH)
+    print(f"Scraped {len(daily_products)} products from today")
+    outputs[DAILY_PATH] = daily_products
     
     # Display sample
     if daily_products:
@@ -47,19 +353,12 @@ async def main():
         print(f"  Upvotes: {daily_products[0]['upvotes']}")
         print(f"  URL: {daily_products[0]['url']}")
     
-    # 2. Scrape detailed information for the first product
-    if daily_products:
-        print("\n2. Scraping detailed product information...")
-        print("-" * 60)
-        product_url = daily_products[0]['url']
-        
-        product_details = await scrape_product(product_url)
+    # 2. Detailed information for the first product
+    if product_details:
+        print("\n2. Detailed product information")
+        print(DASH)
         print(f"Scraped details for: {product_details['name']}")
-        
-        # Save product details
-        with open(results_dir / "product_details.json", "w", encoding="utf-8") as f:
-            json.dump(product_details, f, indent=2, ensure_ascii=False)
-        print(f"Saved to: {results_dir / 'product_details.json'}")
+        outputs[PRODUCT_DETAILS_PATH] = product_details
         
         # Display details
         print("\nProduct details:")
@@ -72,16 +371,11 @@ async def main():
         print(f"  Website: {product_details['website']}")
         print(f"  Topics: {', '.join(product_details['topics'])}")
     
-    # 3. Search for AI products
-    print("\n3. Searching for 'AI' products...")
-    print("-" * 60)
-    search_results = await scrape_search("AI", max_results=5)
+    # 3. Search results for AI products
+    print("\n3. Search results for 'AI'")
+    print(DASH)
     print(f"Found {len(search_results)} AI-related products")
-    
-    # Save search results
-    with open(results_dir / "search_results.json", "w", encoding="utf-8") as f:
-        json.dump(search_results, f, indent=2, ensure_ascii=False)
-    print(f"Saved to: {results_dir / 'search_results.json'}")
+    outputs[SEARCH_PATH] = search_results
     
     # Display sample
     if search_results:
@@ -90,17 +384,11 @@ async def main():
         print(f"  Tagline: {search_results[0]['tagline']}")
         print(f"  Upvotes: {search_results[0]['upvotes']}")
     
-    # 4. Scrape archive from 7 days ago
-    print("\n4. Scraping archive from 7 days ago...")
-    print("-" * 60)
-    archive_date = datetime.now() - timedelta(days=7)
-    archive_products = await scrape_archive(archive_date, max_products=5)
-    print(f"Scraped {len(archive_products)} products from {archive_date.strftime('%Y-%m-%d')}")
-    
-    # Save archive results
-    with open(results_dir / "archive_products.json", "w", encoding="utf-8") as f:
-        json.dump(archive_products, f, indent=2, ensure_ascii=False)
-    print(f"Saved to: {results_dir / 'archive_products.json'}")
+    # 4. Archive from 7 days ago
+    print("\n4. Archive from 7 days ago")
+    print(DASH)
+    print(f"Scraped {len(archive_products)} products from {archive_day}")
+    outputs[ARCHIVE_PATH] = archive_products
     
     # Display sample
     if archive_products:
@@ -110,10 +398,25 @@ async def main():
         print(f"  Upvotes: {archive_products[0]['upvotes']}")
         print(f"  Date: {archive_products[0]['date']}")
     
-    print("\n" + "=" * 60)
+    # 5. Details for every product scraped above
+    print("\n5. Product details for all scraped products")
+    print(DASH)
+    print(f"Scraped details for {len(all_details)} of {len(urls)} products")
+    outputs[DETAILS_PATH] = all_details
+    
+    print()
+    await save_all(outputs)
+    
+    print("\n" + SEP)
     print("Scraping completed! Check the ./results directory for output files.")
-    print("=" * 60)
+    print(SEP)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    args = parse_arguments()
+    
+    # uvloop's libuv event loop when installed, stock asyncio otherwise
+    if uvloop is not None:
+        uvloop.run(main(args.max_products))
+    else:
+        asyncio.run(main(args.max_products))
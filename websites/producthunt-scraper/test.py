@@ -11,9 +11,14 @@ Run specific tests:
     pytest test.py -k test_archive_scraping
 """
 
+import asyncio
+import os
 import pytest
 from datetime import datetime, timedelta
+import producthunt
+import run
 from producthunt import (
+    ProductHuntScraper,
     scrape_daily_products,
     scrape_product,
     scrape_search,
@@ -176,5 +181,402 @@ async def test_data_consistency():
     print(f"\n✓ Data consistency checks passed for {len(products)} products")
 
 
+@pytest.mark.asyncio
+async def test_shared_scraper():
+    """
+    Test running several scrapes on one ProductHuntScraper instance.
+    """
+    async with ProductHuntScraper() as scraper:
+        products = await scraper.scrape_daily_products(max_products=2)
+        assert len(products) > 0, "Should scrape at least one product"
+        
+        product = await scraper.scrape_product(products[0]['url'])
+        assert product['url'] == products[0]['url'], \
+            "Details should be scraped with the same browser"
+    
+    assert scraper._browser is None, "Browser should be closed on exit"
+    
+    print(f"\n✓ Shared scraper handled {len(products) + 1} pages with one browser")
+
+
+@pytest.mark.asyncio
+async def test_products_batch_concurrency(monkeypatch):
+    """
+    Test that batch scraping respects the concurrency limit and keeps order.
+    """
+    scraper = ProductHuntScraper()
+    running = 0
+    peak = 0
+    
+    async def fake_grow_pool(size):
+        pass
+    
+    async def fake_scrape_product(url):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if url.endswith('broken'):
+            raise RuntimeError("page failed")
+        return {'url': url}
+    
+    monkeypatch.setattr(scraper, '_grow_pool', fake_grow_pool)
+    monkeypatch.setattr(scraper, 'scrape_product', fake_scrape_product)
+    
+    urls = [f"https://www.producthunt.com/posts/p{i}" for i in range(8)]
+    results = await scraper.scrape_products_batch(urls + [urls[0] + '-broken'], concurrency=3)
+    
+    assert [r['url'] for r in results] == urls, "Results should follow input order"
+    assert peak == 3, "No more than `concurrency` pages should load at once"
+    
+    print(f"\n✓ Batch scraped {len(results)} products with peak concurrency {peak}")
+
+
+CARD_HTML = """
+<div data-test="post-item-1">
+    <a href="/posts/widget"> Widget </a>
+    <div color="subdued">Makes widgets</div>
+    <button aria-label="upvote Widget"> 1,234 </button>
+</div>
+"""
+
+
+@pytest.mark.parametrize("use_selectolax", [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(
+        producthunt.HTMLParser is None, reason="selectolax not installed"
+    )),
+])
+def test_html_backends(monkeypatch, use_selectolax):
+    """
+    Test that the selectolax and BeautifulSoup backends extract the same fields.
+    """
+    monkeypatch.setattr(producthunt, 'USE_SELECTOLAX', use_selectolax)
+    
+    tree = producthunt._parse_html(CARD_HTML)
+    cards = producthunt._select(tree, producthunt.SEL_POST_ITEM)
+    assert len(cards) == 1, "Should find the product card"
+    
+    link = producthunt._select_one(cards[0], producthunt.SEL_POST_LINK)
+    assert producthunt._text(link) == 'Widget'
+    assert producthunt._attr(link, 'href') == '/posts/widget'
+    assert producthunt._attr(link, 'title') == ''
+    
+    upvote = producthunt._select_one(cards[0], producthunt.SEL_UPVOTE)
+    assert producthunt._text(upvote) == '1,234'
+    assert producthunt._select_one(cards[0], producthunt.SEL_POST_TOPIC) is None
+
+
+@pytest.mark.parametrize("use_selectolax", [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(
+        producthunt.HTMLParser is None, reason="selectolax not installed"
+    )),
+])
+def test_parse_product_cards(monkeypatch, use_selectolax):
+    """
+    Test the shared card parser used by the daily, search and archive scrapers.
+    """
+    monkeypatch.setattr(producthunt, 'USE_SELECTOLAX', use_selectolax)
+    
+    tree = producthunt._parse_html(CARD_HTML + '<div data-test="post-item-2">No link</div>')
+    cards = producthunt._select(tree, producthunt.SEL_POST_ITEM)
+    products = producthunt._parse_product_cards(cards, {'search_query': 'widgets'})
+    
+    assert products == [{
+        'name': 'Widget',
+        'tagline': 'Makes widgets',
+        'upvotes': '1,234',
+        'url': 'https://www.producthunt.com/posts/widget',
+        'search_query': 'widgets'
+    }], "Cards without a post link should be skipped"
+
+
+def test_parse_product_cards_limit(monkeypatch):
+    """
+    Test that card parsing stops once enough valid products are found.
+    """
+    tree = producthunt._parse_html('<div data-test="post-item-0">No link</div>' + CARD_HTML * 3)
+    cards = producthunt._select(tree, producthunt.SEL_POST_ITEM)
+    assert len(cards) == 4
+    
+    link_lookups = []
+    select_one = producthunt._select_one
+    
+    def counting_select_one(node, selector):
+        if selector == producthunt.SEL_POST_LINK:
+            link_lookups.append(node)
+        return select_one(node, selector)
+    
+    monkeypatch.setattr(producthunt, '_select_one', counting_select_one)
+    
+    products = producthunt._parse_product_cards(cards, limit=2)
+    assert [p['name'] for p in products] == ['Widget', 'Widget'], \
+        "Limit should count valid products only"
+    assert len(link_lookups) == 3, "Cards after the limit should not be parsed"
+
+
+@pytest.mark.asyncio
+async def test_module_functions_reuse_scraper(monkeypatch):
+    """
+    Test that module-level functions use a passed-in scraper instead of launching one.
+    """
+    async def fail_start(self):
+        raise AssertionError("No browser should be launched")
+    
+    monkeypatch.setattr(ProductHuntScraper, 'start', fail_start)
+    
+    scraper = ProductHuntScraper()
+    
+    async def fake_scrape_search(query, max_results=None):
+        return [{'search_query': query}]
+    
+    monkeypatch.setattr(scraper, 'scrape_search', fake_scrape_search)
+    
+    results = await scrape_search("AI", max_results=1, scraper=scraper)
+    assert results == [{'search_query': 'AI'}]
+
+
+class FakeRoute:
+    """
+    Minimal stand-in for a Playwright Route.
+    """
+    
+    def __init__(self, resource_type, url):
+        self.request = type('Request', (), {'resource_type': resource_type, 'url': url})()
+        self.action = None
+    
+    async def abort(self):
+        self.action = 'abort'
+    
+    async def continue_(self):
+        self.action = 'continue'
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("resource_type, url, action", [
+    ('document', 'https://www.producthunt.com/', 'continue'),
+    ('script', 'https://www.producthunt.com/app.js', 'continue'),
+    ('image', 'https://ph-files.imgix.net/logo.png', 'abort'),
+    ('font', 'https://www.producthunt.com/font.woff2', 'abort'),
+    ('stylesheet', 'https://www.producthunt.com/app.css', 'abort'),
+    ('xhr', 'https://www.google-analytics.com/collect', 'abort'),
+])
+async def test_block_heavy_requests(resource_type, url, action):
+    """
+    Test that assets and analytics are aborted while documents and scripts load.
+    """
+    route = FakeRoute(resource_type, url)
+    await producthunt._block_heavy_requests(route)
+    
+    assert route.action == action
+
+
+class FakeRedis:
+    """
+    In-memory stand-in for the redis.asyncio client used by run.py.
+    """
+    
+    def __init__(self, data=None, error=None):
+        self.data = dict(data or {})
+        self.error = error
+        self.closed = False
+    
+    def _check(self):
+        if self.error is not None:
+            raise self.error
+    
+    async def ping(self):
+        self._check()
+        return True
+    
+    async def get(self, key):
+        self._check()
+        return self.data.get(key)
+    
+    async def mget(self, keys):
+        self._check()
+        return [self.data.get(key) for key in keys]
+    
+    async def setex(self, key, ttl, value):
+        self._check()
+        self.data[key] = value
+    
+    async def aclose(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_cached_hit_and_miss():
+    """
+    Test a cache hit skips the scrape and a miss scrapes and stores the result.
+    """
+    cache = FakeRedis({'hit': '[{"name": "Cached"}]'})
+    calls = []
+    
+    async def scrape():
+        calls.append(1)
+        return [{'name': 'Fresh'}]
+    
+    assert await run.cached(cache, 'hit', 60, scrape) == [{'name': 'Cached'}]
+    assert calls == []
+    
+    assert await run.cached(cache, 'miss', 60, scrape) == [{'name': 'Fresh'}]
+    assert calls == [1]
+    assert cache.data['miss'] == '[{"name": "Fresh"}]'
+
+
+@pytest.mark.asyncio
+async def test_cached_details_mixed_hits_keep_order():
+    """
+    Test only uncached products are scraped and results follow the input order.
+    """
+    cache = FakeRedis({'producthunt:product:b': '{"url": "b", "name": "Cached B"}'})
+    
+    class FakeScraper:
+        def __init__(self):
+            self.requested = None
+        
+        async def scrape_products_batch(self, urls, concurrency):
+            self.requested = urls
+            # Finish in reverse order to show the output isn't completion order
+            return [{'url': url, 'name': f'Fresh {url.upper()}'} for url in reversed(urls)]
+    
+    scraper = FakeScraper()
+    details = await run.cached_details(cache, scraper, ['a', 'b', 'c'])
+    
+    assert scraper.requested == ['a', 'c']
+    assert [d['name'] for d in details] == ['Fresh A', 'Cached B', 'Fresh C']
+    assert 'producthunt:product:a' in cache.data
+    assert 'producthunt:product:c' in cache.data
+
+
+@pytest.mark.asyncio
+async def test_cache_errors_fall_back_to_scraping():
+    """
+    Test a cache that fails mid-run is skipped instead of failing the scrape.
+    """
+    cache = FakeRedis(error=ConnectionResetError("Redis went away"))
+    
+    async def scrape():
+        return ['fresh']
+    
+    class FakeScraper:
+        async def scrape_products_batch(self, urls, concurrency):
+            return [{'url': url} for url in urls]
+    
+    assert await run.cached(cache, 'key', 60, scrape) == ['fresh']
+    details = await run.cached_details(cache, FakeScraper(), ['a', 'b'])
+    assert details == [{'url': 'a'}, {'url': 'b'}]
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(run.aioredis is None, reason="redis not installed")
+async def test_connect_cache_unreachable(monkeypatch):
+    """
+    Test an unreachable server at startup means running without a cache.
+    """
+    client = FakeRedis(error=run.aioredis.ConnectionError("refused"))
+    monkeypatch.setattr(run.aioredis, 'from_url', lambda url: client)
+    
+    assert await run.connect_cache() is None
+    assert client.closed
+
+
+def test_write_all_plain(monkeypatch, tmp_path):
+    """
+    Test every file is written with plain writes when liburing isn't installed.
+    """
+    monkeypatch.setattr(run, 'liburing', None)
+    payloads = {tmp_path / 'a.json': b'[1]', tmp_path / 'b.json': b'{"x": 2}'}
+    
+    run._write_all(payloads)
+    
+    for path, payload in payloads.items():
+        assert path.read_bytes() == payload
+
+
+def test_write_all_uring_error_falls_back(monkeypatch, tmp_path):
+    """
+    Test an io_uring failure (old kernel, disabled) falls back to plain writes.
+    """
+    def no_uring(payloads):
+        raise OSError("io_uring_setup: Function not implemented")
+    
+    monkeypatch.setattr(run, 'liburing', object())
+    monkeypatch.setattr(run, '_uring_write_all', no_uring)
+    payloads = {tmp_path / 'a.json': b'[1]', tmp_path / 'b.json': b'{"x": 2}'}
+    
+    run._write_all(payloads)
+    
+    for path, payload in payloads.items():
+        assert path.read_bytes() == payload
+
+
+class FakeLiburing:
+    """
+    Stand-in for liburing that completes each write only halfway.
+    """
+    
+    class Ring:
+        pass
+    
+    class Cqe(list):
+        def __init__(self):
+            super().__init__([None])
+    
+    def __init__(self):
+        self.pending = []
+    
+    def io_uring_queue_init(self, entries, ring):
+        pass
+    
+    def io_uring_get_sqe(self, ring):
+        return {}
+    
+    def io_uring_prep_write(self, sqe, fd, payload, offset):
+        sqe.update(fd=fd, payload=payload)
+    
+    def io_uring_sqe_set_data64(self, sqe, data):
+        sqe['data'] = data
+        self.pending.append(sqe)
+    
+    def io_uring_submit(self, ring):
+        pass
+    
+    def io_uring_wait_cqe(self, ring, cqe):
+        sqe = self.pending.pop(0)
+        written = os.write(sqe['fd'], sqe['payload'][:len(sqe['payload']) // 2])
+        cqe[0] = type('CqeEntry', (), {'res': written, 'data': sqe['data']})()
+        return 0
+    
+    def io_uring_cqe_get_data64(self, cqe):
+        return cqe.data
+    
+    def io_uring_cqe_seen(self, ring, cqe):
+        pass
+    
+    def io_uring_queue_exit(self, ring):
+        pass
+    
+    @staticmethod
+    def trap_error(value):
+        return value
+
+
+def test_uring_write_all_finishes_short_writes(monkeypatch, tmp_path):
+    """
+    Test a short io_uring write is completed with an ordinary write.
+    """
+    monkeypatch.setattr(run, 'liburing', FakeLiburing())
+    payloads = {tmp_path / 'a.json': b'[1, 2, 3, 4]', tmp_path / 'b.json': b'{"x": "abcdef"}'}
+    
+    run._uring_write_all(payloads)
+    
+    for path, payload in payloads.items():
+        assert path.read_bytes() == payload
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
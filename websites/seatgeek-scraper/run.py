@@ -5,12 +5,32 @@ Provided by Roundproxies.com
 """
 
 import argparse
+import asyncio
+import mmap
+import os
+import re
 import sys
 import json
-from datetime import datetime
+from datetime import date
 from pathlib import Path
 from seatgeek import SeatGeekScraper
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# fromisoformat alone also accepts forms like 20251201 on Python 3.11+
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 
 def parse_arguments():
     """Parse command-line arguments"""
@@ -92,6 +112,20 @@ Categories: concerts, sports, theater, comedy, festival, nfl, nba, mlb, nhl, mls
         help='Maximum delay between requests in seconds (default: 7.0)'
     )
     
+    parser.add_argument(
+        '--max-concurrency',
+        type=positive_int,
+        default=8,
+        help='Maximum number of concurrent requests (default: 8)'
+    )
+    
+    parser.add_argument(
+        '--event-loop',
+        choices=['auto', 'uvloop', 'asyncio'],
+        default='auto',
+        help='Event loop to run on; auto uses uvloop when installed (default: auto)'
+    )
+    
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -104,8 +138,13 @@ Categories: concerts, sports, theater, comedy, festival, nfl, nba, mlb, nhl, mls
 def load_proxy_list(proxy_file: str) -> list:
     """Load proxy list from file"""
     try:
-        with open(proxy_file, 'r') as f:
-            proxies = [line.strip() for line in f if line.strip()]
+        with open(proxy_file, 'rb') as f:
+            # mmap can't map an empty file
+            if os.fstat(f.fileno()).st_size == 0:
+                proxies = []
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    proxies = [line.strip().decode() for line in mm[:].splitlines() if line.strip()]
         print(f"Loaded {len(proxies)} proxies from {proxy_file}")
         return proxies
     except FileNotFoundError:
@@ -118,13 +157,28 @@ def load_proxy_list(proxy_file: str) -> list:
 
 def validate_date(date_string: str) -> bool:
     """Validate date format"""
+    if not _DATE_RE.match(date_string):
+        return False
     try:
-        datetime.strptime(date_string, '%Y-%m-%d')
+        date.fromisoformat(date_string)
         return True
     except ValueError:
         return False
 
 
+def run_async(coro, event_loop: str = 'auto'):
+    """
+    Run a coroutine on the chosen event loop
+    
+    Args:
+        coro: Coroutine to run
+        event_loop: 'uvloop', 'asyncio', or 'auto' for uvloop when installed
+    """
+    if event_loop != 'asyncio' and uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
 def main():
     """Main execution function"""
     args = parse_arguments()
@@ -138,6 +192,10 @@ def main():
         print(f"Error: Invalid date format for --date-to. Use YYYY-MM-DD")
         sys.exit(1)
     
+    if args.event_loop == 'uvloop' and uvloop is None:
+        print("Error: --event-loop uvloop requires the uvloop package")
+        sys.exit(1)
+    
     # Load proxy list if provided
     proxy_list = []
     if args.proxy_list:
@@ -155,6 +213,7 @@ def main():
         'proxy_list': proxy_list,
         'delay_min': args.delay_min,
         'delay_max': args.delay_max,
+        'max_concurrency': args.max_concurrency,
         'verbose': args.verbose
     }
     
@@ -170,6 +229,7 @@ def main():
     if args.proxy and proxy_list:
         print(f"Proxies Loaded: {len(proxy_list)}")
     print(f"Delay: {args.delay_min}-{args.delay_max} seconds")
+    print(f"Max Concurrency: {args.max_concurrency} requests")
     print(f"Output: {args.output}")
     print("=" * 70)
     print()
@@ -180,17 +240,17 @@ def main():
         
         # Start scraping
         print("Starting scraper...")
-        events = scraper.scrape_events(
+        events = run_async(scraper.scrape_events_async(
             category=args.category,
             location=args.location,
             date_from=args.date_from,
             date_to=args.date_to,
             limit=args.limit
-        )
+        ), args.event_loop)
         
         # Save results
         if events:
-            scraper.save_results(events, args.output)
+            scraper.flush(args.output)
             print()
             print("=" * 70)
             print(f"✓ Successfully scraped {len(events)} events")
@@ -4,14 +4,156 @@ Provided by Roundproxies.com
 https://github.com/carlsfert/web-scraper/tree/main/websites/seatgeek-scraper
 """
 
+import asyncio
+import functools
+import importlib.util
+import itertools
+import httpx
 import requests
 import json
+import os
 import time
 import random
 from datetime import datetime
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, quote
+from bs4 import BeautifulSoup, Tag
+from urllib.parse import urljoin, quote, urlsplit
+
+# HTTP/2 needs the h2 package (installed by httpx[http2])
+HTTP2 = importlib.util.find_spec('h2') is not None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+
+# macOS has no fdatasync; fsync also syncs metadata but is otherwise equivalent
+_fdatasync = getattr(os, 'fdatasync', os.fsync)
+
+
+def _uring_write(path: str, payload: bytes, sync: bool = False) -> int:
+    """
+    Write a file with a single io_uring submission
+    
+    Args:
+        path: Output file path
+        payload: Bytes to write
+        sync: fdatasync the file once the write completes
+        
+    Returns:
+        Number of bytes written
+    """
+    ring = liburing.Ring()
+    cqe = liburing.Cqe()
+    liburing.io_uring_queue_init(1, ring)
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_write(sqe, fd, payload, 0)
+            liburing.io_uring_submit(ring)
+            liburing.trap_error(liburing.io_uring_wait_cqe(ring, cqe))
+            written = liburing.trap_error(cqe[0].res)
+            liburing.io_uring_cqe_seen(ring, cqe[0])
+            
+            # Finish a short write the ordinary way
+            if written < len(payload):
+                written += os.pwrite(fd, payload[written:], written)
+            if sync:
+                _fdatasync(fd)
+            return written
+        finally:
+            os.close(fd)
+    finally:
+        liburing.io_uring_queue_exit(ring)
+
+
+def write_file(path: str, payload: bytes, sync: bool = False):
+    """
+    Write bytes to a file, through io_uring when liburing is available
+    
+    Args:
+        path: Output file path
+        payload: Bytes to write
+        sync: fdatasync the file once written so it survives a crash
+    """
+    if liburing is not None:
+        try:
+            _uring_write(path, payload, sync)
+            return
+        except OSError:
+            # Old kernel or io_uring disabled; plain write below
+            pass
+    
+    with open(path, 'wb') as f:
+        f.write(payload)
+        if sync:
+            f.flush()
+            _fdatasync(f.fileno())
+
+
+# Event card selectors (examples; may need updating as the site changes)
+SEL_EVENT_CARD = 'div.event-card, div.EventCard'
+SEL_TITLE = 'h2.event-title, h2.title, h3.event-title, h3.title, a.event-title, a.title'
+SEL_VENUE = 'span.venue, span.location, div.venue, div.location'
+SEL_DATE = 'time.date, time.datetime, span.date, span.datetime'
+SEL_PRICE = 'span.price, span.ticket-price, div.price, div.ticket-price'
+SEL_LINK = 'a[href]'
+
+
+def _css_first(node, selector: str):
+    """Return the first element matching a CSS selector, for selectolax or BeautifulSoup nodes"""
+    if isinstance(node, Tag):
+        return node.select_one(selector)
+    return node.css_first(selector)
+
+
+def _node_text(node) -> str:
+    """Return the stripped text of a selectolax or BeautifulSoup node"""
+    if isinstance(node, Tag):
+        return node.text.strip()
+    return node.text().strip()
+
+
+def _node_attr(node, name: str, default=None):
+    """Return an attribute of a selectolax or BeautifulSoup node"""
+    if isinstance(node, Tag):
+        return node.get(name, default)
+    value = node.attributes.get(name)
+    return default if value is None else value
+
+
+@functools.lru_cache(maxsize=1024)
+def _search_url(base_url: str, category: Optional[str], location: Optional[str],
+                date_from: Optional[str], date_to: Optional[str]) -> str:
+    """Build a search URL; cached since pagination rebuilds the same one"""
+    url = f"{base_url}/browse"
+    
+    params = []
+    if category:
+        params.append(f"type={quote(category)}")
+    if location:
+        params.append(f"location={quote(location)}")
+    if date_from:
+        params.append(f"datetime_utc.gte={date_from}")
+    if date_to:
+        params.append(f"datetime_utc.lte={date_to}")
+    
+    if params:
+        url += "?" + "&".join(params)
+    
+    return url
 
 
 class SeatGeekScraper:
@@ -34,8 +176,24 @@ class SeatGeekScraper:
         self.proxy_list = self.config.get('proxy_list', [])
         self.delay_min = self.config.get('delay_min', 3)
         self.delay_max = self.config.get('delay_max', 7)
+        self.max_concurrency = self.config.get('max_concurrency', 8)
+        if self.max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {self.max_concurrency}")
+        self._sem = None
+        self._last_request_per_host = {}
         self.user_agents = self._load_user_agents()
+        
+        # Rotation order is shuffled once, then cycled round-robin
+        self._user_agent_iter = itertools.cycle(
+            random.sample(self.user_agents, len(self.user_agents))
+        )
+        self._proxy_dicts = [
+            {'http': f'http://{proxy}', 'https': f'http://{proxy}'}
+            for proxy in random.sample(self.proxy_list, len(self.proxy_list))
+        ] if self.proxy_enabled else []
+        self._proxy_iter = itertools.cycle(self._proxy_dicts)
         self.session = requests.Session()
+        self._clients = {}
         self.results = []
         
     def _load_user_agents(self) -> List[str]:
@@ -49,24 +207,49 @@ class SeatGeekScraper:
         ]
     
     def _get_random_user_agent(self) -> str:
-        """Get a random user agent from the list"""
-        return random.choice(self.user_agents)
+        """Get the next user agent in the rotation"""
+        return next(self._user_agent_iter)
     
     def _get_proxy(self) -> Optional[Dict]:
-        """Get a random proxy from the proxy list"""
-        if self.proxy_enabled and self.proxy_list:
-            proxy = random.choice(self.proxy_list)
-            return {
-                'http': f'http://{proxy}',
-                'https': f'http://{proxy}'
-            }
-        return None
+        """Get the next proxy in the rotation"""
+        return next(self._proxy_iter) if self._proxy_dicts else None
     
     def _delay(self):
         """Add random delay between requests"""
         delay = random.uniform(self.delay_min, self.delay_max)
         time.sleep(delay)
     
+    def _get_semaphore(self) -> asyncio.BoundedSemaphore:
+        """Get the semaphore capping concurrent async requests"""
+        if self._sem is None:
+            self._sem = asyncio.BoundedSemaphore(self.max_concurrency)
+        return self._sem
+    
+    async def _throttle(self, url: str):
+        """
+        Wait out the polite delay for the URL's host without blocking the event loop
+        
+        Time already spent since the host's last request counts towards
+        delay_min, so slow responses don't add a full delay on top. Hosts are
+        throttled independently. Each caller reserves its send time before
+        sleeping, so concurrent requests to one host queue up delay_min apart
+        instead of all waking together.
+        
+        Args:
+            url: URL about to be requested
+        """
+        host = urlsplit(url).netloc
+        last = self._last_request_per_host.get(host)
+        now = time.monotonic()
+        
+        slot = now if last is None else max(now, last + self.delay_min)
+        slot += random.uniform(0, self.delay_max - self.delay_min)
+        self._last_request_per_host[host] = slot
+        
+        wait = slot - now
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
     def _make_request(self, url: str, method: str = 'GET', **kwargs) -> Optional[requests.Response]:
         """
         Make HTTP request with error handling and retry logic
@@ -115,6 +298,165 @@ class SeatGeekScraper:
         
         return None
     
+    def _get_client(self, proxy: Optional[Dict]) -> httpx.AsyncClient:
+        """
+        Get the async HTTP client for a proxy, creating it on first use
+        
+        httpx sets proxies per client, so each proxy (and direct access) gets
+        its own client and connection pool. Over HTTP/2, concurrent requests
+        through the same client share one multiplexed connection.
+        
+        Args:
+            proxy: Proxy dictionary from _get_proxy, or None for direct
+            
+        Returns:
+            AsyncClient for that route
+        """
+        key = proxy['http'] if proxy else None
+        client = self._clients.get(key)
+        if client is None:
+            client = httpx.AsyncClient(
+                http2=HTTP2,
+                proxy=key,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=self._keepalive_expiry()
+                ),
+                timeout=httpx.Timeout(15),
+                follow_redirects=True
+            )
+            self._clients[key] = client
+        return client
+    
+    def _keepalive_expiry(self) -> float:
+        """
+        Seconds an idle connection is kept open
+        
+        httpx's 5 second default is shorter than the usual polite delay, which
+        would drop the connection between requests and pay a fresh DNS lookup
+        and TLS handshake each time. Outlast the longest delay instead.
+        """
+        return max(30.0, self.delay_max * 2)
+    
+    async def aclose(self):
+        """Close the async HTTP clients"""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
+    
+    async def _make_request_async(self, url: str) -> Optional[str]:
+        """
+        Fetch a page asynchronously with the same retry logic as _make_request
+        
+        Args:
+            url: URL to request
+            
+        Returns:
+            Response body or None if failed
+        """
+        async with self._get_semaphore():
+            proxy = self._get_proxy()
+            max_retries = 3
+            
+            for attempt in range(max_retries):
+                headers = {'User-Agent': self._get_random_user_agent()}
+                await self._throttle(url)
+                try:
+                    response = await self._get_client(proxy).get(url, headers=headers)
+                    
+                    if response.status_code == 200:
+                        return response.text
+                    elif response.status_code == 429:
+                        print("Rate limited. Waiting before retry...")
+                        await asyncio.sleep(60)
+                    elif response.status_code in [403, 401]:
+                        print(f"Access denied (status {response.status_code}). Rotating proxy...")
+                        proxy = self._get_proxy()
+                    else:
+                        print(f"Request failed with status {response.status_code}")
+                        
+                except httpx.HTTPError as e:
+                    print(f"Request error (attempt {attempt + 1}/{max_retries}): {e}")
+                    
+            return None
+    
+    async def scrape_events_async(self,
+                                  category: Optional[str] = None,
+                                  location: Optional[str] = None,
+                                  date_from: Optional[str] = None,
+                                  date_to: Optional[str] = None,
+                                  limit: int = 50) -> List[Dict]:
+        """
+        Scrape events from SeatGeek, fetching several result pages at once
+        over httpx (HTTP/2 when the h2 package is installed)
+        
+        The first page is fetched alone to learn how many events a page holds;
+        the pages still needed to reach `limit` are then requested in batches
+        of up to `max_concurrency` (config key, default 8) and consumed in page
+        order, stopping at the first failed or empty page.
+        
+        Args:
+            category: Event category (concerts, sports, theater, etc.)
+            location: City or venue location
+            date_from: Start date (YYYY-MM-DD)
+            date_to: End date (YYYY-MM-DD)
+            limit: Maximum number of events to scrape
+            
+        Returns:
+            List of event dictionaries
+        """
+        print("Starting SeatGeek scraper...")
+        print(f"Category: {category}, Location: {location}, Limit: {limit}")
+        
+        events = []
+        search_url = self._build_search_url(category, location, date_from, date_to)
+        # A fresh semaphore for this event loop
+        self._sem = asyncio.BoundedSemaphore(self.max_concurrency)
+        
+        try:
+            page = 1
+            batch_size = 1
+            done = False
+            while not done and len(events) < limit:
+                pages = range(page, page + batch_size)
+                print(f"Scraping pages {pages[0]}-{pages[-1]}...")
+                
+                batch = await asyncio.gather(*(
+                    self._make_request_async(f"{search_url}&page={n}") for n in pages
+                ))
+                
+                for n, html in zip(pages, batch):
+                    if not html:
+                        print(f"Failed to fetch page {n}. Stopping.")
+                        done = True
+                        break
+                    
+                    page_events = self._parse_events_page(html)
+                    if not page_events:
+                        print("No more events found.")
+                        done = True
+                        break
+                    
+                    events.extend(page_events)
+                    print(f"Found {len(page_events)} events on page {n}. Total: {len(events)}")
+                    
+                    if len(events) >= limit:
+                        done = True
+                        break
+                
+                page += batch_size
+                per_page = max(len(events) // (page - 1), 1)
+                batch_size = min(self.max_concurrency, -(-(limit - len(events)) // per_page))
+        finally:
+            await self.aclose()
+        
+        events = events[:limit]
+        self.results = events
+        print(f"Scraping complete. Total events: {len(events)}")
+        return events
+    
     def scrape_events(self, 
                      category: Optional[str] = None,
                      location: Optional[str] = None,
@@ -177,22 +519,7 @@ class SeatGeekScraper:
     def _build_search_url(self, category: Optional[str], location: Optional[str],
                          date_from: Optional[str], date_to: Optional[str]) -> str:
         """Build search URL with parameters"""
-        url = f"{self.BASE_URL}/browse"
-        
-        params = []
-        if category:
-            params.append(f"type={quote(category)}")
-        if location:
-            params.append(f"location={quote(location)}")
-        if date_from:
-            params.append(f"datetime_utc.gte={date_from}")
-        if date_to:
-            params.append(f"datetime_utc.lte={date_to}")
-        
-        if params:
-            url += "?" + "&".join(params)
-        
-        return url
+        return _search_url(self.BASE_URL, category, location, date_from, date_to)
     
     def _parse_events_page(self, html: str) -> List[Dict]:
         """
@@ -205,14 +532,16 @@ class SeatGeekScraper:
             List of parsed event dictionaries
         """
         events = []
-        soup = BeautifulSoup(html, 'html.parser')
         
         # Note: This is a simplified parser. SeatGeek uses heavy JavaScript
         # and dynamic content loading, so a headless browser (Selenium/Playwright)
         # would be more reliable for production use.
         
-        # Example selectors (these may need to be updated based on actual HTML structure)
-        event_cards = soup.find_all('div', class_=['event-card', 'EventCard'])
+        # selectolax (C, Lexbor) when installed, BeautifulSoup otherwise
+        if HTMLParser is not None:
+            event_cards = HTMLParser(html).css(SEL_EVENT_CARD)
+        else:
+            event_cards = BeautifulSoup(html, 'html.parser').select(SEL_EVENT_CARD)
         
         for card in event_cards:
             try:
@@ -230,27 +559,27 @@ class SeatGeekScraper:
         Parse individual event card
         
         Args:
-            card: BeautifulSoup element for event card
+            card: selectolax or BeautifulSoup element for event card
             
         Returns:
             Event dictionary or None
         """
         try:
             # Extract event details (selectors are examples and may need adjustment)
-            title_elem = card.find(['h2', 'h3', 'a'], class_=['event-title', 'title'])
-            title = title_elem.text.strip() if title_elem else None
+            title_elem = _css_first(card, SEL_TITLE)
+            title = _node_text(title_elem) if title_elem else None
             
-            venue_elem = card.find(['span', 'div'], class_=['venue', 'location'])
-            venue = venue_elem.text.strip() if venue_elem else None
+            venue_elem = _css_first(card, SEL_VENUE)
+            venue = _node_text(venue_elem) if venue_elem else None
             
-            date_elem = card.find(['time', 'span'], class_=['date', 'datetime'])
-            date = date_elem.get('datetime', date_elem.text.strip()) if date_elem else None
+            date_elem = _css_first(card, SEL_DATE)
+            date = _node_attr(date_elem, 'datetime', _node_text(date_elem)) if date_elem else None
             
-            price_elem = card.find(['span', 'div'], class_=['price', 'ticket-price'])
-            price = price_elem.text.strip() if price_elem else None
+            price_elem = _css_first(card, SEL_PRICE)
+            price = _node_text(price_elem) if price_elem else None
             
-            link_elem = card.find('a', href=True)
-            url = urljoin(self.BASE_URL, link_elem['href']) if link_elem else None
+            link_elem = _css_first(card, SEL_LINK)
+            url = urljoin(self.BASE_URL, _node_attr(link_elem, 'href')) if link_elem else None
             
             event = {
                 'title': title,
@@ -267,6 +596,20 @@ class SeatGeekScraper:
             print(f"Error parsing event card: {e}")
             return None
     
+    def _results_payload(self, events: List[Dict]) -> bytes:
+        """Serialize events with run metadata to indented JSON bytes"""
+        output_data = {
+            'scrape_date': datetime.now().isoformat(),
+            'total_events': len(events),
+            'source': 'SeatGeek',
+            'scraped_by': 'Roundproxies.com Scraper',
+            'events': events
+        }
+        
+        if orjson is not None:
+            return orjson.dumps(output_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        return json.dumps(output_data, indent=2, ensure_ascii=False).encode('utf-8')
+    
     def save_results(self, events: Optional[List[Dict]] = None, 
                     output_path: str = "results/seatgeek_events.json"):
         """
@@ -277,19 +620,20 @@ class SeatGeekScraper:
             output_path: Output file path
         """
         events = events or self.results
+        write_file(output_path, self._results_payload(events))
         
-        output_data = {
-            'scrape_date': datetime.now().isoformat(),
-            'total_events': len(events),
-            'source': 'SeatGeek',
-            'scraped_by': 'Roundproxies.com Scraper',
-            'events': events
-        }
+        print(f"Results saved to {output_path}")
+    
+    def flush(self, output_path: str = "results/seatgeek_events.json"):
+        """
+        Write all accumulated results durably in a single write and fdatasync
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        Args:
+            output_path: Output file path
+        """
+        write_file(output_path, self._results_payload(self.results), sync=True)
         
-        print(f"Results saved to {output_path}")
+        print(f"Results flushed to {output_path}")
     
     def get_event_details(self, event_url: str) -> Optional[Dict]:
         """
@@ -4,10 +4,13 @@ Provided by Roundproxies.com
 """
 
 import unittest
+import asyncio
 import json
+import httpx
 import os
+import time
 from datetime import datetime
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 from pathlib import Path
 import sys
 
@@ -50,6 +53,12 @@ class TestSeatGeekScraper(unittest.TestCase):
         self.assertEqual(self.scraper.delay_max, 0.2)
         self.assertFalse(self.scraper.proxy_enabled)
     
+    def test_initialization_rejects_zero_concurrency(self):
+        """Test a concurrency cap below 1 is rejected instead of hanging"""
+        for value in (0, -1):
+            with self.assertRaises(ValueError):
+                SeatGeekScraper(config={'max_concurrency': value})
+    
     def test_initialization_with_proxy(self):
         """Test scraper initialization with proxy configuration"""
         config = {
@@ -87,6 +96,11 @@ class TestSeatGeekScraper(unittest.TestCase):
         self.assertIsNotNone(proxy)
         self.assertIn('http', proxy)
         self.assertIn('https', proxy)
+        
+        # Proxies are used round-robin
+        proxies = [scraper_with_proxy._get_proxy()['http'] for _ in range(4)]
+        self.assertEqual(sorted(proxies[:2]), ['http://proxy1.com:8080', 'http://proxy2.com:8080'])
+        self.assertEqual(proxies[:2], proxies[2:])
     
     def test_build_search_url(self):
         """Test search URL building"""
@@ -114,6 +128,17 @@ class TestSeatGeekScraper(unittest.TestCase):
         self.assertIn('datetime_utc.gte=2025-12-01', url)
         self.assertIn('datetime_utc.lte=2025-12-31', url)
     
+    def test_build_search_url_cached(self):
+        """Test repeated search URLs come from the cache"""
+        from seatgeek import _search_url
+        _search_url.cache_clear()
+        
+        first = self.scraper._build_search_url('comedy', 'Chicago', None, None)
+        second = self.scraper._build_search_url('comedy', 'Chicago', None, None)
+        
+        self.assertIs(first, second)
+        self.assertEqual(_search_url.cache_info().hits, 1)
+    
     def test_parse_event_card(self):
         """Test event card parsing"""
         # Mock HTML event card
@@ -175,6 +200,32 @@ class TestSeatGeekScraper(unittest.TestCase):
         self.assertEqual(len(data['events']), 2)
         self.assertEqual(data['events'][0]['title'], 'Test Event 1')
     
+    def test_flush(self):
+        """Test flush writes accumulated results with one fdatasync"""
+        self.scraper.results = [{'title': 'Test Event 1'}, {'title': 'Test Event 2'}]
+        output_path = 'results/test_output.json'
+        
+        with patch('seatgeek._fdatasync') as fdatasync:
+            self.scraper.flush(output_path)
+        
+        fdatasync.assert_called_once()
+        with open(output_path, 'r') as f:
+            data = json.load(f)
+        self.assertEqual(data['total_events'], 2)
+        self.assertEqual(data['events'], self.scraper.results)
+    
+    @patch('seatgeek.orjson', None)
+    def test_save_results_without_orjson(self):
+        """Test saving falls back to the standard json module"""
+        output_path = 'results/test_output.json'
+        self.scraper.save_results([{'title': 'Café Concert'}], output_path)
+        
+        with open(output_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        self.assertEqual(data['total_events'], 1)
+        self.assertEqual(data['events'][0]['title'], 'Café Concert')
+    
     @patch('seatgeek.requests.Session.request')
     def test_make_request_success(self, mock_request):
         """Test successful HTTP request"""
@@ -215,6 +266,145 @@ class TestSeatGeekScraper(unittest.TestCase):
         # Should return None after retries
         self.assertIsNone(response)
     
+    def test_scrape_events_async(self):
+        """Test concurrent page fetching stops at the first empty page"""
+        self.scraper.delay_min = self.scraper.delay_max = 0
+        self.scraper.max_concurrency = 3
+        card = '<div class="event-card"><h2 class="event-title">Event {}</h2></div>'
+        requested = []
+        active = 0
+        peak = 0
+        
+        async def fake_request(url):
+            nonlocal active, peak
+            page = int(url.rsplit('=', 1)[1])
+            requested.append(page)
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            if page > 4:
+                return '<html></html>'
+            return ''.join(card.format(f'{page}-{i}') for i in range(2))
+        
+        with patch.object(self.scraper, '_make_request_async', side_effect=fake_request):
+            events = asyncio.run(self.scraper.scrape_events_async('concerts', limit=50))
+        
+        self.assertEqual([e['title'] for e in events],
+                         [f'Event {p}-{i}' for p in range(1, 5) for i in range(2)])
+        self.assertEqual(requested[0], 1)
+        self.assertEqual(peak, 3)
+        self.assertEqual(self.scraper.results, events)
+    
+    def test_make_request_async_concurrency_cap(self):
+        """Test max_concurrency caps in-flight async requests"""
+        scraper = SeatGeekScraper(config={'delay_min': 0, 'delay_max': 0, 'max_concurrency': 2})
+        active = 0
+        peak = 0
+        
+        async def fake_request(client, method, url, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return httpx.Response(200, text='<html></html>')
+        
+        async def fetch_all():
+            try:
+                return await asyncio.gather(*(
+                    scraper._make_request_async(f'https://example.com/{i}') for i in range(6)
+                ))
+            finally:
+                await scraper.aclose()
+        
+        with patch('httpx.AsyncClient.request', new=fake_request):
+            results = asyncio.run(fetch_all())
+        
+        self.assertEqual(results, ['<html></html>'] * 6)
+        self.assertEqual(peak, 2)
+    
+    def test_make_request_async_retries(self):
+        """Test the async path retries after access denied and gives up on repeated errors"""
+        scraper = SeatGeekScraper(config={'delay_min': 0, 'delay_max': 0})
+        statuses = iter([403, 200])
+        
+        async def fake_request(client, method, url, **kwargs):
+            return httpx.Response(next(statuses), text='<html>ok</html>')
+        
+        async def failing_request(client, method, url, **kwargs):
+            raise httpx.ConnectError('connection refused')
+        
+        async def fetch(url):
+            try:
+                return await scraper._make_request_async(url)
+            finally:
+                await scraper.aclose()
+        
+        with patch('httpx.AsyncClient.request', new=fake_request):
+            self.assertEqual(asyncio.run(fetch('https://example.com')), '<html>ok</html>')
+        
+        with patch('httpx.AsyncClient.request', new=failing_request):
+            self.assertIsNone(asyncio.run(fetch('https://example.com')))
+    
+    def test_client_keepalive_outlasts_delay(self):
+        """Test idle connections survive the delay between requests"""
+        self.assertGreater(self.scraper._keepalive_expiry(), self.scraper.delay_max)
+        
+        scraper = SeatGeekScraper(config={'delay_min': 20, 'delay_max': 40})
+        self.assertGreater(scraper._keepalive_expiry(), scraper.delay_max)
+    
+    def test_throttle_per_host(self):
+        """Test the async delay is tracked separately per host"""
+        scraper = SeatGeekScraper(config={'delay_min': 2, 'delay_max': 2})
+        
+        with patch('seatgeek.asyncio.sleep', new_callable=AsyncMock) as sleep:
+            asyncio.run(scraper._throttle('https://seatgeek.com/browse?page=1'))
+            sleep.assert_not_called()
+            
+            asyncio.run(scraper._throttle('https://seatgeek.com/browse?page=2'))
+            self.assertAlmostEqual(sleep.call_args[0][0], 2, delta=0.5)
+            
+            asyncio.run(scraper._throttle('https://api.seatgeek.com/2/events'))
+            self.assertEqual(sleep.call_count, 1)
+    
+    def test_throttle_concurrent_requests_spaced(self):
+        """Test concurrent requests to one host go out delay_min apart, not together"""
+        scraper = SeatGeekScraper(config={'delay_min': 0.05, 'delay_max': 0.05})
+        sent = []
+        
+        async def request(page):
+            await scraper._throttle(f'https://seatgeek.com/browse?page={page}')
+            sent.append(time.monotonic())
+        
+        async def run():
+            await asyncio.gather(*(request(page) for page in range(4)))
+            await asyncio.gather(*(request(page) for page in range(4, 8)))
+        
+        asyncio.run(run())
+        
+        gaps = [b - a for a, b in zip(sent, sent[1:])]
+        self.assertEqual(len(gaps), 7)
+        for gap in gaps:
+            self.assertGreaterEqual(gap, 0.04)
+    
+    def test_scrape_events_async_limit(self):
+        """Test the async scraper only requests the pages it needs"""
+        self.scraper.delay_min = self.scraper.delay_max = 0
+        card = '<div class="event-card"><h2 class="event-title">Event {}</h2></div>'
+        requested = []
+        
+        async def fake_request(url):
+            page = int(url.rsplit('=', 1)[1])
+            requested.append(page)
+            return ''.join(card.format(f'{page}-{i}') for i in range(4))
+        
+        with patch.object(self.scraper, '_make_request_async', side_effect=fake_request):
+            events = asyncio.run(self.scraper.scrape_events_async('concerts', limit=10))
+        
+        self.assertEqual(len(events), 10)
+        self.assertEqual(sorted(requested), [1, 2, 3])
+    
     def test_parse_events_page_empty(self):
         """Test parsing empty page"""
         html = '<html><body></body></html>'
@@ -248,6 +438,52 @@ class TestSeatGeekScraper(unittest.TestCase):
         # Note: May be 0 if selectors don't match the test HTML
         # This is expected as real HTML structure may differ
     
+    def test_parse_events_page_backends(self):
+        """Test selectolax and BeautifulSoup parsing give the same events"""
+        import seatgeek
+        html = """
+        <div class="EventCard">
+            <h3 class="title">Late Show</h3>
+            <div class="location">Comedy Cellar</div>
+            <span class="date">Friday</span>
+            <div class="ticket-price">$30</div>
+            <a href="/late-show-tickets">Tickets</a>
+        </div>
+        <div class="event-card">
+            <h2 class="event-title">Test Concert</h2>
+            <span class="venue">Madison Square Garden</span>
+            <time class="date" datetime="2025-12-15">December 15, 2025</time>
+            <span class="price">$50-$150</span>
+        </div>
+        """
+        expected = [
+            {
+                'title': 'Late Show',
+                'venue': 'Comedy Cellar',
+                'date': 'Friday',
+                'price': '$30',
+                'url': 'https://seatgeek.com/late-show-tickets'
+            },
+            {
+                'title': 'Test Concert',
+                'venue': 'Madison Square Garden',
+                'date': '2025-12-15',
+                'price': '$50-$150',
+                'url': None
+            }
+        ]
+        
+        backends = [None]
+        if seatgeek.HTMLParser is not None:
+            backends.append(seatgeek.HTMLParser)
+        
+        for backend in backends:
+            with self.subTest(backend=backend), patch('seatgeek.HTMLParser', backend):
+                events = self.scraper._parse_events_page(html)
+                for event in events:
+                    event.pop('scraped_at')
+                self.assertEqual(events, expected)
+    
     def test_results_attribute(self):
         """Test results storage in scraper object"""
         self.assertEqual(len(self.scraper.results), 0)
@@ -120,8 +120,19 @@ async def example_6_multiple_companies():
     )
     
     for company, reviews in results.items():
-        avg_rating = sum(r['rating'] for r in reviews) / len(reviews) if reviews else 0
-        print(f"{company}: {len(reviews)} reviews, avg rating: {avg_rating:.2f}/5")
+        # Rating and verified tallies in one pass over the reviews
+        rated = rating_sum = verified = 0
+        for r in reviews:
+            rating = r.get('rating')
+            if rating:
+                rated += 1
+                rating_sum += rating
+            if r.get('verified'):
+                verified += 1
+        
+        avg_rating = rating_sum / rated if rated else 0
+        print(f"{company}: {len(reviews)} reviews ({verified} verified), "
+              f"avg rating: {avg_rating:.2f}/5")
 
 
 async def example_7_category_scraping():
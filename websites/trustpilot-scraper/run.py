@@ -10,21 +10,85 @@ Usage:
 import argparse
 import asyncio
 import json
+import re
 import sys
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import List, Optional
 
-from trustpilot import TrustpilotScraper
+from trustpilot import CircuitBreaker, ProxyPool, TokenBucket, TrustpilotScraper
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def load_proxies_from_file(filepath: str) -> List[str]:
-    """Load proxy list from file (one proxy per line)"""
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Output buffer size; large enough that big result sets go out in few writes
+WRITE_BUFFER_SIZE = 64 * 1024
+
+# Output filename timestamp; every file from one run shares it
+TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+# Company profiles kept between runs, inside the output directory
+PROFILE_CACHE_FILE = ".profile_cache.json"
+
+# Category pages are cached here for six hours unless --no-cache is given
+CATEGORY_CACHE_DIR = Path.home() / ".cache" / "trustpilot"
+
+# Raw responses are cached for an hour with --cache-responses
+RESPONSE_CACHE_DIR = CATEGORY_CACHE_DIR / "responses"
+
+# scheme://[user:pass@]host:port, where host may be a bracketed IPv6 address
+_PROXY_RE = re.compile(
+    r'^(?:https?|socks5h?)://(?:[^:@/]+:[^@/]+@)?'
+    r'(?:[^:@/\[\]]+|\[[0-9a-fA-F:]+\]):\d+/?$'
+)
+
+
+def load_proxies_from_file(filepath: str) -> ProxyPool:
+    """
+    Load a proxy pool from file
+    
+    Plain files hold one proxy per line; .json files hold a JSON array of
+    proxy URLs, as exported by most proxy provider APIs. Malformed URLs are
+    dropped with a warning rather than failing at request time.
+    """
     try:
-        with open(filepath, 'r') as f:
-            proxies = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-        print(f"✅ Loaded {len(proxies)} proxies from {filepath}")
-        return proxies
+        if filepath.endswith('.json'):
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            if not isinstance(data, list):
+                raise ValueError("JSON proxy file must contain an array of proxy URLs")
+            entries = [str(entry).strip() for entry in data if str(entry).strip()]
+        else:
+            with open(filepath, 'r') as f:
+                entries = _read_entries(f)
+        
+        valid = []
+        for entry in entries:
+            if _PROXY_RE.match(entry):
+                valid.append(entry)
+            else:
+                print(f"⚠️  Skipping malformed proxy: {entry}")
+        
+        # Proxy URLs can carry case-sensitive credentials, so they're only deduplicated
+        proxies = list(dict.fromkeys(valid))
+        pool = ProxyPool(proxies)
+        print(f"✅ Loaded {len(pool)} proxies from {filepath}" + _duplicates_note(valid, proxies))
+        return pool
     except FileNotFoundError:
         print(f"❌ Proxy file not found: {filepath}")
         sys.exit(1)
@@ -33,45 +97,178 @@ def load_proxies_from_file(filepath: str) -> List[str]:
         sys.exit(1)
 
 
-def save_results(data: dict, output_dir: str = "results"):
-    """Save scraping results to JSON file"""
-    # Create results directory
+def _read_entries(lines) -> List[str]:
+    """Stripped non-empty lines, skipping # comments"""
+    stripped = (line.strip() for line in lines)
+    return [line for line in stripped if line and not line.startswith('#')]
+
+
+def _duplicates_note(entries: List[str], unique: List[str]) -> str:
+    """Describe how many duplicate entries were dropped, if any"""
+    dropped = len(entries) - len(unique)
+    return f" ({dropped} duplicate{'s' if dropped != 1 else ''} skipped)" if dropped else ""
+
+
+def results_dir(output_dir: str) -> Path:
+    """
+    Create the output directory once for a run
+    
+    The save helpers below expect it to exist and don't create it again.
+    
+    Returns:
+        The directory's resolved path
+    """
     results_path = Path(output_dir)
-    results_path.mkdir(exist_ok=True)
+    results_path.mkdir(parents=True, exist_ok=True)
+    return results_path.resolve()
+
+
+def read_profile_cache(results_path: Path) -> dict:
+    """Load company profiles cached by earlier runs (empty if none)"""
+    try:
+        with open(results_path / PROFILE_CACHE_FILE, 'rb') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def write_profile_cache(scraper: TrustpilotScraper, results_path: Path):
+    """Persist the scraper's unexpired company profiles for the next run"""
+    with open(results_path / PROFILE_CACHE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(scraper.export_profile_cache(), f, ensure_ascii=False)
+
+
+def make_rate_limiter(args) -> Optional[TokenBucket]:
+    """Adaptive limiter for --rate, or None to keep the random per-request delay"""
+    return TokenBucket(args.rate) if args.rate else None
+
+
+def make_circuit_breaker(args) -> Optional[CircuitBreaker]:
+    """Breaker for --circuit-breaker, or None to retry every request in full"""
+    return CircuitBreaker(args.circuit_breaker) if args.circuit_breaker else None
+
+
+def _open_output(filename: Path, compress: Optional[str] = None):
+    """Open an output file for buffered binary writing, zstd-compressed if asked"""
+    f = open(filename, 'wb', buffering=WRITE_BUFFER_SIZE)
+    if compress == 'zstd':
+        # Closing the stream writer also closes f
+        return zstandard.ZstdCompressor(level=3, threads=-1).stream_writer(f)
+    return f
+
+
+def _with_suffix(filename: Path, compress: Optional[str]) -> Path:
+    """Add the compressed-file suffix (e.g. .jsonl -> .jsonl.zst)"""
+    if compress == 'zstd':
+        return filename.with_name(filename.name + '.zst')
+    return filename
+
+
+def save_results(
+    data: dict,
+    results_path: Path,
+    compress: Optional[str] = None,
+    ts: Optional[str] = None,
+    pretty: bool = False,
+    quiet: bool = False
+):
+    """
+    Save scraping results to JSON file
     
+    ts is the run timestamp (defaults to now), pretty indents the output and
+    quiet skips the confirmation message.
+    """
     # Generate filename with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = results_path / f"trustpilot_results_{timestamp}.json"
+    timestamp = ts or datetime.now().strftime(TIMESTAMP_FORMAT)
+    filename = _with_suffix(results_path / f"trustpilot_results_{timestamp}.json", compress)
     
-    # Save data
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # Save data (orjson emits UTF-8 bytes directly when installed); compact
+    # unless asked, since indenting roughly doubles the file
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        payload = orjson.dumps(data, option=option)
+    else:
+        payload = json.dumps(data, ensure_ascii=False, indent=2 if pretty else None).encode('utf-8')
     
-    print(f"\n💾 Results saved to: {filename}")
+    with _open_output(filename, compress) as f:
+        f.write(payload)
+    
+    if not quiet:
+        print(f"\n💾 Results saved to: {filename}")
     return filename
 
 
-def save_reviews_jsonl(reviews: List[dict], company: str, output_dir: str = "results"):
-    """Save reviews to JSONL format"""
-    results_path = Path(output_dir)
-    results_path.mkdir(exist_ok=True)
-    
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+def _jsonl_line(record: dict) -> bytes:
+    """Encode one record as a UTF-8 JSONL line"""
+    if orjson is not None:
+        return orjson.dumps(record) + b'\n'
+    return (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+def _jsonl_path(
+    company: str,
+    results_path: Path,
+    compress: Optional[str] = None,
+    ts: Optional[str] = None
+) -> Path:
+    """Build a timestamped JSONL filename for a company's reviews"""
+    timestamp = ts or datetime.now().strftime(TIMESTAMP_FORMAT)
     filename = results_path / f"reviews_{company.replace('.', '_')}_{timestamp}.jsonl"
+    return _with_suffix(filename, compress)
+
+
+def save_reviews_jsonl(
+    reviews: List[dict],
+    company: str,
+    results_path: Path,
+    compress: Optional[str] = None,
+    ts: Optional[str] = None,
+    quiet: bool = False
+):
+    """Save reviews to JSONL format (ts: run timestamp, defaults to now; quiet: no message)"""
+    filename = _jsonl_path(company, results_path, compress, ts)
     
-    with open(filename, 'w', encoding='utf-8') as f:
-        for review in reviews:
-            f.write(json.dumps(review, ensure_ascii=False) + '\n')
+    # One writelines pass through a 64 KB buffer instead of a write per review
+    with _open_output(filename, compress) as f:
+        f.writelines(_jsonl_line(review) for review in reviews)
     
-    print(f"💾 Reviews saved to: {filename}")
+    if not quiet:
+        print(f"💾 Reviews saved to: {filename}")
     return filename
 
 
+class JsonlWriter:
+    """Append records to a JSONL file as they arrive"""
+    
+    def __init__(self, f):
+        self._f = f
+    
+    async def write(self, record: dict):
+        """Write one record; it lands in the 64 KB buffer, not straight on disk"""
+        self._f.write(_jsonl_line(record))
+
+
+@asynccontextmanager
+async def open_jsonl_writer(filename: Path, compress: Optional[str] = None):
+    """Open a buffered JSONL writer for streaming records to filename"""
+    with _open_output(filename, compress) as f:
+        yield JsonlWriter(f)
+
+
+def _quiet(*args, **kwargs):
+    """Drop a console message (stands in for print under --quiet)"""
+
+
 async def scrape_single_company(args):
     """Scrape a single company's reviews"""
-    print(f"\n{'=' * 60}")
-    print(f"🎯 SCRAPING COMPANY: {args.company}")
-    print(f"{'=' * 60}\n")
+    run_ts = datetime.now().strftime(TIMESTAMP_FORMAT)
+    results_path = results_dir(args.output)
+    log = _quiet if args.quiet else print
+    log(f"\n{'=' * 60}")
+    log(f"🎯 SCRAPING COMPANY: {args.company}")
+    log(f"{'=' * 60}\n")
     
     # Load proxies if specified
     proxies = None
@@ -81,67 +278,100 @@ async def scrape_single_company(args):
         proxies = args.proxy
     
     # Initialize scraper
-    scraper = TrustpilotScraper(
+    async with TrustpilotScraper(
         proxies=proxies,
         max_workers=args.workers,
         request_delay=(args.min_delay, args.max_delay),
+        rate_limiter=make_rate_limiter(args),
+        circuit_breaker=make_circuit_breaker(args),
+        response_cache_dir=RESPONSE_CACHE_DIR if args.cache_responses else None,
         timeout=args.timeout
-    )
-    
-    try:
-        # Scrape company profile
-        if not args.skip_profile:
-            print("📋 Fetching company profile...")
-            profile = await scraper.scrape_company_profile(args.company)
-            print(f"✅ Profile: {profile['name']} - {profile['trust_score']} stars "
-                  f"({profile['total_reviews']} reviews)\n")
-        
-        # Scrape reviews
-        reviews = await scraper.scrape_company_reviews(
-            args.company,
-            max_pages=args.pages,
-            sort=args.sort,
-            stars=args.stars,
-            verified_only=args.verified_only
-        )
-        
-        # Save results
-        if args.format == 'json':
-            result_data = {
-                'company': args.company,
-                'profile': profile if not args.skip_profile else None,
-                'reviews': reviews,
-                'scraped_at': datetime.now().isoformat(),
-                'total_reviews': len(reviews)
-            }
-            save_results(result_data, args.output)
-        else:  # jsonl
-            save_reviews_jsonl(reviews, args.company, args.output)
-        
-        # Print summary
-        print(f"\n{'=' * 60}")
-        print(f"✨ SCRAPING COMPLETE!")
-        print(f"{'=' * 60}")
-        print(f"Total Reviews: {len(reviews)}")
-        if reviews:
-            ratings = [r['rating'] for r in reviews if r.get('rating')]
-            if ratings:
-                avg_rating = sum(ratings) / len(ratings)
-                print(f"Average Rating: {avg_rating:.2f} / 5.0")
-            verified = sum(1 for r in reviews if r.get('verified'))
-            print(f"Verified Reviews: {verified} ({verified/len(reviews)*100:.1f}%)")
-        print(f"{'=' * 60}\n")
-        
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        sys.exit(1)
+    ) as scraper:
+        try:
+            # Scrape company profile (reused from an earlier run for up to an hour)
+            if not args.skip_profile:
+                log("📋 Fetching company profile...")
+                scraper.load_profile_cache(read_profile_cache(results_path))
+                profile = await scraper.scrape_company_profile(args.company)
+                write_profile_cache(scraper, results_path)
+                log(f"✅ Profile: {profile['name']} - {profile['trust_score']} stars "
+                    f"({profile['total_reviews']} reviews)\n")
+            
+            # Review filters are fixed for the run, so build them once
+            filters = MappingProxyType({
+                'sort': args.sort,
+                'stars': args.stars,
+                'verified_only': args.verified_only
+            })
+            review_iter = scraper.iter_company_reviews(
+                args.company, max_pages=args.pages, **filters
+            )
+            
+            # Running tallies for the summary, so reviews needn't be kept around
+            total = verified = rated = rating_sum = 0
+            
+            def tally(review: dict):
+                nonlocal total, verified, rated, rating_sum
+                total += 1
+                if review.get('verified'):
+                    verified += 1
+                rating = review.get('rating')
+                if rating:
+                    rated += 1
+                    rating_sum += rating
+            
+            # Scrape reviews and save results
+            if args.format == 'json':
+                # A single JSON document needs every review before it's written
+                reviews = []
+                async for review in review_iter:
+                    tally(review)
+                    reviews.append(review)
+                
+                result_data = {
+                    'company': args.company,
+                    'profile': profile if not args.skip_profile else None,
+                    'reviews': reviews,
+                    'scraped_at': datetime.now().isoformat(),
+                    'total_reviews': len(reviews)
+                }
+                save_results(
+                    result_data, results_path, args.compress,
+                    ts=run_ts, pretty=args.pretty, quiet=args.quiet
+                )
+            else:  # jsonl, streamed to disk page by page
+                filename = _jsonl_path(args.company, results_path, args.compress, ts=run_ts)
+                async with open_jsonl_writer(filename, args.compress) as writer:
+                    async for review in review_iter:
+                        tally(review)
+                        await writer.write(review)
+                log(f"💾 Reviews saved to: {filename}")
+            
+            # Print summary
+            log(f"\n{'=' * 60}")
+            log(f"✨ SCRAPING COMPLETE!")
+            log(f"{'=' * 60}")
+            log(f"Total Reviews: {total}")
+            if total:
+                if rated:
+                    avg_rating = rating_sum / rated
+                    log(f"Average Rating: {avg_rating:.2f} / 5.0")
+                log(f"Verified Reviews: {verified} ({verified/total*100:.1f}%)")
+            log(f"{'=' * 60}\n")
+            
+        except Exception as e:
+            print(f"\n❌ Error: {e}")
+            sys.exit(1)
 
 
 async def scrape_search(args):
     """Search and scrape companies"""
-    print(f"\n{'=' * 60}")
-    print(f"🔍 SEARCHING: {args.search}")
-    print(f"{'=' * 60}\n")
+    run_ts = datetime.now().strftime(TIMESTAMP_FORMAT)
+    results_path = results_dir(args.output)
+    log = _quiet if args.quiet else print
+    log(f"\n{'=' * 60}")
+    log(f"🔍 SEARCHING: {args.search}")
+    log(f"{'=' * 60}\n")
     
     # Load proxies if specified
     proxies = None
@@ -150,46 +380,54 @@ async def scrape_search(args):
     elif args.proxy:
         proxies = args.proxy
     
-    scraper = TrustpilotScraper(
+    async with TrustpilotScraper(
         proxies=proxies,
         max_workers=args.workers,
-        request_delay=(args.min_delay, args.max_delay)
-    )
-    
-    try:
-        # Search for companies
-        companies = await scraper.search_companies(args.search, pages=args.pages)
-        
-        # Save results
-        result_data = {
-            'search_query': args.search,
-            'companies': companies,
-            'total_found': len(companies),
-            'scraped_at': datetime.now().isoformat()
-        }
-        filename = save_results(result_data, args.output)
-        
-        # Print summary
-        print(f"\n{'=' * 60}")
-        print(f"✨ SEARCH COMPLETE!")
-        print(f"{'=' * 60}")
-        print(f"Companies Found: {len(companies)}")
-        if companies:
-            avg_score = sum(c.get('score', 0) for c in companies) / len(companies)
-            print(f"Average Trust Score: {avg_score:.2f}")
-        print(f"Results saved to: {filename}")
-        print(f"{'=' * 60}\n")
-        
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        sys.exit(1)
+        request_delay=(args.min_delay, args.max_delay),
+        rate_limiter=make_rate_limiter(args),
+        circuit_breaker=make_circuit_breaker(args),
+        response_cache_dir=RESPONSE_CACHE_DIR if args.cache_responses else None
+    ) as scraper:
+        try:
+            # Search for companies
+            companies = await scraper.search_companies(args.search, pages=args.pages)
+            
+            # Save results
+            result_data = {
+                'search_query': args.search,
+                'companies': companies,
+                'total_found': len(companies),
+                'scraped_at': datetime.now().isoformat()
+            }
+            filename = save_results(
+                result_data, results_path, args.compress,
+                ts=run_ts, pretty=args.pretty, quiet=args.quiet
+            )
+            
+            # Print summary
+            log(f"\n{'=' * 60}")
+            log(f"✨ SEARCH COMPLETE!")
+            log(f"{'=' * 60}")
+            log(f"Companies Found: {len(companies)}")
+            if companies:
+                avg_score = sum(c.get('score', 0) for c in companies) / len(companies)
+                log(f"Average Trust Score: {avg_score:.2f}")
+            log(f"Results saved to: {filename}")
+            log(f"{'=' * 60}\n")
+            
+        except Exception as e:
+            print(f"\n❌ Error: {e}")
+            sys.exit(1)
 
 
 async def scrape_category(args):
     """Scrape companies from a category"""
-    print(f"\n{'=' * 60}")
-    print(f"📂 SCRAPING CATEGORY: {args.category}")
-    print(f"{'=' * 60}\n")
+    run_ts = datetime.now().strftime(TIMESTAMP_FORMAT)
+    results_path = results_dir(args.output)
+    log = _quiet if args.quiet else print
+    log(f"\n{'=' * 60}")
+    log(f"📂 SCRAPING CATEGORY: {args.category}")
+    log(f"{'=' * 60}\n")
     
     # Load proxies if specified
     proxies = None
@@ -198,51 +436,64 @@ async def scrape_category(args):
     elif args.proxy:
         proxies = args.proxy
     
-    scraper = TrustpilotScraper(
+    async with TrustpilotScraper(
         proxies=proxies,
         max_workers=args.workers,
-        request_delay=(args.min_delay, args.max_delay)
-    )
-    
-    try:
-        companies = await scraper.scrape_category(
-            args.category,
-            pages=args.pages,
-            min_reviews=args.min_reviews
-        )
-        
-        # Save results
-        result_data = {
-            'category': args.category,
-            'companies': companies,
-            'total_found': len(companies),
-            'scraped_at': datetime.now().isoformat()
-        }
-        filename = save_results(result_data, args.output)
-        
-        print(f"\n{'=' * 60}")
-        print(f"✨ CATEGORY SCRAPING COMPLETE!")
-        print(f"{'=' * 60}")
-        print(f"Companies Found: {len(companies)}")
-        print(f"Results saved to: {filename}")
-        print(f"{'=' * 60}\n")
-        
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        sys.exit(1)
+        request_delay=(args.min_delay, args.max_delay),
+        rate_limiter=make_rate_limiter(args),
+        circuit_breaker=make_circuit_breaker(args),
+        response_cache_dir=RESPONSE_CACHE_DIR if args.cache_responses else None,
+        category_cache_dir=None if args.no_cache else CATEGORY_CACHE_DIR
+    ) as scraper:
+        try:
+            companies = await scraper.scrape_category(
+                args.category,
+                pages=args.pages,
+                min_reviews=args.min_reviews
+            )
+            
+            # Save results
+            result_data = {
+                'category': args.category,
+                'companies': companies,
+                'total_found': len(companies),
+                'scraped_at': datetime.now().isoformat()
+            }
+            filename = save_results(
+                result_data, results_path, args.compress,
+                ts=run_ts, pretty=args.pretty, quiet=args.quiet
+            )
+            
+            log(f"\n{'=' * 60}")
+            log(f"✨ CATEGORY SCRAPING COMPLETE!")
+            log(f"{'=' * 60}")
+            log(f"Companies Found: {len(companies)}")
+            log(f"Results saved to: {filename}")
+            log(f"{'=' * 60}\n")
+            
+        except Exception as e:
+            print(f"\n❌ Error: {e}")
+            sys.exit(1)
 
 
 async def scrape_multiple(args):
     """Scrape multiple companies from file"""
-    print(f"\n{'=' * 60}")
-    print(f"📋 SCRAPING MULTIPLE COMPANIES")
-    print(f"{'=' * 60}\n")
+    run_ts = datetime.now().strftime(TIMESTAMP_FORMAT)
+    results_path = results_dir(args.output)
+    log = _quiet if args.quiet else print
+    log(f"\n{'=' * 60}")
+    log(f"📋 SCRAPING MULTIPLE COMPANIES")
+    log(f"{'=' * 60}\n")
     
     # Load company list
     try:
         with open(args.company_file, 'r') as f:
-            companies = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-        print(f"✅ Loaded {len(companies)} companies from {args.company_file}\n")
+            entries = _read_entries(f)
+        
+        # Domains are case-insensitive; a repeated company would be scraped twice
+        companies = list(dict.fromkeys(entry.lower() for entry in entries))
+        log(f"✅ Loaded {len(companies)} companies from {args.company_file}"
+            f"{_duplicates_note(entries, companies)}\n")
     except FileNotFoundError:
         print(f"❌ Company file not found: {args.company_file}")
         sys.exit(1)
@@ -254,40 +505,69 @@ async def scrape_multiple(args):
     elif args.proxy:
         proxies = args.proxy
     
-    scraper = TrustpilotScraper(
+    async with TrustpilotScraper(
         proxies=proxies,
         max_workers=args.workers,
-        request_delay=(args.min_delay, args.max_delay)
-    )
-    
-    try:
-        # Scrape all companies
-        results = await scraper.scrape_multiple_companies(
-            companies,
-            max_pages_per_company=args.pages
-        )
-        
-        # Save results
-        result_data = {
-            'companies': list(results.keys()),
-            'results': results,
-            'total_companies': len(results),
-            'total_reviews': sum(len(reviews) for reviews in results.values()),
-            'scraped_at': datetime.now().isoformat()
-        }
-        filename = save_results(result_data, args.output)
-        
-        print(f"\n{'=' * 60}")
-        print(f"✨ BATCH SCRAPING COMPLETE!")
-        print(f"{'=' * 60}")
-        print(f"Companies Scraped: {len(results)}")
-        print(f"Total Reviews: {result_data['total_reviews']}")
-        print(f"Results saved to: {filename}")
-        print(f"{'=' * 60}\n")
-        
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        sys.exit(1)
+        request_delay=(args.min_delay, args.max_delay),
+        rate_limiter=make_rate_limiter(args),
+        circuit_breaker=make_circuit_breaker(args),
+        response_cache_dir=RESPONSE_CACHE_DIR if args.cache_responses else None
+    ) as scraper:
+        try:
+            # Companies arrive as each one finishes
+            company_results = scraper.iter_company_results(
+                companies,
+                max_pages_per_company=args.pages
+            )
+            total_companies = total_reviews = 0
+            
+            if args.format == 'json':
+                # A single JSON document needs every company before it's written
+                results = {}
+                async for company, reviews in company_results:
+                    results[company] = reviews
+                    total_companies += 1
+                    total_reviews += len(reviews)
+                
+                result_data = {
+                    'companies': list(results.keys()),
+                    'results': results,
+                    'total_companies': total_companies,
+                    'total_reviews': total_reviews,
+                    'scraped_at': datetime.now().isoformat()
+                }
+                filename = save_results(
+                    result_data, results_path, args.compress,
+                    ts=run_ts, pretty=args.pretty, quiet=args.quiet
+                )
+            else:  # jsonl, one file per company written as soon as it's done
+                async for company, reviews in company_results:
+                    save_reviews_jsonl(
+                        reviews, company, results_path, args.compress,
+                        ts=run_ts, quiet=args.quiet
+                    )
+                    total_companies += 1
+                    total_reviews += len(reviews)
+                filename = results_path
+            
+            log(f"\n{'=' * 60}")
+            log(f"✨ BATCH SCRAPING COMPLETE!")
+            log(f"{'=' * 60}")
+            log(f"Companies Scraped: {total_companies}")
+            log(f"Total Reviews: {total_reviews}")
+            log(f"Results saved to: {filename}")
+            log(f"{'=' * 60}\n")
+            
+        except Exception as e:
+            print(f"\n❌ Error: {e}")
+            sys.exit(1)
+
+
+def run_async(coro):
+    """Run a coroutine on uvloop's event loop when installed, stock asyncio otherwise"""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
 
 
 def main():
@@ -314,7 +594,13 @@ Examples:
 
   # Filter reviews
   python run.py --company amazon.com --stars 1 --verified-only
-        """
+
+  # Compressed JSONL output (.jsonl.zst)
+  python run.py --company amazon.com --compress zstd
+
+  # A single indented JSON document instead of JSONL
+  python run.py --company amazon.com --format json --pretty
+"""
     )
     
     # Mode selection
@@ -327,13 +613,24 @@ Examples:
     # Common options
     parser.add_argument('--pages', type=int, default=10, help='Number of pages to scrape (default: 10)')
     parser.add_argument('--output', type=str, default='results', help='Output directory (default: results)')
-    parser.add_argument('--format', choices=['json', 'jsonl'], default='json', help='Output format (default: json)')
+    parser.add_argument('--format', choices=['json', 'jsonl'], default='jsonl',
+                       help='Output format (default: jsonl)')
+    parser.add_argument('--pretty', action='store_true',
+                       help='Indent JSON output (compact by default)')
+    parser.add_argument('--quiet', action='store_true',
+                       help='Skip banners and summaries (errors are still shown)')
+    parser.add_argument('--compress', choices=['zstd'],
+                       help='Compress output files (writes .zst, needs zstandard)')
     
     # Scraper configuration
     parser.add_argument('--workers', type=int, default=5, help='Number of concurrent workers (default: 5)')
     parser.add_argument('--min-delay', type=float, default=1.0, help='Minimum delay between requests (default: 1.0s)')
     parser.add_argument('--max-delay', type=float, default=3.0, help='Maximum delay between requests (default: 3.0s)')
     parser.add_argument('--timeout', type=int, default=30, help='Request timeout in seconds (default: 30)')
+    parser.add_argument('--rate', type=float,
+                       help='Starting requests/sec for adaptive pacing; replaces --min/--max-delay')
+    parser.add_argument('--circuit-breaker', type=int, metavar='N',
+                       help='Stop sending requests for 30s after N consecutive failures')
     
     # Proxy options
     parser.add_argument('--proxy', type=str, nargs='+', help='Proxy URLs (space-separated)')
@@ -350,19 +647,28 @@ Examples:
     # Category options
     parser.add_argument('--min-reviews', type=int, default=0, 
                        help='Minimum number of reviews for category scraping (default: 0)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always refetch category pages '
+                            'instead of reusing ~/.cache/trustpilot (6h TTL)')
+    parser.add_argument('--cache-responses', action='store_true',
+                       help='Reuse pages fetched within the last hour '
+                            'from ~/.cache/trustpilot/responses')
     
     args = parser.parse_args()
     
+    if args.compress == 'zstd' and zstandard is None:
+        parser.error("--compress zstd requires zstandard (pip install 'trustpilot-scraper[zstd]')")
+    
     # Route to appropriate function
     try:
         if args.company:
-            asyncio.run(scrape_single_company(args))
+            run_async(scrape_single_company(args))
         elif args.search:
-            asyncio.run(scrape_search(args))
+            run_async(scrape_search(args))
         elif args.category:
-            asyncio.run(scrape_category(args))
+            run_async(scrape_category(args))
         elif args.company_file:
-            asyncio.run(scrape_multiple(args))
+            run_async(scrape_multiple(args))
     except KeyboardInterrupt:
         print("\n\n⚠️  Scraping interrupted by user")
         sys.exit(0)
@@ -7,12 +7,22 @@ Run with coverage: pytest test.py --cov=trustpilot --cov-report=html
 
 import asyncio
 import json
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
+import respx
 
-from trustpilot import TrustpilotScraper, TrustpilotScraperMonitor
+import run
+from trustpilot import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ProxyPool,
+    TokenBucket,
+    TrustpilotScraper,
+    TrustpilotScraperMonitor
+)
 
 
 # Test fixtures
@@ -112,6 +122,16 @@ def mock_api_response():
     }
 
 
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run the async tests on uvloop when it's installed, as run.py does"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
 @pytest.fixture
 def scraper():
     """Create a basic scraper instance"""
@@ -180,6 +200,186 @@ class TestTrustpilotScraperMonitor:
         assert stats["success_rate"] == pytest.approx(0.667, rel=0.01)
         assert stats["avg_response_time"] == pytest.approx(2.167, rel=0.01)
         assert stats["total_requests"] == 3
+    
+    def test_window_wraparound(self):
+        """Test the oldest requests fall out of the window and its running totals"""
+        monitor = TrustpilotScraperMonitor(window_size=10)
+        for i in range(15):
+            monitor._record(i >= 5, float(i))
+        
+        assert list(monitor.response_times) == [float(i) for i in range(5, 15)]
+        assert monitor._ok_sum == sum(monitor.success_rate) == 10
+        assert monitor._time_sum == pytest.approx(sum(monitor.response_times))
+
+
+# Tests for TokenBucket
+class TestTokenBucket:
+    """Test adaptive request pacing"""
+    
+    def test_rate_adapts(self):
+        """Test the rate rises additively and halves on throttling, within bounds"""
+        bucket = TokenBucket(2.0, min_rate=0.5, max_rate=2.2, step=0.1)
+        bucket.on_success()
+        assert bucket.rate == pytest.approx(2.1)
+        bucket.on_success()
+        bucket.on_success()
+        assert bucket.rate == pytest.approx(2.2)
+        
+        for _ in range(5):
+            bucket.on_throttle()
+        assert bucket.rate == 0.5
+    
+    @pytest.mark.asyncio
+    async def test_acquire_paces_requests(self):
+        """Test concurrent callers are spaced out at the bucket's rate"""
+        bucket = TokenBucket(50.0, capacity=1.0)
+        
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(6)))
+        elapsed = time.monotonic() - start
+        
+        # The first token is free; the other five come 20 ms apart
+        assert 0.09 <= elapsed < 0.3
+    
+    def test_rate_must_be_positive(self):
+        """Test a zero rate is rejected"""
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+    
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_scraper_feeds_back_to_limiter(self):
+        """Test the scraper slows its limiter on 429 and speeds it up on success"""
+        bucket = TokenBucket(100.0, step=1.0)
+        scraper = TrustpilotScraper(rate_limiter=bucket)
+        respx.get("https://example.com").mock(side_effect=[
+            httpx.Response(429),
+            httpx.Response(200, text="ok")
+        ])
+        
+        with patch('asyncio.sleep', new=AsyncMock()):
+            async with scraper:
+                await scraper._make_request("https://example.com")
+        
+        assert bucket.rate == pytest.approx(51.0)
+
+
+# Tests for CircuitBreaker
+class TestCircuitBreaker:
+    """Test failing fast during outages"""
+    
+    def test_opens_after_threshold(self):
+        """Test consecutive failures open the circuit and success resets the count"""
+        breaker = CircuitBreaker(threshold=3, recovery=60)
+        breaker.on_failure()
+        breaker.on_failure()
+        breaker.on_success()
+        breaker.on_failure()
+        breaker.on_failure()
+        breaker.check()
+        
+        breaker.on_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+    
+    def test_half_open_admits_one_probe(self):
+        """Test one probe goes out after recovery and its result decides the state"""
+        breaker = CircuitBreaker(threshold=1, recovery=0.05)
+        breaker.on_failure()
+        time.sleep(0.06)
+        
+        breaker.check()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+        
+        # A failed probe reopens the circuit; a successful one closes it
+        breaker.on_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        time.sleep(0.06)
+        breaker.check()
+        breaker.on_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        breaker.check()
+
+
+# Tests for ProxyPool
+class TestProxyPool:
+    """Test proxy rotation, sticky sessions and cooldowns"""
+    
+    def test_round_robin_without_session(self):
+        """Test proxies rotate when no session is given"""
+        pool = ProxyPool(["http://p1", "http://p2"])
+        assert [pool.pick() for _ in range(3)] == ["http://p1", "http://p2", "http://p1"]
+    
+    def test_sticky_session(self):
+        """Test a session keeps its proxy until the TTL runs out"""
+        pool = ProxyPool(["http://p1", "http://p2"], sticky_ttl=300)
+        first = pool.pick("amazon.com")
+        assert pool.pick("ebay.com") != first
+        assert all(pool.pick("amazon.com") == first for _ in range(5))
+        
+        pool._sticky["amazon.com"] = (first, 0)  # expired
+        pool.pick("amazon.com")
+        assert pool._sticky["amazon.com"][1] > 0
+    
+    def test_mark_bad_rests_proxy(self):
+        """Test a failing proxy is skipped, unpinned and backed off exponentially"""
+        pool = ProxyPool(["http://p1", "http://p2"], cooldown=60)
+        assert pool.pick("amazon.com") == "http://p1"
+        
+        pool.mark_bad("http://p1")
+        assert "amazon.com" not in pool._sticky
+        assert {pool.pick() for _ in range(4)} == {"http://p2"}
+        assert pool.pick("amazon.com") == "http://p2"
+        
+        first_rest = pool._resting_until["http://p1"]
+        pool.mark_bad("http://p1")
+        assert pool._resting_until["http://p1"] - first_rest == pytest.approx(60, abs=1)
+        
+        pool.mark_ok("http://p1")
+        assert "http://p1" not in pool._resting_until
+        assert pool.success_rate("http://p1") == pytest.approx(1 / 3)
+        assert pool.success_rate("http://p2") is None
+    
+    def test_weighted_prefers_fast_healthy_proxies(self):
+        """Test traffic shifts toward proxies that answer faster and fail less"""
+        pool = ProxyPool(["http://fast", "http://slow", "http://flaky"])
+        pool.mark_ok("http://fast", 0.2)
+        pool.mark_ok("http://slow", 1.0)
+        pool.mark_ok("http://flaky", 0.2)
+        for _ in range(5):
+            pool._health["http://flaky"] *= 1 - pool.EWMA_ALPHA
+        
+        picks = [pool.pick() for _ in range(100)]
+        assert picks.count("http://fast") > 4 * picks.count("http://slow")
+        assert picks.count("http://fast") > picks.count("http://flaky") > 0
+        assert picks.count("http://slow") > 0
+    
+    def test_untried_proxy_weighted_at_average_latency(self):
+        """Test an untried proxy is weighted as if it had the pool's mean latency"""
+        pool = ProxyPool(["http://a", "http://b", "http://new"])
+        assert pool.weight("http://new") == 1.0
+        
+        pool.mark_ok("http://a", 0.2)
+        pool.mark_ok("http://b", 0.6)
+        pool.mark_ok("http://b", 1.6)
+        mean = (pool._latency["http://a"] + pool._latency["http://b"]) / 2
+        assert pool.weight("http://new") == pytest.approx(1.0 / mean)
+    
+    def test_all_resting_uses_soonest_back(self):
+        """Test the proxy due back first is used when every proxy is resting"""
+        pool = ProxyPool(["http://p1", "http://p2"], cooldown=60)
+        pool.mark_bad("http://p2")
+        pool.mark_bad("http://p1")
+        pool.mark_bad("http://p1")
+        assert pool.pick() == "http://p2"
+    
+    def test_empty_pool(self):
+        """Test a pool needs at least one proxy"""
+        with pytest.raises(ValueError):
+            ProxyPool([])
 
 
 # Tests for TrustpilotScraper
@@ -214,6 +414,7 @@ class TestTrustpilotScraper:
         assert 'Accept' in headers
         assert 'Referer' in headers
         assert headers['DNT'] == '1'
+        assert headers['User-Agent'] in scraper.USER_AGENTS
     
     def test_extract_next_data(self, scraper, mock_html_response):
         """Test extracting NEXT_DATA from HTML"""
@@ -224,6 +425,40 @@ class TestTrustpilotScraper:
         assert 'pageProps' in data['props']
         assert data['props']['pageProps']['businessUnit']['displayName'] == 'Test Company'
     
+    def test_extract_next_data_large_payload(self, scraper):
+        """Test a large NEXT_DATA blob parses to the same structure as json.loads"""
+        review = {"id": "review-1", "rating": 5, "title": "Great ü", "text": "x" * 150,
+                  "dates": {"publishedDate": "2024-10-15T12:00:00Z"}, "likes": 3.5}
+        payload = json.dumps({"props": {"pageProps": {"reviews": [review] * 1000}}})
+        html = f'<html><script id="__NEXT_DATA__" type="application/json">{payload}</script></html>'
+        
+        assert len(payload) > 200_000
+        assert scraper._extract_next_data(html) == json.loads(payload)
+    
+    @pytest.mark.parametrize("tag", [
+        '<script id="__NEXT_DATA__" type="application/json">',
+        '<script type="application/json" id="__NEXT_DATA__">',
+        '<script\n  id="__NEXT_DATA__"\n  type="application/json"\n>',
+        "<script id='__NEXT_DATA__' type='application/json'>",
+        '<SCRIPT id="__NEXT_DATA__">',
+    ])
+    def test_extract_next_data_tag_variants(self, scraper, tag):
+        """Test the script tag is found however its attributes are written"""
+        html = f'<html><head>{tag}\n{{"buildId": "abc"}}\n</script></head></html>'
+        assert scraper._extract_next_data(html) == {"buildId": "abc"}
+    
+    def test_json_loads_prefers_orjson(self):
+        """Test orjson is used for parsing when it is installed"""
+        orjson = pytest.importorskip("orjson")
+        import trustpilot
+        assert trustpilot._json_loads is orjson.loads
+    
+    def test_extract_next_data_bytes(self, scraper, mock_html_response):
+        """Test raw response bytes parse the same as decoded text"""
+        html = mock_html_response.replace("Test Company", "Tést Cømpany")
+        assert scraper._extract_next_data(html.encode()) == scraper._extract_next_data(html)
+        assert scraper._extract_next_data(html.encode())['buildId'] == 'test-build-id-123'
+    
     def test_extract_next_data_missing(self, scraper):
         """Test extraction fails when NEXT_DATA is missing"""
         html = '<html><body>No data here</body></html>'
@@ -231,6 +466,12 @@ class TestTrustpilotScraper:
         with pytest.raises(ValueError, match="No __NEXT_DATA__ found"):
             scraper._extract_next_data(html)
     
+    @pytest.mark.asyncio
+    async def test_uvloop_active(self):
+        """Test the async tests run on uvloop when it's installed"""
+        pytest.importorskip("uvloop")
+        assert type(asyncio.get_running_loop()).__module__.startswith("uvloop")
+    
     @pytest.mark.asyncio
     async def test_delay(self, scraper):
         """Test request delay"""
@@ -244,62 +485,210 @@ class TestTrustpilotScraper:
         assert 0.1 <= elapsed <= 0.3  # Allow small margin
     
     @pytest.mark.asyncio
+    async def test_delay_schedule_reproducible(self):
+        """Test scrapers seeded alike wait the same delays"""
+        async def delays(scraper):
+            with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+                for _ in range(5):
+                    await scraper._delay()
+            return [call.args[0] for call in mock_sleep.await_args_list]
+        
+        first = await delays(TrustpilotScraper(request_delay=(1.0, 3.0), seed=42))
+        second = await delays(TrustpilotScraper(request_delay=(1.0, 3.0), seed=42))
+        
+        assert first == second
+        assert all(1.0 <= d <= 3.0 for d in first)
+        assert len(set(first)) > 1
+    
+    @pytest.mark.asyncio
+    @respx.mock
     async def test_make_request_success(self, scraper, mock_html_response):
         """Test successful HTTP request"""
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_response = MagicMock()
-            mock_response.text = mock_html_response
-            mock_response.raise_for_status = MagicMock()
-            
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
-            
+        respx.get("https://example.com").mock(
+            return_value=httpx.Response(200, text=mock_html_response)
+        )
+        
+        async with scraper:
             response = await scraper._make_request("https://example.com")
-            assert response.text == mock_html_response
+        assert response.text == mock_html_response
     
     @pytest.mark.asyncio
+    @respx.mock
     async def test_make_request_retry(self, scraper):
         """Test request retry logic"""
         scraper.request_delay = (0.05, 0.1)
         scraper.max_retries = 2
         
-        with patch('httpx.AsyncClient') as mock_client:
-            # First two attempts fail, third succeeds
-            mock_response_success = MagicMock()
-            mock_response_success.raise_for_status = MagicMock()
-            
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                side_effect=[
-                    httpx.TimeoutException("Timeout"),
-                    httpx.HTTPError("Error"),
-                    mock_response_success
-                ]
-            )
-            
+        # First two attempts fail, third succeeds
+        route = respx.get("https://example.com").mock(side_effect=[
+            httpx.TimeoutException("Timeout"),
+            httpx.HTTPError("Error"),
+            httpx.Response(200, text="ok")
+        ])
+        
+        async with scraper:
             response = await scraper._make_request("https://example.com")
-            assert response == mock_response_success
+        assert response.text == "ok"
+        assert route.call_count == 3
+    
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_make_request_client_error_not_retried(self, scraper):
+        """Test a 404 fails at once while a 429 is retried"""
+        scraper.request_delay = (0, 0)
+        missing = respx.get("https://example.com/missing").mock(return_value=httpx.Response(404))
+        limited = respx.get("https://example.com/limited").mock(side_effect=[
+            httpx.Response(429),
+            httpx.Response(200, text="ok")
+        ])
+        
+        with patch('asyncio.sleep', new=AsyncMock()):
+            async with scraper:
+                with pytest.raises(httpx.HTTPStatusError):
+                    await scraper._make_request("https://example.com/missing")
+                response = await scraper._make_request("https://example.com/limited")
+        
+        assert missing.call_count == 1
+        assert response.text == "ok"
+        assert limited.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_backoff_full_jitter(self):
+        """Test retry waits are random and stay under the capped exponential bound"""
+        scraper = TrustpilotScraper(
+            request_delay=(0, 0),
+            max_retries=6,
+            backoff_base=1.0,
+            backoff_cap=8.0,
+            seed=1
+        )
+        
+        with patch.object(scraper, '_get_client') as mock_get_client, \
+                patch('asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            mock_get_client.return_value.get = AsyncMock(side_effect=httpx.ConnectError("down"))
+            with pytest.raises(httpx.ConnectError):
+                await scraper._make_request("https://example.com")
+        
+        waits = [c.args[0] for c in mock_sleep.await_args_list if c.args[0] > 0]
+        assert len(waits) == 6
+        assert all(0 <= w <= min(8.0, 2 ** n) for n, w in enumerate(waits))
+        assert waits != sorted(waits)
+    
+    @pytest.mark.asyncio
+    async def test_make_request_rotates_blocked_proxy(self):
+        """Test a blocked proxy is rested and the retry uses another one"""
+        scraper = TrustpilotScraper(proxies=["http://p1", "http://p2"], request_delay=(0, 0))
+        blocked = httpx.Response(429, request=httpx.Request("GET", "https://example.com"))
+        ok = MagicMock()
+        
+        with patch.object(scraper, '_get_client') as mock_get_client, \
+                patch('asyncio.sleep', new=AsyncMock()):
+            mock_get_client.return_value.get = AsyncMock(side_effect=[blocked, ok])
+            
+            response = await scraper._make_request("https://example.com", session="amazon.com")
+        
+        assert response is ok
+        assert [c.args[0] for c in mock_get_client.call_args_list] == ["http://p1", "http://p2"]
+        assert "http://p1" in scraper.proxies._resting_until
+        assert scraper.proxies.pick("amazon.com") == "http://p2"
     
     @pytest.mark.asyncio
+    @respx.mock
     async def test_make_request_max_retries(self, scraper):
         """Test request fails after max retries"""
         scraper.request_delay = (0.05, 0.1)
         scraper.max_retries = 1
         
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                side_effect=httpx.TimeoutException("Timeout")
-            )
-            
+        route = respx.get("https://example.com").mock(side_effect=httpx.TimeoutException("Timeout"))
+        
+        async with scraper:
             with pytest.raises(httpx.TimeoutException):
                 await scraper._make_request("https://example.com")
+        assert route.call_count == 2
+    
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_make_request_circuit_breaker(self, scraper):
+        """Test an open circuit stops retries and rejects later requests unsent"""
+        scraper.request_delay = (0, 0)
+        scraper.backoff_base = 0.01
+        scraper.max_retries = 5
+        scraper.circuit_breaker = CircuitBreaker(threshold=2, recovery=60)
+        route = respx.get("https://example.com").mock(return_value=httpx.Response(503))
+        
+        async with scraper:
+            with pytest.raises(CircuitOpenError):
+                await scraper._make_request("https://example.com")
+            with pytest.raises(CircuitOpenError):
+                await scraper._make_request("https://example.com")
+        assert route.call_count == 2
+    
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_make_request_cached(self, tmp_path):
+        """Test cached responses skip the network until refreshed or expired"""
+        route = respx.get("https://example.com/page").mock(
+            return_value=httpx.Response(200, content=b"body")
+        )
+        scraper = TrustpilotScraper(request_delay=(0, 0), response_cache_dir=tmp_path)
+        
+        async with scraper:
+            await scraper._make_request("https://example.com/page", {"page": 1})
+            cached = await scraper._make_request("https://example.com/page", {"page": 1})
+            assert cached.content == b"body"
+            assert route.call_count == 1
+            
+            # Other params are another entry; refresh bypasses the cache
+            await scraper._make_request("https://example.com/page", {"page": 2})
+            await scraper._make_request("https://example.com/page", {"page": 1}, refresh=True)
+            assert route.call_count == 3
+            
+            scraper.response_ttl = 0
+            await scraper._make_request("https://example.com/page", {"page": 1})
+            assert route.call_count == 4
+    
+    @pytest.mark.asyncio
+    async def test_client_reused_and_closed(self, scraper):
+        """Test one HTTP client serves every request and is closed on exit"""
+        scraper.request_delay = (0, 0)
+        
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_client.return_value.get = AsyncMock(return_value=MagicMock())
+            mock_client.return_value.aclose = AsyncMock()
+            
+            async with scraper:
+                await scraper._make_request("https://example.com/a")
+                await scraper._make_request("https://example.com/b")
+            
+            assert mock_client.call_count == 1
+            assert mock_client.return_value.get.await_count == 2
+            mock_client.return_value.aclose.assert_awaited_once()
+            assert scraper._clients == {}
+    
+    def test_client_http2_when_available(self, scraper):
+        """Test clients negotiate HTTP/2 only when h2 is installed"""
+        with patch('httpx.AsyncClient') as mock_client:
+            with patch('trustpilot.h2', None):
+                scraper._get_client(None)
+            with patch('trustpilot.h2', object()):
+                scraper._get_client("http://p1")
+        
+        assert mock_client.call_args_list[0].kwargs['http2'] is False
+        assert mock_client.call_args_list[1].kwargs['http2'] is True
+    
+    def test_pool_limits_follow_workers(self):
+        """Test the connection pool scales with max_workers past httpx's default 100"""
+        limits = TrustpilotScraper(max_workers=300)._pool_limits()
+        assert limits.max_connections == 600
+        assert limits.max_keepalive_connections == 300
+        assert limits.keepalive_expiry == TrustpilotScraper.KEEPALIVE_EXPIRY
     
     @pytest.mark.asyncio
     async def test_search_companies(self, scraper, mock_html_response):
         """Test company search functionality"""
         with patch.object(scraper, '_make_request') as mock_request:
             mock_response = MagicMock()
-            mock_response.text = mock_html_response
+            mock_response.content = mock_html_response.encode()
             mock_request.return_value = mock_response
             
             results = await scraper.search_companies("electronics", pages=2)
@@ -313,7 +702,7 @@ class TestTrustpilotScraper:
         """Test scraping company profile"""
         with patch.object(scraper, '_make_request') as mock_request:
             mock_response = MagicMock()
-            mock_response.text = mock_html_response
+            mock_response.content = mock_html_response.encode()
             mock_request.return_value = mock_response
             
             profile = await scraper.scrape_company_profile("test-company.com")
@@ -331,11 +720,11 @@ class TestTrustpilotScraper:
         with patch.object(scraper, '_make_request') as mock_request:
             # First call returns HTML with build ID
             mock_html = MagicMock()
-            mock_html.text = mock_html_response
+            mock_html.content = mock_html_response.encode()
             
             # Second call returns API response
             mock_api = MagicMock()
-            mock_api.json.return_value = mock_api_response
+            mock_api.content = json.dumps(mock_api_response).encode()
             
             mock_request.side_effect = [mock_html, mock_api]
             
@@ -347,16 +736,157 @@ class TestTrustpilotScraper:
             assert reviews[0]['company_domain'] == 'test-company.com'
             assert reviews[0]['verified'] is True
             assert reviews[1]['company_reply'] == "We're sorry to hear that"
+            assert reviews[0]['company_reply'] is None
+            assert reviews[1]['author_id'] == 'user-2'
+            assert reviews[1]['review_date'] == '2024-11-01T11:00:00Z'
+            assert reviews[0]['scraped_at'] == reviews[1]['scraped_at']
+    
+    @pytest.mark.asyncio
+    async def test_scrape_company_reviews_arrow(
+        self, scraper, mock_html_response, mock_api_response
+    ):
+        """Test reviews come back as a typed Arrow record batch"""
+        pa = pytest.importorskip("pyarrow")
+        with patch.object(scraper, '_make_request') as mock_request:
+            mock_html = MagicMock()
+            mock_html.content = mock_html_response.encode()
+            
+            mock_api = MagicMock()
+            mock_api.content = json.dumps(mock_api_response).encode()
+            
+            mock_request.side_effect = [mock_html, mock_api]
+            
+            batch = await scraper.scrape_company_reviews_arrow("test-company.com", max_pages=1)
+        
+        assert batch.num_rows == 2
+        assert batch.column("rating").type == pa.int8()
+        assert batch.column("verified").to_pylist() == [True, False]
+        assert batch.column("company_reply").to_pylist() == [None, "We're sorry to hear that"]
+    
+    def test_process_review_missing_fields(self):
+        """Test a sparse raw review still produces a full record"""
+        review = TrustpilotScraper._process_review({"id": "r"}, "a.com", "2024-11-01T00:00:00")
+        
+        assert review['verified'] is False
+        assert review['author_name'] is None
+        assert review['company_reply'] is None
+        assert review['helpful_count'] == 0
+    
+    @pytest.mark.asyncio
+    async def test_scrape_company_profile_cached(self, scraper, mock_html_response):
+        """Test repeated profile lookups are served from the cache until they expire"""
+        with patch.object(scraper, '_make_request') as mock_request:
+            mock_response = MagicMock()
+            mock_response.content = mock_html_response.encode()
+            mock_request.return_value = mock_response
+            
+            first = await scraper.scrape_company_profile("test-company.com")
+            second = await scraper.scrape_company_profile("test-company.com")
+            assert second == first
+            assert mock_request.call_count == 1
+            
+            # A restored cache is reused; an expired entry is fetched again
+            restored = TrustpilotScraper(profile_ttl=60)
+            restored.load_profile_cache(scraper.export_profile_cache())
+            assert (await restored.scrape_company_profile("test-company.com")) == first
+            
+            cached_at, profile = scraper._profiles["test-company.com"]
+            scraper._profiles["test-company.com"] = (cached_at - 3600, profile)
+            await scraper.scrape_company_profile("test-company.com")
+            assert mock_request.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_iter_company_reviews(self, scraper, mock_html_response, mock_api_response):
+        """Test reviews are yielded page by page"""
+        with patch.object(scraper, '_make_request') as mock_request:
+            mock_html = MagicMock()
+            mock_html.content = mock_html_response.encode()
+            
+            mock_api = MagicMock()
+            mock_api.content = json.dumps(mock_api_response).encode()
+            
+            mock_request.side_effect = [mock_html, mock_api, mock_api]
+            
+            seen = []
+            async for review in scraper.iter_company_reviews("test-company.com", max_pages=2):
+                # Page 2 isn't requested until page 1 has been consumed
+                seen.append((review['id'], mock_request.call_count))
+            
+            assert seen == [
+                ('review-1', 2), ('review-2', 2),
+                ('review-1', 3), ('review-2', 3)
+            ]
+    
+    @pytest.mark.asyncio
+    async def test_build_id_fetched_once(self, scraper, mock_html_response, mock_api_response):
+        """Test the build ID page is loaded once, then refreshed when a deploy retires it"""
+        mock_html = MagicMock()
+        mock_html.content = mock_html_response.encode()
+        mock_api = MagicMock()
+        mock_api.content = json.dumps(mock_api_response).encode()
+        retired = httpx.HTTPStatusError(
+            "Not Found",
+            request=httpx.Request("GET", "https://www.trustpilot.com"),
+            response=httpx.Response(404)
+        )
+        
+        def by_url(url, *args, **kwargs):
+            return mock_api if '/_next/data/' in url else mock_html
+        
+        with patch.object(scraper, '_make_request') as mock_request:
+            mock_request.side_effect = by_url
+            await scraper.scrape_company_reviews("a.com", max_pages=1)
+            await scraper.scrape_company_reviews("b.com", max_pages=1)
+            
+            html_calls = [c for c in mock_request.call_args_list if '/_next/data/' not in c.args[0]]
+            assert len(html_calls) == 1
+            
+            # Cached ID now 404s; the page is reloaded and the request retried
+            scraper._build_id = "old-build"
+            mock_request.reset_mock()
+            mock_request.side_effect = [retired, mock_html, mock_api]
+            reviews = await scraper.scrape_company_reviews("c.com", max_pages=1)
+        
+        assert len(reviews) == 2
+        assert scraper._build_id == "test-build-id-123"
+        assert "test-build-id-123" in mock_request.call_args_list[2].args[0]
+    
+    @pytest.mark.asyncio
+    async def test_pagination_parallel(self, scraper, mock_html_response):
+        """Test later pages download concurrently but still yield in page order"""
+        scraper.PAGE_PREFETCH = 4
+        in_flight = peak = 0
+        
+        async def fake_request(url, params=None, **kwargs):
+            nonlocal in_flight, peak
+            if params is None:
+                return MagicMock(content=mock_html_response.encode())
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            page = {"reviews": [{"id": f"page-{params['page']}"}],
+                    "filters": {"pagination": {"totalPages": 5}}}
+            return MagicMock(content=json.dumps({"pageProps": page}).encode())
+        
+        with patch.object(scraper, '_make_request', side_effect=fake_request):
+            start = time.monotonic()
+            reviews = await scraper.scrape_company_reviews("test-company.com", max_pages=5)
+            elapsed = time.monotonic() - start
+        
+        assert [r['id'] for r in reviews] == [f"page-{n}" for n in range(1, 6)]
+        assert peak == 4
+        assert elapsed < 0.05 * 4
     
     @pytest.mark.asyncio
     async def test_scrape_company_reviews_with_filters(self, scraper, mock_html_response, mock_api_response):
         """Test scraping reviews with filters"""
         with patch.object(scraper, '_make_request') as mock_request:
             mock_html = MagicMock()
-            mock_html.text = mock_html_response
+            mock_html.content = mock_html_response.encode()
             
             mock_api = MagicMock()
-            mock_api.json.return_value = mock_api_response
+            mock_api.content = json.dumps(mock_api_response).encode()
             
             mock_request.side_effect = [mock_html, mock_api]
             
@@ -381,7 +911,7 @@ class TestTrustpilotScraper:
         """Test scraping category"""
         with patch.object(scraper, '_make_request') as mock_request:
             mock_response = MagicMock()
-            mock_response.text = mock_html_response
+            mock_response.content = mock_html_response.encode()
             mock_request.return_value = mock_response
             
             results = await scraper.scrape_category("electronics_technology", pages=1)
@@ -389,18 +919,48 @@ class TestTrustpilotScraper:
             assert len(results) == 2
             assert results[0]['displayName'] == 'Company 1'
     
+    @pytest.mark.asyncio
+    async def test_scrape_category_cached(self, tmp_path):
+        """Test category pages are reused from disk until they expire"""
+        page = {"props": {"pageProps": {"businessUnits": [{"displayName": "Company 1"}]}}}
+        html = f'<script id="__NEXT_DATA__">{json.dumps(page)}</script>'
+        
+        with patch.object(TrustpilotScraper, '_make_request') as mock_request:
+            mock_request.return_value = MagicMock(content=html.encode())
+            
+            first = TrustpilotScraper(category_cache_dir=tmp_path)
+            companies = await first.scrape_category("electronics_technology")
+            assert companies == [{"displayName": "Company 1"}]
+            
+            # A new scraper (a later run) reads the cached page
+            second = TrustpilotScraper(category_cache_dir=tmp_path)
+            companies = await second.scrape_category("electronics_technology")
+            assert companies == [{"displayName": "Company 1"}]
+            assert mock_request.call_count == 1
+            
+            # Another filter is a different cache entry; an expired one is refetched
+            await second.scrape_category("electronics_technology", min_reviews=100)
+            assert mock_request.call_count == 2
+            
+            expired = TrustpilotScraper(category_cache_dir=tmp_path, category_ttl=0)
+            await expired.scrape_category("electronics_technology")
+            assert mock_request.call_count == 3
+    
     @pytest.mark.asyncio
     async def test_scrape_multiple_companies(self, scraper, mock_html_response, mock_api_response):
         """Test scraping multiple companies"""
         with patch.object(scraper, '_make_request') as mock_request:
             mock_html = MagicMock()
-            mock_html.text = mock_html_response
+            mock_html.content = mock_html_response.encode()
             
             mock_api = MagicMock()
-            mock_api.json.return_value = mock_api_response
+            mock_api.content = json.dumps(mock_api_response).encode()
+            
+            # Companies run concurrently, so answer by URL rather than call order
+            def by_url(url, *args, **kwargs):
+                return mock_api if '/_next/data/' in url else mock_html
             
-            # Return alternating HTML and API responses
-            mock_request.side_effect = [mock_html, mock_api, mock_html, mock_api]
+            mock_request.side_effect = by_url
             
             companies = ["company1.com", "company2.com"]
             results = await scraper.scrape_multiple_companies(companies, max_pages_per_company=1)
@@ -410,6 +970,63 @@ class TestTrustpilotScraper:
             assert "company2.com" in results
             assert len(results["company1.com"]) == 2  # 2 reviews per company
     
+    @pytest.mark.asyncio
+    async def test_scrape_multiple_companies_output_file(self, scraper, tmp_path):
+        """Test every company's reviews are appended to the JSONL file"""
+        async def fake_reviews(domain, max_pages=None):
+            return [{"id": f"{domain}-{n}", "title": "Très bien"} for n in range(3)]
+        
+        output = tmp_path / "reviews.jsonl"
+        with patch.object(scraper, 'scrape_company_reviews', side_effect=fake_reviews):
+            await scraper.scrape_multiple_companies(["a.com", "b.com"], output_file=str(output))
+        
+        lines = [json.loads(line) for line in output.read_text(encoding='utf-8').splitlines()]
+        expected = [f"{d}-{n}" for d in ("a.com", "b.com") for n in range(3)]
+        assert sorted(r['id'] for r in lines) == expected
+        assert lines[0]['title'] == "Très bien"
+    
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded(self):
+        """Test no more than max_workers companies are scraped at once"""
+        scraper = TrustpilotScraper(max_workers=3)
+        in_flight = peak = 0
+        
+        async def fake_reviews(domain, max_pages=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [{"id": domain}]
+        
+        with patch.object(scraper, 'scrape_company_reviews', side_effect=fake_reviews):
+            results = await scraper.scrape_multiple_companies([f"c{i}.com" for i in range(10)])
+        
+        assert len(results) == 10
+        assert peak == 3
+    
+    @pytest.mark.asyncio
+    async def test_iter_company_results(self, scraper):
+        """Test companies are yielded as they finish and failures come back empty"""
+        delays = {"slow.com": 0.2, "fast.com": 0.0, "broken.com": 0.1}
+        
+        async def fake_reviews(domain, max_pages=None):
+            await asyncio.sleep(delays[domain])
+            if domain == "broken.com":
+                raise ValueError("blocked")
+            return [{"id": domain}]
+        
+        with patch.object(scraper, 'scrape_company_reviews', side_effect=fake_reviews):
+            results = [
+                item async for item in scraper.iter_company_results(list(delays))
+            ]
+        
+        assert results == [
+            ("fast.com", [{"id": "fast.com"}]),
+            ("broken.com", []),
+            ("slow.com", [{"id": "slow.com"}])
+        ]
+    
     @pytest.mark.asyncio
     async def test_error_handling(self, scraper):
         """Test error handling in scraping methods"""
@@ -420,6 +1037,73 @@ class TestTrustpilotScraper:
                 await scraper.scrape_company_profile("test.com")
 
 
+# Tests for run.py proxy file loading
+class TestLoadProxies:
+    """Test reading proxy pools from text and JSON files"""
+    
+    def test_json_array(self, tmp_path):
+        """Test a .json file holding an array of proxy URLs"""
+        path = tmp_path / "proxies.json"
+        path.write_text(json.dumps(["http://p1:8080", "socks5://user:pw@p2:1080"]))
+        
+        pool = run.load_proxies_from_file(str(path))
+        assert pool._proxies == ["http://p1:8080", "socks5://user:pw@p2:1080"]
+    
+    def test_json_not_array(self, tmp_path):
+        """Test a .json file that isn't an array exits instead of loading"""
+        path = tmp_path / "proxies.json"
+        path.write_text(json.dumps({"proxies": ["http://p1:8080"]}))
+        
+        with pytest.raises(SystemExit):
+            run.load_proxies_from_file(str(path))
+    
+    def test_mixed_valid_and_invalid_lines(self, tmp_path, capsys):
+        """Test malformed lines are skipped with a warning and the rest load"""
+        path = tmp_path / "proxies.txt"
+        path.write_text(
+            "http://p1:8080\n"
+            "p2:8080\n"
+            "ftp://p3:21\n"
+            "http://[::1]:3128\n"
+            "http://p4\n"
+        )
+        
+        pool = run.load_proxies_from_file(str(path))
+        assert pool._proxies == ["http://p1:8080", "http://[::1]:3128"]
+        assert capsys.readouterr().out.count("Skipping malformed proxy") == 3
+    
+    def test_duplicates_dropped(self, tmp_path):
+        """Test repeated proxies are loaded once, keeping file order"""
+        path = tmp_path / "proxies.txt"
+        path.write_text("http://p1:8080\nhttp://p2:8080\nhttp://p1:8080\n")
+        
+        pool = run.load_proxies_from_file(str(path))
+        assert pool._proxies == ["http://p1:8080", "http://p2:8080"]
+    
+    def test_nothing_valid_exits(self, tmp_path):
+        """Test a file with no usable proxies exits rather than running unproxied"""
+        path = tmp_path / "proxies.txt"
+        path.write_text("not a proxy\n")
+        
+        with pytest.raises(SystemExit):
+            run.load_proxies_from_file(str(path))
+
+
+# Tests for run.py output helpers
+def test_save_helpers_quiet(tmp_path, capsys):
+    """Test --quiet silences the per-file saved messages but still writes the files"""
+    reviews = [{"id": "r1", "rating": 5}]
+    
+    json_file = run.save_results({"reviews": reviews}, tmp_path, ts="t1", quiet=True)
+    jsonl_file = run.save_reviews_jsonl(reviews, "a.com", tmp_path, ts="t1", quiet=True)
+    assert capsys.readouterr().out == ""
+    assert json.loads(json_file.read_bytes()) == {"reviews": reviews}
+    assert json.loads(jsonl_file.read_text()) == reviews[0]
+    
+    run.save_reviews_jsonl(reviews, "b.com", tmp_path, ts="t1")
+    assert "Reviews saved to" in capsys.readouterr().out
+
+
 # Integration tests
 class TestIntegration:
     """Integration tests (these may make real requests if not mocked)"""
@@ -6,17 +6,63 @@ including company search, review extraction, and anti-bot protection.
 """
 
 import asyncio
+import hashlib
 import json
 import random
 import time
-from collections import deque
+from collections import OrderedDict, deque
 from datetime import datetime
-from itertools import cycle
-from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+from types import MappingProxyType
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlencode
 
 import httpx
-from parsel import Selector
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import h2
+except ImportError:
+    h2 = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+# NEXT_DATA blobs and review API pages run to hundreds of KB; orjson parses
+# them several times faster
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _review_schema() -> "pa.Schema":
+    """Arrow schema for review records (ratings fit in int8, dates stay ISO strings)"""
+    return pa.schema([
+        ('id', pa.string()),
+        ('company_domain', pa.string()),
+        ('rating', pa.int8()),
+        ('title', pa.string()),
+        ('content', pa.string()),
+        ('author_name', pa.string()),
+        ('author_id', pa.string()),
+        ('verified', pa.bool_()),
+        ('review_date', pa.string()),
+        ('experience_date', pa.string()),
+        ('company_reply', pa.string()),
+        ('helpful_count', pa.int32()),
+        ('scraped_at', pa.string())
+    ])
+
+
+def _json_line(record: Dict) -> bytes:
+    """Encode one record as a UTF-8 JSONL line"""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
 
 
 class TrustpilotScraperMonitor:
@@ -25,6 +71,9 @@ class TrustpilotScraperMonitor:
     def __init__(self, window_size: int = 100):
         self.success_rate = deque(maxlen=window_size)
         self.response_times = deque(maxlen=window_size)
+        # Running window totals, so the per-request health check is O(1)
+        self._ok_sum = 0
+        self._time_sum = 0.0
         self.last_review_date = None
         self.total_requests = 0
         self.total_reviews = 0
@@ -43,9 +92,14 @@ class TrustpilotScraperMonitor:
             # Track review data if available
             if isinstance(result, list) and result:
                 self.total_reviews += len(result)
-                dates = [r.get('dates', {}).get('publishedDate') for r in result if isinstance(r, dict)]
+                # Processed reviews carry review_date; raw API reviews nest it under dates
+                dates = [
+                    r.get('review_date') or r.get('dates', {}).get('publishedDate')
+                    for r in result if isinstance(r, dict)
+                ]
+                dates = [d for d in dates if d]
                 if dates:
-                    self.last_review_date = max(filter(None, dates))
+                    self.last_review_date = max(dates)
             
             return result
             
@@ -54,14 +108,12 @@ class TrustpilotScraperMonitor:
             raise
             
         finally:
-            elapsed = time.time() - start
-            self.success_rate.append(1 if success else 0)
-            self.response_times.append(elapsed)
+            self._record(success, time.time() - start)
             
             # Alert if performance drops
             if len(self.success_rate) == self.success_rate.maxlen:
-                rate = sum(self.success_rate) / len(self.success_rate)
-                avg_time = sum(self.response_times) / len(self.response_times)
+                rate = self._ok_sum / len(self.success_rate)
+                avg_time = self._time_sum / len(self.response_times)
                 
                 if rate < 0.8:
                     print(f"⚠️  WARNING: Success rate dropped to {rate:.1%}")
@@ -70,6 +122,16 @@ class TrustpilotScraperMonitor:
                 if avg_time > 5.0:
                     print(f"⚠️  SLOW: Average response time {avg_time:.2f}s")
     
+    def _record(self, success: bool, elapsed: float):
+        """Add one request to the window, keeping the running totals in step"""
+        if len(self.success_rate) == self.success_rate.maxlen:
+            self._ok_sum -= self.success_rate[0]
+            self._time_sum -= self.response_times[0]
+        self.success_rate.append(1 if success else 0)
+        self.response_times.append(elapsed)
+        self._ok_sum += self.success_rate[-1]
+        self._time_sum += elapsed
+    
     def get_stats(self) -> Dict:
         """Get current performance statistics"""
         if not self.success_rate:
@@ -84,11 +146,303 @@ class TrustpilotScraperMonitor:
         }
 
 
+class ProxyPool:
+    """Rotate proxies, favouring fast healthy ones, pinning sessions and resting failures"""
+    
+    # Status codes that mean the proxy's IP is blocked or rate limited
+    BLOCKED_STATUSES = frozenset({403, 407, 429})
+    
+    # Weight of the latest request in each proxy's health and latency averages
+    EWMA_ALPHA = 0.2
+    
+    def __init__(
+        self,
+        proxies: List[str],
+        sticky_ttl: float = 300.0,
+        cooldown: float = 60.0,
+        max_cooldown: float = 3600.0
+    ):
+        """
+        Initialize proxy pool
+        
+        Args:
+            proxies: List of proxy URLs
+            sticky_ttl: Seconds a session keeps the proxy it was given
+            cooldown: Seconds a proxy rests after its first failure; doubles
+                with each further consecutive failure
+            max_cooldown: Upper bound on a proxy's rest period
+        """
+        if not proxies:
+            raise ValueError("ProxyPool needs at least one proxy")
+        
+        self.sticky_ttl = sticky_ttl
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self._proxies = list(proxies)
+        # Smooth weighted round-robin state; equal weights give plain rotation
+        self._current_weight = {proxy: 0.0 for proxy in self._proxies}
+        self._health = {proxy: 1.0 for proxy in self._proxies}
+        self._latency: Dict[str, Optional[float]] = {proxy: None for proxy in self._proxies}
+        # Running total and count of known latencies, so weight() stays O(1)
+        self._latency_sum = 0.0
+        self._latency_known = 0
+        self._sticky: Dict[str, Tuple[str, float]] = {}
+        self._resting_until: Dict[str, float] = {}
+        self._consecutive_failures = {proxy: 0 for proxy in self._proxies}
+        self._successes = {proxy: 0 for proxy in self._proxies}
+        self._failures = {proxy: 0 for proxy in self._proxies}
+    
+    def __len__(self) -> int:
+        return len(self._proxies)
+    
+    def __iter__(self):
+        return self
+    
+    def __next__(self) -> str:
+        return self.pick()
+    
+    def pick(self, session: Optional[str] = None) -> str:
+        """
+        Choose a proxy for a request
+        
+        Args:
+            session: Session key (e.g. a company domain); requests with the
+                same key reuse one proxy for sticky_ttl seconds
+            
+        Returns:
+            Proxy URL
+        """
+        now = time.monotonic()
+        if session is not None:
+            pinned = self._sticky.get(session)
+            if pinned and pinned[1] > now and self._resting_until.get(pinned[0], 0) <= now:
+                return pinned[0]
+        
+        proxy = self._next_available(now)
+        if session is not None:
+            self._sticky[session] = (proxy, now + self.sticky_ttl)
+        return proxy
+    
+    def _next_available(self, now: float) -> str:
+        """Next proxy by weighted rotation that isn't resting, or the one back soonest"""
+        available = [proxy for proxy in self._proxies if self._resting_until.get(proxy, 0) <= now]
+        if not available:
+            return min(self._proxies, key=lambda proxy: self._resting_until[proxy])
+        
+        total = 0.0
+        best = None
+        for proxy in available:
+            weight = self.weight(proxy)
+            self._current_weight[proxy] += weight
+            total += weight
+            if best is None or self._current_weight[proxy] > self._current_weight[best]:
+                best = proxy
+        self._current_weight[best] -= total
+        return best
+    
+    def weight(self, proxy: str) -> float:
+        """Share of traffic a proxy earns: recent success rate over average latency"""
+        latency = self._latency[proxy]
+        if latency is None:
+            # Untried proxies are assumed average, so they still get traffic
+            latency = self._latency_sum / self._latency_known if self._latency_known else 1.0
+        return max(self._health[proxy], 0.05) / max(latency, 0.01)
+    
+    def mark_ok(self, proxy: str, elapsed: Optional[float] = None):
+        """Record a successful request through proxy, taking elapsed seconds"""
+        alpha = self.EWMA_ALPHA
+        self._health[proxy] += alpha * (1.0 - self._health[proxy])
+        if elapsed is not None:
+            previous = self._latency[proxy]
+            if previous is None:
+                latency = elapsed
+                self._latency_known += 1
+                self._latency_sum += latency
+            else:
+                latency = previous + alpha * (elapsed - previous)
+                self._latency_sum += latency - previous
+            self._latency[proxy] = latency
+        self._successes[proxy] += 1
+        self._consecutive_failures[proxy] = 0
+        self._resting_until.pop(proxy, None)
+    
+    def mark_bad(self, proxy: str, cooldown: Optional[float] = None):
+        """
+        Record a failed request and rest the proxy, with exponential backoff
+        
+        Args:
+            proxy: Proxy URL that failed
+            cooldown: Base rest period in seconds (defaults to the pool's)
+        """
+        self._failures[proxy] += 1
+        self._consecutive_failures[proxy] += 1
+        self._health[proxy] *= 1.0 - self.EWMA_ALPHA
+        base = self.cooldown if cooldown is None else cooldown
+        rest = min(base * 2 ** (self._consecutive_failures[proxy] - 1), self.max_cooldown)
+        self._resting_until[proxy] = time.monotonic() + rest
+        
+        # Sessions pinned to this proxy move on at their next request
+        for session in [s for s, (p, _) in self._sticky.items() if p == proxy]:
+            del self._sticky[session]
+    
+    def success_rate(self, proxy: str) -> Optional[float]:
+        """Share of requests through proxy that succeeded (None if unused)"""
+        total = self._successes[proxy] + self._failures[proxy]
+        return self._successes[proxy] / total if total else None
+
+
+class TokenBucket:
+    """Pace requests at an adaptive rate shared by every worker
+    
+    The rate creeps up while requests succeed and halves when the site
+    throttles (additive increase, multiplicative decrease).
+    """
+    
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        min_rate: float = 0.1,
+        max_rate: Optional[float] = None,
+        step: float = 0.05
+    ):
+        """
+        Initialize token bucket
+        
+        Args:
+            rate: Starting rate in requests per second
+            capacity: Requests that may go out back to back after a pause
+            min_rate: Floor the rate never drops below
+            max_rate: Ceiling for the rate (default: 4x the starting rate)
+            step: Requests per second added after each success
+        """
+        if rate <= 0:
+            raise ValueError("TokenBucket rate must be positive")
+        
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = min_rate
+        self.max_rate = max_rate or rate * 4
+        self.step = step
+        self._tokens = capacity
+        self._updated = time.monotonic()
+    
+    async def acquire(self):
+        """Wait until a request may be sent"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        
+        # Take the token now, so concurrent callers queue behind each other
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+    
+    def on_success(self):
+        """Speed up a little after a successful request"""
+        self.rate = min(self.max_rate, self.rate + self.step)
+    
+    def on_throttle(self):
+        """Halve the rate after a rate-limit response or timeout"""
+        self.rate = max(self.min_rate, self.rate / 2)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """Stop sending requests once the site keeps failing
+    
+    After `threshold` consecutive failures the circuit opens and requests
+    are rejected at once. When `recovery` seconds have passed a single
+    probe is let through: success closes the circuit, failure reopens it.
+    """
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(self, threshold: int = 5, recovery: float = 30.0):
+        """
+        Initialize circuit breaker
+        
+        Args:
+            threshold: Consecutive failures that open the circuit
+            recovery: Seconds to wait before probing an open circuit
+        """
+        self.threshold = threshold
+        self.recovery = recovery
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+    
+    def check(self):
+        """Raise CircuitOpenError unless a request may be sent now"""
+        if self.state == self.CLOSED:
+            return
+        
+        now = time.monotonic()
+        if now - self._opened_at < self.recovery:
+            raise CircuitOpenError(f"Circuit open after {self.failures} consecutive failures")
+        
+        # Admit one probe; everyone else waits out another recovery period,
+        # so a probe that never reports back can't wedge the circuit
+        self.state = self.HALF_OPEN
+        self._opened_at = now
+    
+    def on_success(self):
+        """Close the circuit after any answer from the site"""
+        self.state = self.CLOSED
+        self.failures = 0
+    
+    def on_failure(self):
+        """Count a failure, opening the circuit at the threshold or on a failed probe"""
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.threshold:
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+
 class TrustpilotScraper:
     """Main scraper class for Trustpilot data extraction"""
     
     BASE_URL = "https://www.trustpilot.com"
     
+    # Most company profiles kept in the profile cache
+    PROFILE_CACHE_SIZE = 1024
+    
+    # Seconds an idle pooled connection is kept open for reuse
+    KEEPALIVE_EXPIRY = 30.0
+    
+    # Review pages fetched ahead of the one being yielded
+    PAGE_PREFETCH = 4
+    
+    # 4xx responses worth retrying (timeout, too early, rate limited)
+    RETRY_STATUSES = {408, 425, 429}
+    
+    # How Next.js writes its page-data script tag, and the DOM lookup used
+    # when a page doesn't match it exactly
+    NEXT_DATA_MARKER = 'id="__NEXT_DATA__"'
+    NEXT_DATA_XPATH = '//script[@id="__NEXT_DATA__"]/text()'
+    
+    # Headers sent with every request; only the User-Agent varies
+    STATIC_HEADERS = {
+        'Accept': (
+            'text/html,application/xhtml+xml,application/xml;q=0.9,'
+            'image/avif,image/webp,*/*;q=0.8'
+        ),
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'DNT': '1',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none',
+        'Referer': 'https://www.google.com/'
+    }
+    
     USER_AGENTS = [
         'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -99,92 +453,354 @@ class TrustpilotScraper:
     
     def __init__(
         self,
-        proxies: Optional[List[str]] = None,
+        proxies: Optional[Union[List[str], ProxyPool]] = None,
         max_workers: int = 5,
         request_delay: Tuple[float, float] = (1.0, 3.0),
         timeout: int = 30,
-        max_retries: int = 3
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_cap: float = 30.0,
+        profile_ttl: float = 3600,
+        category_cache_dir: Optional[Union[str, Path]] = None,
+        category_ttl: float = 6 * 3600,
+        response_cache_dir: Optional[Union[str, Path]] = None,
+        response_ttl: float = 3600,
+        seed: Optional[int] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None
     ):
         """
         Initialize Trustpilot scraper
         
         Args:
-            proxies: List of proxy URLs (optional)
+            proxies: List of proxy URLs or a ProxyPool (optional)
             max_workers: Maximum concurrent workers
             request_delay: Tuple of (min, max) delay between requests in seconds
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts for failed requests
+            backoff_base: Retry wait bound in seconds, doubled each attempt
+            backoff_cap: Largest retry wait bound in seconds
+            profile_ttl: Seconds a scraped company profile is reused (0 disables)
+            category_cache_dir: Directory caching category pages on disk
+                between runs (optional, off when None)
+            category_ttl: Seconds a cached category page stays fresh
+            response_cache_dir: Directory caching successful GET response
+                bodies on disk between runs (optional, off when None)
+            response_ttl: Seconds a cached response stays fresh
+            seed: Seed for request delays and user agent choice, so a run's
+                timing can be replayed (optional)
+            rate_limiter: Adaptive TokenBucket pacing all requests, used in
+                place of request_delay (optional)
+            circuit_breaker: CircuitBreaker that fails requests fast while
+                the site is down instead of retrying each one (optional)
         """
-        self.proxies = cycle(proxies) if proxies else None
+        if isinstance(proxies, ProxyPool) or not proxies:
+            self.proxies = proxies or None
+        else:
+            self.proxies = ProxyPool(proxies)
         self.max_workers = max_workers
         self.request_delay = request_delay
         self.timeout = timeout
         self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self._rng = random.Random(seed)
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
         self.monitor = TrustpilotScraperMonitor()
+        
+        # One complete header set per user agent, so a request just picks one
+        self._header_variants = [
+            {'User-Agent': ua, **self.STATIC_HEADERS} for ua in self.USER_AGENTS
+        ]
+        
+        # Long-lived HTTP clients keyed by proxy, so connections are reused
+        self._clients: Dict[Optional[str], httpx.AsyncClient] = {}
+        
+        # LRU of company domain -> (scraped at epoch seconds, profile)
+        self.profile_ttl = profile_ttl
+        self._profiles: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        
+        # Next.js build ID shared by every company's review API URL
+        self._build_id: Optional[str] = None
+        self._build_id_lock: Optional[asyncio.Lock] = None
+        
+        # On-disk category page cache, one JSON file per (category, page, filter)
+        self.category_cache_dir = Path(category_cache_dir) if category_cache_dir else None
+        self.category_ttl = category_ttl
+        
+        # On-disk response body cache, one file per (url, params)
+        self.response_cache_dir = Path(response_cache_dir) if response_cache_dir else None
+        self.response_ttl = response_ttl
     
-    def _get_headers(self) -> Dict[str, str]:
-        """Generate randomized request headers"""
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the pooled HTTP clients"""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+    
+    def load_profile_cache(self, entries: Dict[str, Tuple[float, Dict]]):
+        """
+        Seed the profile cache, e.g. with export_profile_cache() from an earlier run
+        
+        Args:
+            entries: Mapping of company domain to (scraped at epoch seconds, profile)
+        """
+        for domain, (cached_at, profile) in entries.items():
+            self._cache_profile(domain, profile, cached_at)
+    
+    def export_profile_cache(self) -> Dict[str, Tuple[float, Dict]]:
+        """Return the unexpired profile cache entries, oldest first"""
+        now = time.time()
         return {
-            'User-Agent': random.choice(self.USER_AGENTS),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Referer': 'https://www.google.com/'
+            domain: entry for domain, entry in self._profiles.items()
+            if now - entry[0] < self.profile_ttl
         }
     
+    def _cache_profile(self, domain: str, profile: Dict, cached_at: Optional[float] = None):
+        """Store a profile, evicting the least recently used past PROFILE_CACHE_SIZE"""
+        if self.profile_ttl <= 0:
+            return
+        self._profiles[domain] = (time.time() if cached_at is None else cached_at, profile)
+        self._profiles.move_to_end(domain)
+        while len(self._profiles) > self.PROFILE_CACHE_SIZE:
+            self._profiles.popitem(last=False)
+    
+    def _cached_profile(self, domain: str) -> Optional[Dict]:
+        """Return a cached profile if it's still fresh"""
+        entry = self._profiles.get(domain)
+        if entry is None:
+            return None
+        if time.time() - entry[0] >= self.profile_ttl:
+            del self._profiles[domain]
+            return None
+        self._profiles.move_to_end(domain)
+        return dict(entry[1])
+    
+    def _pool_limits(self) -> httpx.Limits:
+        """
+        Size the connection pool from max_workers
+        
+        Every worker can hold a connection with headroom for redirects, and
+        one idle connection per worker is kept warm; httpx's default cap of
+        100 would otherwise throttle large --workers values.
+        """
+        return httpx.Limits(
+            max_connections=self.max_workers * 2,
+            max_keepalive_connections=self.max_workers,
+            keepalive_expiry=self.KEEPALIVE_EXPIRY
+        )
+    
+    def _get_client(self, proxy: Optional[str]) -> httpx.AsyncClient:
+        """
+        Return the shared HTTP client for a proxy, creating it on first use
+        
+        httpx fixes the proxy when a client is built, so each proxy gets its
+        own connection pool; requests through the same proxy reuse it. With
+        h2 installed, concurrent page fetches share one multiplexed HTTP/2
+        connection; servers and proxies that don't offer h2 stay on HTTP/1.1.
+        """
+        client = self._clients.get(proxy)
+        if client is None:
+            client = httpx.AsyncClient(
+                proxy=proxy,
+                timeout=self.timeout,
+                follow_redirects=True,
+                http2=h2 is not None,
+                limits=self._pool_limits()
+            )
+            self._clients[proxy] = client
+        return client
+    
+    def _get_headers(self) -> Dict[str, str]:
+        """
+        Pick randomized request headers
+        
+        The header sets are built once in __init__; httpx copies the dict
+        into its own Headers, so the shared one is never modified.
+        """
+        return self._rng.choice(self._header_variants)
+    
     async def _delay(self):
-        """Apply random delay between requests"""
-        delay = random.uniform(*self.request_delay)
+        """Apply random delay between requests, or wait for the rate limiter"""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+            return
+        delay = self._rng.uniform(*self.request_delay)
         await asyncio.sleep(delay)
     
-    def _extract_next_data(self, html: str) -> Dict:
-        """Extract JSON data from __NEXT_DATA__ script tag"""
+    def _extract_next_data(self, html: Union[str, bytes]) -> Dict:
+        """Extract JSON data from __NEXT_DATA__ script tag (page text or raw bytes)"""
         try:
-            selector = Selector(html)
-            script_data = selector.xpath('//script[@id="__NEXT_DATA__"]/text()').get()
+            script_data = self._find_next_data(html)
+            if script_data is None:
+                # Markup the plain scan doesn't recognise; parse the whole page.
+                # parsel (and lxml) load only here, off the import path
+                from parsel import Selector
+                
+                if isinstance(html, bytes):
+                    html = html.decode('utf-8', errors='replace')
+                selector = Selector(html)
+                script_data = selector.xpath(self.NEXT_DATA_XPATH).get()
             
             if not script_data:
                 raise ValueError("No __NEXT_DATA__ found in page")
             
-            return json.loads(script_data)
+            return _json_loads(script_data)
         except Exception as e:
             raise ValueError(f"Failed to extract NEXT_DATA: {e}")
     
+    @classmethod
+    def _find_next_data(cls, html: Union[str, bytes]) -> Optional[Union[str, bytes]]:
+        """
+        Locate the __NEXT_DATA__ script body with plain substring searches
+        
+        Much cheaper than building a DOM for a page of several hundred KB.
+        Given bytes it never decodes the page; the JSON slice goes straight
+        to the parser. Returns None when the tag isn't written the way
+        Next.js emits it.
+        """
+        if isinstance(html, bytes):
+            marker_text, close, end_tag = cls.NEXT_DATA_MARKER.encode(), b'>', b'</script>'
+        else:
+            marker_text, close, end_tag = cls.NEXT_DATA_MARKER, '>', '</script>'
+        
+        marker = html.find(marker_text)
+        if marker == -1:
+            return None
+        start = html.find(close, marker) + 1
+        end = html.find(end_tag, start) if start else -1
+        if end == -1:
+            return None
+        return html[start:end]
+    
     async def _make_request(
         self,
         url: str,
         params: Optional[Dict] = None,
-        retry_count: int = 0
+        session: Optional[str] = None,
+        refresh: bool = False
     ) -> httpx.Response:
-        """Make HTTP request with retry logic"""
-        try:
-            await self._delay()
-            
-            proxy = next(self.proxies) if self.proxies else None
-            headers = self._get_headers()
-            
-            async with httpx.AsyncClient(
-                proxies=proxy,
-                timeout=self.timeout,
-                follow_redirects=True
-            ) as client:
+        """
+        Make HTTP request with retry logic
+        
+        Requests sharing a session key (e.g. a company domain) stick to the
+        same proxy; a proxy that fails or gets blocked is rested and the
+        retry goes out through another one. An open circuit breaker raises
+        CircuitOpenError before anything is sent. With a response cache, a fresh
+        cached body is returned without touching the network unless
+        refresh is set.
+        """
+        cache_path = self._response_cache_path(url, params)
+        if not refresh:
+            cached = self._read_response_cache(cache_path, url, params)
+            if cached is not None:
+                return cached
+        
+        for attempt in range(self.max_retries + 1):
+            proxy = None
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.check()
+            try:
+                await self._delay()
+                
+                # Proxy and headers are chosen afresh each attempt, so a retry
+                # after a block doesn't repeat the blocked fingerprint
+                proxy = self.proxies.pick(session) if self.proxies else None
+                headers = self._get_headers()
+                
+                client = self._get_client(proxy)
+                start = time.monotonic()
                 response = await client.get(url, headers=headers, params=params)
                 response.raise_for_status()
+                if proxy:
+                    self.proxies.mark_ok(proxy, time.monotonic() - start)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.on_success()
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.on_success()
+                self._write_response_cache(cache_path, response.content)
                 return response
                 
-        except (httpx.HTTPError, httpx.TimeoutException) as e:
-            if retry_count < self.max_retries:
-                wait_time = 2 ** retry_count  # Exponential backoff
-                print(f"⚠️  Request failed, retrying in {wait_time}s... (attempt {retry_count + 1}/{self.max_retries})")
+            except (httpx.HTTPError, httpx.TimeoutException) as e:
+                # Connection failures and block responses count against the proxy;
+                # other HTTP errors (e.g. 404) aren't its fault
+                status = e.response.status_code if isinstance(e, httpx.HTTPStatusError) else None
+                if proxy and (status is None or status in ProxyPool.BLOCKED_STATUSES):
+                    self.proxies.mark_bad(proxy)
+                if self.rate_limiter is not None and (
+                    isinstance(e, httpx.TimeoutException) or status in self.RETRY_STATUSES
+                ):
+                    self.rate_limiter.on_throttle()
+                
+                # Client errors won't change on retry, except throttling/timeouts and
+                # a block that another proxy may get past
+                retryable = (
+                    status is None
+                    or status >= 500
+                    or status in self.RETRY_STATUSES
+                    or (proxy and status in ProxyPool.BLOCKED_STATUSES)
+                )
+                # A plain client error (e.g. 404) still shows the site is up
+                if self.circuit_breaker is not None:
+                    if retryable:
+                        self.circuit_breaker.on_failure()
+                    else:
+                        self.circuit_breaker.on_success()
+                
+                if not retryable or attempt == self.max_retries:
+                    raise
+                
+                # Full jitter: workers that failed together don't retry together
+                bound = min(self.backoff_cap, self.backoff_base * 2 ** attempt)
+                wait_time = self._rng.uniform(0, bound)
+                print(f"⚠️  Request failed, retrying in {wait_time:.1f}s... "
+                      f"(attempt {attempt + 1}/{self.max_retries})")
                 await asyncio.sleep(wait_time)
-                return await self._make_request(url, params, retry_count + 1)
-            raise
+    
+    def _response_cache_path(self, url: str, params: Optional[Dict]) -> Optional[Path]:
+        """Cache file for one GET request, or None when caching is off"""
+        if self.response_cache_dir is None:
+            return None
+        query = urlencode(sorted((params or {}).items()))
+        key = hashlib.blake2b(f"{url}?{query}".encode(), digest_size=16).hexdigest()
+        return self.response_cache_dir / f"response_{key}.bin"
+    
+    def _read_response_cache(
+        self,
+        path: Optional[Path],
+        url: str,
+        params: Optional[Dict]
+    ) -> Optional[httpx.Response]:
+        """Response rebuilt from a fresh cache file, or None on a miss"""
+        if path is None:
+            return None
+        try:
+            if time.time() - path.stat().st_mtime >= self.response_ttl:
+                return None
+            content = path.read_bytes()
+        except OSError:
+            return None
+        request = httpx.Request('GET', url, params=params)
+        return httpx.Response(200, content=content, request=request)
+    
+    def _write_response_cache(self, path: Optional[Path], content: bytes):
+        """Store a response body; a failed write only costs a refetch"""
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix('.tmp')
+            tmp.write_bytes(content)
+            tmp.replace(path)
+        except OSError as e:
+            print(f"⚠️  Could not cache response: {e}")
     
     async def search_companies(
         self,
@@ -211,7 +827,7 @@ class TrustpilotScraper:
                 print(f"🔍 Searching companies: '{query}' (page {page}/{pages})")
                 
                 response = await self._make_request(url, params)
-                data = self._extract_next_data(response.text)
+                data = self._extract_next_data(response.content)
                 
                 # Extract business units
                 page_props = data.get('props', {}).get('pageProps', {})
@@ -236,13 +852,19 @@ class TrustpilotScraper:
         Returns:
             Company data dictionary
         """
+        cached = self._cached_profile(company_domain)
+        if cached is not None:
+            print(f"✅ Company profile from cache: {cached['name']} "
+                  f"({cached['trust_score']} stars)")
+            return cached
+        
         try:
             url = f"{self.BASE_URL}/review/{company_domain}"
             
             print(f"🏢 Scraping company profile: {company_domain}")
             
-            response = await self._make_request(url)
-            data = self._extract_next_data(response.text)
+            response = await self._make_request(url, session=company_domain)
+            data = self._extract_next_data(response.content)
             
             page_props = data.get('props', {}).get('pageProps', {})
             business_unit = page_props.get('businessUnit', {})
@@ -263,22 +885,90 @@ class TrustpilotScraper:
             }
             
             print(f"✅ Company profile scraped: {company_data['name']} ({company_data['trust_score']} stars)")
-            return company_data
+            self._cache_profile(company_domain, company_data)
+            return dict(company_data)
             
         except Exception as e:
             print(f"❌ Failed to scrape company profile {company_domain}: {e}")
             raise
     
-    async def scrape_company_reviews(
+    @staticmethod
+    def _process_review(review: Dict, company_domain: str, scraped_at: str) -> Dict:
+        """Flatten one raw API review into the scraper's review record"""
+        consumer = review.get('consumer') or {}
+        dates = review.get('dates') or {}
+        reply = review.get('reply')
+        verification = (review.get('labels') or {}).get('verification') or {}
+        return {
+            'id': review.get('id'),
+            'company_domain': company_domain,
+            'rating': review.get('rating'),
+            'title': review.get('title', ''),
+            'content': review.get('text', ''),
+            'author_name': consumer.get('displayName'),
+            'author_id': consumer.get('id'),
+            'verified': verification.get('isVerified', False),
+            'review_date': dates.get('publishedDate'),
+            'experience_date': dates.get('experiencedDate'),
+            'company_reply': reply.get('message') if reply else None,
+            'helpful_count': review.get('likes', 0),
+            'scraped_at': scraped_at
+        }
+    
+    def _api_url(self, build_id: str, company_domain: str) -> str:
+        """Next.js data endpoint for a company's review pages"""
+        return f"{self.BASE_URL}/_next/data/{build_id}/review/{company_domain}.json"
+    
+    async def _get_build_id(self, company_domain: str, stale: Optional[str] = None) -> str:
+        """
+        Return the site's Next.js build ID, fetching it only when unknown
+        
+        The ID is the same for every company until Trustpilot redeploys,
+        so one page load serves the whole run.
+        
+        Args:
+            company_domain: Company whose review page is loaded if needed
+            stale: Build ID that just failed; it is replaced rather than reused
+            
+        Returns:
+            Build ID
+        """
+        if self._build_id is not None and self._build_id != stale:
+            return self._build_id
+        
+        # Created here rather than in __init__ so it binds to the running loop
+        if self._build_id_lock is None:
+            self._build_id_lock = asyncio.Lock()
+        
+        async with self._build_id_lock:
+            # Another company may have fetched it while we waited
+            if self._build_id is None or self._build_id == stale:
+                main_url = f"{self.BASE_URL}/review/{company_domain}"
+                # A stale ID may have come from a cached page, so reload it
+                response = await self._make_request(
+                    main_url, session=company_domain, refresh=stale is not None
+                )
+                build_id = self._extract_next_data(response.content).get('buildId')
+                
+                if not build_id:
+                    raise ValueError("Could not extract build ID")
+                self._build_id = build_id
+        
+        return self._build_id
+    
+    async def iter_company_reviews(
         self,
         company_domain: str,
         max_pages: Optional[int] = None,
         sort: str = 'recency',
         stars: Optional[str] = None,
         verified_only: bool = False
-    ) -> List[Dict]:
+    ) -> AsyncIterator[Dict]:
         """
-        Scrape all reviews for a company using the private API
+        Yield a company's reviews page by page as they are scraped
+        
+        Nothing is retained between pages, so memory use doesn't grow with
+        max_pages.
         
         Args:
             company_domain: Company domain (e.g., 'amazon.com')
@@ -287,94 +977,172 @@ class TrustpilotScraper:
             stars: Filter by stars (e.g., '1', '5')
             verified_only: Only return verified reviews
             
-        Returns:
-            List of review dictionaries
+        Yields:
+            Review dictionaries
         """
-        all_reviews = []
+        total_reviews = 0
         
         try:
-            # First, get the build ID from the main page
-            main_url = f"{self.BASE_URL}/review/{company_domain}"
-            response = await self._make_request(main_url)
-            data = self._extract_next_data(response.text)
-            build_id = data.get('buildId')
-            
-            if not build_id:
-                raise ValueError("Could not extract build ID")
+            # The site's build ID, fetched once per scraper rather than per company
+            build_id = await self._get_build_id(company_domain)
             
-            # Construct API endpoint
-            api_url = f"{self.BASE_URL}/_next/data/{build_id}/review/{company_domain}.json"
+            # Filter parameters are the same on every page; only 'page' changes
+            filters = {'businessUnit': company_domain, 'sort': sort}
+            if stars:
+                filters['stars'] = stars
+            if verified_only:
+                filters['verified'] = 'true'
+            filters = MappingProxyType(filters)
             
             page = 1
             total_pages = None
+            last_page = None
             
-            while True:
+            async def fetch_page(page: int) -> Dict:
+                nonlocal build_id
+                params = {**filters, 'page': page}
+                print(f"📝 Scraping reviews for {company_domain} (page {page}" +
+                      (f"/{total_pages}" if total_pages else "") + ")")
+                api_url = self._api_url(build_id, company_domain)
                 try:
-                    # Build parameters
-                    params = {
-                        'businessUnit': company_domain,
-                        'page': page,
-                        'sort': sort
-                    }
-                    
-                    if stars:
-                        params['stars'] = stars
-                    
-                    if verified_only:
-                        params['verified'] = 'true'
-                    
-                    print(f"📝 Scraping reviews for {company_domain} (page {page}" +
-                          (f"/{total_pages}" if total_pages else "") + ")")
-                    
-                    response = await self._make_request(api_url, params)
-                    review_data = response.json()
-                    
-                    page_props = review_data.get('pageProps', {})
-                    reviews = page_props.get('reviews', [])
-                    
-                    # Process reviews
-                    for review in reviews:
-                        processed_review = {
-                            'id': review.get('id'),
-                            'company_domain': company_domain,
-                            'rating': review.get('rating'),
-                            'title': review.get('title', ''),
-                            'content': review.get('text', ''),
-                            'author_name': review.get('consumer', {}).get('displayName'),
-                            'author_id': review.get('consumer', {}).get('id'),
-                            'verified': review.get('labels', {}).get('verification', {}).get('isVerified', False),
-                            'review_date': review.get('dates', {}).get('publishedDate'),
-                            'experience_date': review.get('dates', {}).get('experiencedDate'),
-                            'company_reply': review.get('reply', {}).get('message') if review.get('reply') else None,
-                            'helpful_count': review.get('likes', 0),
-                            'scraped_at': datetime.now().isoformat()
-                        }
-                        all_reviews.append(processed_review)
-                    
-                    print(f"✅ Scraped {len(reviews)} reviews (total: {len(all_reviews)})")
-                    
-                    # Check pagination
-                    if not total_pages:
-                        pagination = page_props.get('filters', {}).get('pagination', {})
-                        total_pages = pagination.get('totalPages', 1)
-                    
-                    # Check if we should continue
-                    if page >= total_pages or (max_pages and page >= max_pages):
+                    response = await self._make_request(api_url, params, session=company_domain)
+                except httpx.HTTPStatusError as e:
+                    # A new deploy retires the old build ID; look up the current one once
+                    stale = build_id
+                    if e.response.status_code != 404:
+                        raise
+                    build_id = await self._get_build_id(company_domain, stale=stale)
+                    if build_id == stale:
+                        raise
+                    api_url = self._api_url(build_id, company_domain)
+                    response = await self._make_request(api_url, params, session=company_domain)
+                # httpx's .json() goes through the stdlib parser; use ours
+                return _json_loads(response.content).get('pageProps', {})
+            
+            # Once page 1 gives the page count, the next few pages are fetched
+            # while the current one is being consumed; pages still yield in order
+            prefetched: Dict[int, asyncio.Future] = {}
+            try:
+                while True:
+                    try:
+                        task = prefetched.pop(page, None)
+                        page_props = await task if task else await fetch_page(page)
+                        reviews = page_props.get('reviews', [])
+                        
+                        # Process reviews (one timestamp per page, not per review)
+                        scraped_at = datetime.now().isoformat()
+                        for review in reviews:
+                            total_reviews += 1
+                            yield self._process_review(review, company_domain, scraped_at)
+                        
+                        print(f"✅ Scraped {len(reviews)} reviews (total: {total_reviews})")
+                        
+                        # Page count comes from page 1 only; later pages skip the lookup
+                        if last_page is None:
+                            pagination = page_props.get('filters', {}).get('pagination', {})
+                            total_pages = pagination.get('totalPages', 1)
+                            last_page = min(total_pages, max_pages) if max_pages else total_pages
+                        
+                        # Check if we should continue
+                        if page >= last_page:
+                            break
+                        
+                        for ahead in range(page + 1, min(page + self.PAGE_PREFETCH, last_page) + 1):
+                            if ahead not in prefetched:
+                                prefetched[ahead] = asyncio.ensure_future(fetch_page(ahead))
+                        
+                        page += 1
+                        
+                    except Exception as e:
+                        print(f"❌ Error scraping page {page}: {e}")
                         break
-                    
-                    page += 1
-                    
-                except Exception as e:
-                    print(f"❌ Error scraping page {page}: {e}")
-                    break
+            finally:
+                # Don't leave pages downloading after an error or an early stop
+                for task in prefetched.values():
+                    task.cancel()
+                await asyncio.gather(*prefetched.values(), return_exceptions=True)
             
-            print(f"🎉 Completed scraping: {len(all_reviews)} total reviews")
-            return all_reviews
+            print(f"🎉 Completed scraping: {total_reviews} total reviews")
             
         except Exception as e:
             print(f"❌ Failed to scrape reviews for {company_domain}: {e}")
             raise
     
+    async def scrape_company_reviews(
+        self,
+        company_domain: str,
+        max_pages: Optional[int] = None,
+        sort: str = 'recency',
+        stars: Optional[str] = None,
+        verified_only: bool = False
+    ) -> List[Dict]:
+        """
+        Scrape all reviews for a company using the private API
+        
+        Args:
+            company_domain: Company domain (e.g., 'amazon.com')
+            max_pages: Maximum pages to scrape (None for all)
+            sort: Sort order ('recency', 'highest_rated', 'lowest_rated')
+            stars: Filter by stars (e.g., '1', '5')
+            verified_only: Only return verified reviews
+            
+        Returns:
+            List of review dictionaries
+        """
+        return [
+            review async for review in self.iter_company_reviews(
+                company_domain,
+                max_pages=max_pages,
+                sort=sort,
+                stars=stars,
+                verified_only=verified_only
+            )
+        ]
+    
+    async def scrape_company_reviews_arrow(
+        self,
+        company_domain: str,
+        max_pages: Optional[int] = None,
+        sort: str = 'recency',
+        stars: Optional[str] = None,
+        verified_only: bool = False
+    ) -> "pa.RecordBatch":
+        """
+        Scrape a company's reviews into a columnar Arrow record batch
+        
+        Columns are filled as pages arrive, so no per-review dicts are kept.
+        Needs pyarrow (the arrow extra).
+        
+        Args:
+            company_domain: Company domain (e.g., 'amazon.com')
+            max_pages: Maximum pages to scrape (None for all)
+            sort: Sort order ('recency', 'highest_rated', 'lowest_rated')
+            stars: Filter by stars (e.g., '1', '5')
+            verified_only: Only return verified reviews
+            
+        Returns:
+            pyarrow.RecordBatch with one row per review
+        """
+        if pa is None:
+            raise ImportError(
+                "scrape_company_reviews_arrow needs pyarrow "
+                "(pip install 'trustpilot-scraper[arrow]')"
+            )
+        
+        schema = _review_schema()
+        columns = {name: [] for name in schema.names}
+        async for review in self.iter_company_reviews(
+            company_domain,
+            max_pages=max_pages,
+            sort=sort,
+            stars=stars,
+            verified_only=verified_only
+        ):
+            for name, column in columns.items():
+                column.append(review[name])
+        
+        return pa.RecordBatch.from_pydict(columns, schema=schema)
+    
     async def scrape_category(
         self,
         category: str,
@@ -396,20 +1164,27 @@ class TrustpilotScraper:
         
         for page in range(1, pages + 1):
             try:
-                url = f"{self.BASE_URL}/categories/{category}"
-                params = {
-                    'page': page,
-                    'numberofreviews': min_reviews,
-                    'status': 'all'
-                }
+                cache_path = self._category_cache_path(category, page, min_reviews)
+                companies = self._read_category_cache(cache_path)
                 
-                print(f"📂 Scraping category '{category}' (page {page}/{pages})")
-                
-                response = await self._make_request(url, params)
-                data = self._extract_next_data(response.text)
-                
-                page_props = data.get('props', {}).get('pageProps', {})
-                companies = page_props.get('businessUnits', [])
+                if companies is not None:
+                    print(f"📂 Category '{category}' page {page}/{pages} from cache")
+                else:
+                    url = f"{self.BASE_URL}/categories/{category}"
+                    params = {
+                        'page': page,
+                        'numberofreviews': min_reviews,
+                        'status': 'all'
+                    }
+                    
+                    print(f"📂 Scraping category '{category}' (page {page}/{pages})")
+                    
+                    response = await self._make_request(url, params)
+                    data = self._extract_next_data(response.content)
+                    
+                    page_props = data.get('props', {}).get('pageProps', {})
+                    companies = page_props.get('businessUnits', [])
+                    self._write_category_cache(cache_path, companies)
                 
                 results.extend(companies)
                 print(f"✅ Found {len(companies)} companies on page {page}")
@@ -420,25 +1195,58 @@ class TrustpilotScraper:
         print(f"📊 Total companies in category: {len(results)}")
         return results
     
-    async def scrape_multiple_companies(
+    def _category_cache_path(self, category: str, page: int, min_reviews: int) -> Optional[Path]:
+        """Cache file for one category page, or None when caching is off"""
+        if self.category_cache_dir is None:
+            return None
+        raw_key = f"{category}|{page}|{min_reviews}".encode()
+        key = hashlib.blake2b(raw_key, digest_size=16).hexdigest()
+        return self.category_cache_dir / f"category_{key}.json"
+    
+    def _read_category_cache(self, path: Optional[Path]) -> Optional[List[Dict]]:
+        """Companies from a fresh cache file, or None on a miss"""
+        if path is None:
+            return None
+        try:
+            if time.time() - path.stat().st_mtime >= self.category_ttl:
+                return None
+            with open(path, 'rb') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _write_category_cache(self, path: Optional[Path], companies: List[Dict]):
+        """Store a scraped category page; a failed write only costs a refetch"""
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix('.tmp')
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(companies, f, ensure_ascii=False)
+            tmp.replace(path)
+        except OSError as e:
+            print(f"⚠️  Could not cache category page: {e}")
+    
+    async def iter_company_results(
         self,
         company_domains: List[str],
-        max_pages_per_company: int = 10,
-        output_file: Optional[str] = None
-    ) -> Dict[str, List[Dict]]:
+        max_pages_per_company: int = 10
+    ) -> AsyncIterator[Tuple[str, List[Dict]]]:
         """
-        Scrape multiple companies concurrently
+        Scrape multiple companies concurrently, yielding each as it finishes
+        
+        At most max_workers companies are scraped at once. A company that
+        fails is yielded with an empty review list.
         
         Args:
             company_domains: List of company domains
             max_pages_per_company: Max pages to scrape per company
-            output_file: Optional JSONL output file path
             
-        Returns:
-            Dictionary mapping company domains to review lists
+        Yields:
+            (company domain, review list) tuples in completion order
         """
         semaphore = asyncio.Semaphore(self.max_workers)
-        results = {}
         
         async def scrape_with_limit(domain: str):
             async with semaphore:
@@ -448,21 +1256,25 @@ class TrustpilotScraper:
                         domain,
                         max_pages=max_pages_per_company
                     )
-                    results[domain] = reviews
-                    
-                    # Write to file if specified
-                    if output_file:
-                        await self._write_reviews_to_file(domain, reviews, output_file)
-                    
                 except Exception as e:
                     print(f"❌ Failed to scrape {domain}: {e}")
-                    results[domain] = []
+                    reviews = []
+                return domain, reviews
         
-        # Execute all scraping tasks
-        tasks = [scrape_with_limit(domain) for domain in company_domains]
-        await asyncio.gather(*tasks)
+        tasks = [asyncio.ensure_future(scrape_with_limit(domain)) for domain in company_domains]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Don't leave companies running if the caller stops early
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
         
-        # Print summary
+        self._print_summary()
+    
+    def _print_summary(self):
+        """Print the monitor's statistics for a batch scrape"""
         stats = self.monitor.get_stats()
         print("\n" + "=" * 50)
         print("📊 SCRAPING SUMMARY")
@@ -472,31 +1284,63 @@ class TrustpilotScraper:
         print(f"Total Reviews: {stats.get('total_reviews', 0)}")
         print(f"Total Requests: {stats.get('total_requests', 0)}")
         print("=" * 50)
-        
-        return results
     
-    async def _write_reviews_to_file(
+    async def scrape_multiple_companies(
         self,
-        company_domain: str,
-        reviews: List[Dict],
-        filename: str
-    ):
-        """Write reviews to JSONL file"""
-        import aiofiles
+        company_domains: List[str],
+        max_pages_per_company: int = 10,
+        output_file: Optional[str] = None
+    ) -> Dict[str, List[Dict]]:
+        """
+        Scrape multiple companies concurrently
         
-        async with aiofiles.open(filename, 'a', encoding='utf-8') as f:
-            for review in reviews:
-                await f.write(json.dumps(review, ensure_ascii=False) + '\n')
+        Args:
+            company_domains: List of company domains
+            max_pages_per_company: Max pages to scrape per company
+            output_file: Optional JSONL output file path
+            
+        Returns:
+            Dictionary mapping company domains to review lists
+        """
+        results = {}
+        
+        # One handle for the whole run instead of reopening per company
+        f = None
+        if output_file:
+            import aiofiles
+            f = await aiofiles.open(output_file, 'ab')
+        
+        try:
+            async for domain, reviews in self.iter_company_results(
+                company_domains,
+                max_pages_per_company=max_pages_per_company
+            ):
+                results[domain] = reviews
+                
+                # Write to file if specified
+                if f is not None:
+                    await self._write_reviews(f, reviews)
+        finally:
+            if f is not None:
+                await f.close()
+        
+        return results
+    
+    @staticmethod
+    async def _write_reviews(f, reviews: List[Dict]):
+        """Append a company's reviews to an open JSONL file in one write"""
+        if reviews:
+            await f.write(b''.join(_json_line(review) for review in reviews))
 
 
 # Convenience functions for quick access
 async def scrape_company(domain: str, max_pages: int = 10) -> List[Dict]:
     """Quick function to scrape a single company"""
-    scraper = TrustpilotScraper()
-    return await scraper.scrape_company_reviews(domain, max_pages=max_pages)
+    async with TrustpilotScraper() as scraper:
+        return await scraper.scrape_company_reviews(domain, max_pages=max_pages)
 
 
 async def search_companies(query: str, pages: int = 1) -> List[Dict]:
     """Quick function to search companies"""
-    scraper = TrustpilotScraper()
-    return await scraper.search_companies(query, pages=pages)
+    async with TrustpilotScraper() as scraper:
+        return await scraper.search_companies(query, pages=pages)